@@ -1,9 +1,32 @@
-from flask import Flask, request, render_template
-import pandas as pd
 import time
-from memory_profiler import memory_usage
+INICIO_IMPORTACION = time.perf_counter() # Para medir cuánto tarda en cargarse la aplicación (GET /arranque)
+from flask import Flask, Response, request, render_template, jsonify, g, stream_with_context
+import os
+import sys
+import zlib
+import json
+import codecs
+import uuid
+import fcntl
+import struct
+import marshal
+import tempfile
+import threading
+import atexit
+import weakref
+import inspect
+import random
+import math
+import tracemalloc
+from persistencia import RegistroOperaciones
 from functools import wraps
-import heapq
+from bisect import bisect_left
+from contextlib import contextmanager
+from multiprocessing import shared_memory, resource_tracker
+from html import escape
+from collections import Counter, OrderedDict, deque
+from itertools import count, islice
+from array import array
 
 app = Flask(__name__) # Inicializa la aplicación Flask
 
@@ -12,35 +35,909 @@ app = Flask(__name__) # Inicializa la aplicación Flask
 def index():
     return render_template('index.html') # Renderiza la plantilla index.html
 
+# Modos de medición del decorador benchmark:
+#   'estructura'  -> cuánto cambió memoria_bytes() de la estructura con la llamada (reportado en MB)
+#   'rss'         -> diferencia de memoria del proceso con memory_profiler (modo original, el más costoso)
+#   'tiempo'      -> solo mide el tiempo, la memoria se reporta como 0.0
+#   'tracemalloc' -> bytes realmente reservados por la llamada según tracemalloc (reportados en MB)
+#   'muestreo'    -> mide RSS en 1 de cada MUESTREO_CADA llamadas, el resto solo mide tiempo
+MODOS_MEDICION = ('estructura', 'rss', 'tiempo', 'tracemalloc', 'muestreo')
+MODO_MEDICION = os.environ.get('EDL_MEDICION', 'estructura') # Modo por defecto para todo el proceso
+MUESTREO_CADA = int(os.environ.get('EDL_MUESTREO', '100')) # Frecuencia del modo muestreo
+if MODO_MEDICION not in MODOS_MEDICION:
+    raise ValueError(f"EDL_MEDICION debe ser uno de {MODOS_MEDICION}, no '{MODO_MEDICION}'")
+if MUESTREO_CADA < 1:
+    raise ValueError(f"EDL_MUESTREO debe ser un entero mayor o igual que 1, no {MUESTREO_CADA}")
+
+def configurar_medicion(modo, estructura=None):
+    # Cambia el modo de medición de todo el proceso o, si se pasa una estructura, solo el de esa instancia
+    if modo is not None and modo not in MODOS_MEDICION:
+        raise ValueError(f"Modo de medición desconocido: '{modo}'")
+    if estructura is not None:
+        estructura.modo_medicion = modo # None hace que la estructura vuelva a usar el modo del proceso
+    else:
+        global MODO_MEDICION
+        MODO_MEDICION = modo or 'estructura'
+
+def _medir_tiempo(func, args, kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start, 0.0
+
+memory_usage = None # memory_profiler (con psutil e IPython) se importa en la primera medición rss
+
+def _medir_rss(func, args, kwargs):
+    global memory_usage
+    if memory_usage is None:
+        from memory_profiler import memory_usage
+    mem_before = memory_usage()[0] # Mide la memoria usada antes de ejecutar la función.
+    start = time.perf_counter() # Guarda el tiempo de inicio de la ejecución
+    result = func(*args, **kwargs) # Llama a la función original con los argumentos dados.
+    end = time.perf_counter() # Guarda el tiempo de finalización de la ejecución
+    mem_after = memory_usage()[0] # Mide la memoria usada después de ejecutar la función.
+    return result, end - start, mem_after - mem_before
+
+def _medir_tracemalloc(func, args, kwargs):
+    if not tracemalloc.is_tracing():
+        tracemalloc.start() # Se activa en la primera llamada para no penalizar a los demás modos
+    mem_before = tracemalloc.get_traced_memory()[0] # Bytes reservados antes de la llamada
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    end = time.perf_counter()
+    mem_after = tracemalloc.get_traced_memory()[0]
+    return result, end - start, (mem_after - mem_before) / (1024 * 1024) # Se reporta en MB como el modo rss
+
+def _medir_estructura(func, args, kwargs):
+    # memoria_bytes() es O(1), así que medir cuesta lo mismo que el modo tiempo
+    memoria_bytes = getattr(args[0], 'memoria_bytes', None) if args else None
+    if memoria_bytes is None:
+        return _medir_tiempo(func, args, kwargs)
+    mem_before = memoria_bytes()
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    end = time.perf_counter()
+    return result, end - start, (memoria_bytes() - mem_before) / (1024 * 1024)
+
+MEDIDORES = {
+    'estructura': _medir_estructura,
+    'rss': _medir_rss,
+    'tiempo': _medir_tiempo,
+    'tracemalloc': _medir_tracemalloc,
+}
+
+#-------------------------------Métricas---------------------------------
+
+# Histogramas de latencia por (clase, operación) con cubetas fijas, alimentados por benchmark y expuestos
+# en /metrics. Cada hilo acumula en su propio diccionario, así registrar una medición no toma ningún
+# cerrojo; /metrics suma los de todos los hilos y, cuando un hilo termina, sus cuentas pasan a `retiradas`.
+METRICAS = os.environ.get('EDL_METRICAS', '1') == '1'
+LIMITES_LATENCIA = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3,
+                    1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0, 2.5) # Segundos; después queda la cubeta +Inf
+cerrojo_metricas = threading.Lock() # Solo para altas y bajas de hilos, la lectura y los contadores raros
+histogramas_hilos = {} # id del diccionario de un hilo vivo -> ese diccionario
+retiradas = {} # Cuentas de los hilos que ya terminaron
+rechazos = {} # (clase, motivo) -> encolados rechazados por una cola circular
+
+class _FinHilo:
+    __slots__ = ('__weakref__',) # Desaparece con los datos locales del hilo y dispara _retirar
+
+def _retirar(histogramas):
+    with cerrojo_metricas:
+        del histogramas_hilos[id(histogramas)]
+        for clave, cuentas in histogramas.items():
+            total = retiradas.setdefault(clave, [0] * len(cuentas))
+            for i, valor in enumerate(cuentas):
+                total[i] += valor
+
+class _MetricasHilo(threading.local):
+    def __init__(self):
+        self.histogramas = {} # (clase, operación) -> [cuenta de cada cubeta..., suma de segundos]; la clase es el tipo, no su nombre
+        self.fin = _FinHilo()
+        with cerrojo_metricas:
+            histogramas_hilos[id(self.histogramas)] = self.histogramas
+        weakref.finalize(self.fin, _retirar, self.histogramas)
+
+metricas_hilo = _MetricasHilo()
+
+def registrar_metrica(clase, operacion, segundos):
+    histogramas = metricas_hilo.histogramas
+    cuentas = histogramas.get((clase, operacion))
+    if cuentas is None:
+        cuentas = histogramas[(clase, operacion)] = [0] * (len(LIMITES_LATENCIA) + 1) + [0.0]
+    cuentas[bisect_left(LIMITES_LATENCIA, segundos)] += 1
+    cuentas[-1] += segundos
+
+def contar_rechazo(clase, motivo):
+    with cerrojo_metricas:
+        rechazos[(clase, motivo)] = rechazos.get((clase, motivo), 0) + 1
+
+def histogramas_totales():
+    # Suma las cuentas de todos los hilos. Copiar un diccionario es atómico; una medición que llegue
+    # durante la suma aparece en la próxima lectura.
+    with cerrojo_metricas:
+        fuentes = [{clave: list(cuentas) for clave, cuentas in retiradas.items()}]
+        fuentes.extend(histogramas.copy() for histogramas in histogramas_hilos.values())
+    totales = {}
+    for fuente in fuentes:
+        for clave, cuentas in fuente.items():
+            total = totales.get(clave)
+            if total is None:
+                totales[clave] = list(cuentas)
+            else:
+                for i, valor in enumerate(cuentas):
+                    total[i] += valor
+    return totales
+
 def benchmark(func):
+    llamadas = [0] # Contador de llamadas para el modo muestreo
+    operacion = func.__name__
     @wraps(func) # Decorador para mantener la firma original de la función
     def wrapper(*args, **kwargs): # Define una función interna que acepta cualquier número de argumentos y palabras clave.
-        mem_before = memory_usage()[0] # Mide la memoria usada antes de ejecutar la función.
-        start = time.perf_counter() # Guarda el tiempo de inicio de la ejecución
-        result = func(*args, **kwargs) # Llama a la función original con los argumentos dados.
-        end = time.perf_counter() # Guarda el tiempo de finalización de la ejecución
-        mem_after = memory_usage()[0] # Mide la memoria usada después de ejecutar la función.
-        tiempo = end - start # Calcula el tiempo total de ejecución
-        memoria = mem_after - mem_before # Calcula la diferencia de memoria
-        return result, tiempo, memoria # Retorna el resultado de la función original, tiempo y la diferencia de memoria
+        modo = getattr(args[0], 'modo_medicion', None) if args else None # Modo propio de la estructura, si lo tiene
+        modo = modo or MODO_MEDICION
+        if modo == 'muestreo':
+            llamadas[0] += 1
+            modo = 'rss' if (llamadas[0] - 1) % MUESTREO_CADA == 0 else 'tiempo'
+        medicion = MEDIDORES[modo](func, args, kwargs) # Resultado de la función original, tiempo y la diferencia de memoria
+        if METRICAS:
+            registrar_metrica(type(args[0]), operacion, medicion[1])
+        return medicion
+    wrapper.sin_medir = func # Acceso a la función sin medición para quien mide por su cuenta (API, lotes)
     return wrapper # Devuelve la función decorada (el wrapper).
 
+#-------------------------------Concurrencia---------------------------------
+
+class _LecturasHilo(threading.local):
+    # Lecturas anidadas del hilo: positivas si está anotado como lector, negativas si es el escritor
+    # leyendo lo que modifica. El valor por defecto de clase evita el AttributeError en cada toma.
+    lecturas = 0
+
+class CerrojoLectorEscritor:
+    # Varias lecturas a la vez o una sola escritura. Es reentrante: el hilo que escribe puede volver a
+    # leer o escribir (una operación que llama a otra) y el que ya lee no vuelve a esperar (tabla -> página).
+    #
+    # Sin competencia la lectura no toma ningún cerrojo: el lector se anota en `lectores` (append y pop
+    # de una lista son atómicos) y luego mira si hay escritor; el escritor primero se anuncia en
+    # `escritor` y luego mira si quedan lectores. Así uno de los dos siempre ve al otro. Un escritor
+    # anunciado hace que los lectores nuevos se retiren y esperen, lo que le da preferencia.
+    def __init__(self):
+        self.mutex = threading.Lock() # Un escritor a la vez
+        self.espera = threading.Condition(threading.Lock()) # Solo para dormir cuando hay que esperar
+        self.lectores = [] # Un elemento por lector activo
+        self.escritor = None # Identificador del hilo que escribe o espera para escribir
+        self.reentradas = 0 # Tomas anidadas del escritor
+        self.esperando = 0 # Hilos dormidos en `espera`
+        self.local = _LecturasHilo() # Lecturas anidadas de cada hilo
+
+    def _dormir_mientras(self, condicion):
+        # Requiere `espera` tomada
+        self.esperando += 1
+        while condicion():
+            self.espera.wait()
+        self.esperando -= 1
+
+    def adquirir_lectura(self):
+        local = self.local
+        lecturas = local.lecturas
+        if lecturas:
+            local.lecturas = lecturas + 1 if lecturas > 0 else lecturas - 1
+            return
+        if self.escritor == threading.get_ident():
+            local.lecturas = -1 # El escritor lee lo que está modificando sin anotarse
+            return
+        lectores = self.lectores
+        lectores.append(None)
+        while self.escritor is not None:
+            # Hay un escritor escribiendo o esperando: se retira, lo despierta por si esperaba a este
+            # lector y duerme hasta que termine
+            lectores.pop()
+            with self.espera:
+                self.espera.notify_all()
+                self._dormir_mientras(lambda: self.escritor is not None)
+            lectores.append(None)
+        local.lecturas = 1
+
+    def soltar_lectura(self):
+        local = self.local
+        lecturas = local.lecturas
+        if lecturas < 0:
+            local.lecturas = lecturas + 1
+            return
+        local.lecturas = lecturas - 1
+        if lecturas == 1:
+            self.lectores.pop()
+            if self.escritor is not None and not self.lectores:
+                with self.espera:
+                    self.espera.notify_all() # Era el último lector que el escritor esperaba
+
+    def adquirir_escritura(self):
+        yo = threading.get_ident()
+        if self.escritor == yo:
+            self.reentradas += 1
+            return
+        if self.local.lecturas:
+            raise RuntimeError('No se puede escribir en una estructura mientras el mismo hilo la está leyendo')
+        self.mutex.acquire()
+        self.escritor = yo
+        if self.lectores:
+            with self.espera:
+                self._dormir_mientras(lambda: self.lectores)
+
+    def soltar_escritura(self):
+        if self.reentradas:
+            self.reentradas -= 1
+            return
+        self.escritor = None
+        self.mutex.release()
+        if self.esperando:
+            with self.espera:
+                self.espera.notify_all()
+
+def lectura(func):
+    # Métodos que solo leen la estructura: pueden correr en paralelo entre sí
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        cerrojo = self.cerrojo
+        cerrojo.adquirir_lectura()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            cerrojo.soltar_lectura()
+    return wrapper
+
+def escritura(func):
+    # Métodos que modifican la estructura sin anotarse en el registro (restaurar_estado)
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        cerrojo = self.cerrojo
+        cerrojo.adquirir_escritura()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            cerrojo.soltar_escritura()
+    return wrapper
+
+registro = None # RegistroOperaciones activo si EDL_DURABLE indica un directorio
+
+def registrada(func):
+    # Marca cada llamada que modifica una estructura: corre con el cerrojo de escritura de la instancia
+    # y, si la estructura se persiste, se anota en el registro de operaciones.
+    # Va debajo de @benchmark para que la API, que llama a la función sin medir, también quede registrada.
+    operacion = func.__name__
+    @wraps(func)
+    def wrapper(self, *args):
+        nombre = getattr(self, 'nombre_registro', None)
+        if registro is None or nombre is None:
+            cerrojo = self.cerrojo # Camino habitual: el cerrojo en línea, sin otra llamada intermedia
+            cerrojo.adquirir_escritura()
+            try:
+                return func(self, *args)
+            finally:
+                cerrojo.soltar_escritura()
+        predicado = bool(args) and callable(args[0])
+        # Los lotes pueden llegar como iteradores: se materializan para poder guardarlos
+        if not predicado:
+            args = tuple(a if isinstance(a, (str, int, float, bool, list, tuple, type(None))) else list(a) for a in args)
+        cerrojo = self.cerrojo
+        cerrojo.adquirir_escritura()
+        try:
+            resultado = func(self, *args)
+            if predicado:
+                # Una función no se puede guardar: eliminar_varios con predicado se anota como la
+                # eliminación de todas las apariciones de los valores que quitó, que deja lo mismo
+                args = (list(resultado), 'todas')
+            # Se anota sin soltar el cerrojo de la estructura: así la copia para la instantánea y su
+            # lsn_registro corresponden exactamente a las mismas operaciones
+            self.lsn_registro = lsn = registro.anotar(nombre, operacion, args)
+        finally:
+            cerrojo.soltar_escritura()
+        if registro.sincrono:
+            registro.esperar(lsn) # Fuera del cerrojo para que varias peticiones compartan el mismo fsync
+        registro.revisar(lsn)
+        return resultado
+    return wrapper
+
+#-------------------------------Tablas HTML---------------------------------
+
+def tabla_html(filas, columnas=('Valor',)):
+    # Produce la misma tabla que pandas.DataFrame.to_html(index=False) sin construir un DataFrame
+    partes = ['<table border="1" class="dataframe">\n  <thead>\n    <tr style="text-align: right;">\n']
+    partes.extend(f'      <th>{columna}</th>\n' for columna in columnas)
+    partes.append('    </tr>\n  </thead>\n  <tbody>\n')
+    if len(columnas) == 1:
+        partes.extend(f'    <tr>\n      <td>{escape(str(valor), quote=False)}</td>\n    </tr>\n' for valor in filas)
+    else:
+        for fila in filas:
+            partes.append('    <tr>\n')
+            partes.extend(f'      <td>{escape(str(valor), quote=False)}</td>\n' for valor in fila)
+            partes.append('    </tr>\n')
+    partes.append('  </tbody>\n</table>')
+    return ''.join(partes)
+
+TAMAÑO_PAGINA = 100 # Elementos por página si la URL no indica size
+TAMAÑO_PAGINA_MAXIMO = 5000
+SALTO_INDICE = 64 # Las estructuras enlazadas guardan uno de cada SALTO_INDICE nodos para llegar rápido a una página
+
+contador_cursores = count(1)
+cerrojo_tablas = threading.Lock() # Protege las tablas cacheadas y los índices de saltos, compartidos entre peticiones
+
+class PaginacionEnlazada:
+    # Paginación para las estructuras enlazadas. Cada clase indica cómo empezar (_primero), avanzar
+    # (_siguiente) y leer un nodo (_dato). El índice disperso de saltos se descarta al cambiar la
+    # versión y se vuelve a llenar solo hasta la página que se pida, no hasta el final de la estructura.
+    indice_saltos = None
+
+    def _salto(self, k):
+        # Nodo en la posición k * SALTO_INDICE; alarga el índice desde el último salto conocido
+        with cerrojo_tablas: # Varios lectores pueden alargar el mismo índice a la vez
+            if self.indice_saltos is None or self.indice_saltos[0] != self.version:
+                self.indice_saltos = (self.version, [self._primero()])
+            nodos = self.indice_saltos[1]
+            actual = nodos[-1]
+            while len(nodos) <= k:
+                for _ in range(SALTO_INDICE):
+                    actual = self._siguiente(actual)
+                nodos.append(actual)
+            return nodos[k]
+
+    def _nodo_en(self, posicion):
+        if posicion < SALTO_INDICE:
+            actual, pasos = self._primero(), posicion
+        else:
+            actual, pasos = self._salto(posicion // SALTO_INDICE), posicion % SALTO_INDICE
+        for _ in range(pasos):
+            actual = self._siguiente(actual)
+        return actual
+
+    @lectura
+    def pagina(self, inicio, cantidad, desde=None):
+        # Retorna los datos de la página y el nodo donde empieza la siguiente (None si no hay más)
+        fin = min(inicio + cantidad, self.tamaño)
+        if inicio >= fin:
+            return [], None
+        actual = self._nodo_en(inicio) if desde is None else desde
+        datos = []
+        for _ in range(fin - inicio):
+            datos.append(self._dato(actual))
+            actual = self._siguiente(actual)
+        return datos, (actual if fin < self.tamaño else None)
+
+def _entero_positivo(texto, por_defecto):
+    try:
+        return max(1, int(texto))
+    except (TypeError, ValueError):
+        return por_defecto
+
+def tabla_paginada(estructura, columnas=('Valor',)):
+    # Tabla HTML de la página pedida en la URL (?page=&size=&cursor=) más la navegación entre páginas.
+    # La tabla se guarda junto a la versión de la estructura: las operaciones de solo lectura (peek,
+    # buscar, ver la página) la reutilizan sin recorrer la estructura de nuevo. Los cursores (el nodo
+    # donde sigue la página siguiente) van en la misma caché, así mueren con la versión o con la
+    # estructura (por ejemplo al desalojar una sesión) y no la mantienen viva desde fuera.
+    # Todo se hace con la lectura de la estructura tomada para que versión, total y página coincidan.
+    estructura.cerrojo.adquirir_lectura()
+    try:
+        return _tabla_paginada(estructura, columnas)
+    finally:
+        estructura.cerrojo.soltar_lectura()
+
+def _tabla_paginada(estructura, columnas):
+    tamaño = min(_entero_positivo(request.args.get('size'), TAMAÑO_PAGINA), TAMAÑO_PAGINA_MAXIMO)
+    pagina = _entero_positivo(request.args.get('page'), 1)
+    paginas = max(1, -(-estructura.tamaño // tamaño))
+    pagina = min(pagina, paginas)
+    inicio = (pagina - 1) * tamaño
+
+    with cerrojo_tablas:
+        cache = getattr(estructura, 'tabla_cache', None)
+        if cache is None or cache[0] != estructura.version:
+            cache = estructura.tabla_cache = (estructura.version, {})
+        html = cache[1].get((inicio, tamaño))
+        guardado = cache[1].get(('nodo', request.args.get('cursor')))
+    if html is None:
+        desde = None
+        if guardado and guardado[0] == inicio:
+            desde = guardado[1] # Continúa desde el nodo guardado sin volver a recorrer
+        datos, siguiente = estructura.pagina(inicio, tamaño, desde)
+        html = tabla_html(datos, columnas)
+        with cerrojo_tablas:
+            if len(cache[1]) >= 24: # Tabla, cursor y nodo de unas 8 páginas
+                cache[1].clear()
+            cache[1][(inicio, tamaño)] = html
+            if siguiente is not None:
+                token = str(next(contador_cursores))
+                cache[1][('nodo', token)] = (inicio + tamaño, siguiente)
+                cache[1][('cursor', inicio, tamaño)] = token
+
+    if paginas == 1:
+        return html
+    vista = '/' + request.path.strip('/').split('/')[0] # Las rutas POST enlazan a la vista GET de la estructura
+    return html + render_template('paginacion.html',
+                                  vista=vista,
+                                  pagina=pagina,
+                                  paginas=paginas,
+                                  tamaño=tamaño,
+                                  total=estructura.tamaño,
+                                  cursor=cache[1].get(('cursor', inicio, tamaño)))
+
+#-------------------------------Lotes en streaming (SSE)---------------------------------
+
+# Un lote muy grande se envía como texto plano a /<estructura>/<operacion>/stream en lugar del formulario.
+# El cuerpo se lee por partes y cada BLOQUE_STREAM valores se aplican como una sola operación (una toma
+# del cerrojo, un registro en el WAL); entre bloques se envía un evento SSE con el progreso. Cancelar,
+# o cerrar la conexión, corta entre dos bloques: la estructura queda con los bloques ya aplicados.
+BLOQUE_STREAM = int(os.environ.get('EDL_STREAM_BLOQUE', '1000')) # Valores por bloque
+LECTURA_STREAM = 64 * 1024 # Bytes que se leen del cuerpo en cada paso
+cancelaciones = {} # id del stream en curso -> threading.Event que lo cancela
+cerrojo_cancelaciones = threading.Lock()
+
+def _valores_stream(cuerpo, progreso):
+    # Genera los valores separados por comas o saltos de línea sin cargar todo el cuerpo en memoria.
+    # El último trozo de cada lectura puede estar cortado y se completa con la siguiente.
+    decodificador = codecs.getincrementaldecoder('utf-8')('replace')
+    resto = ''
+    while True:
+        datos = cuerpo.read(LECTURA_STREAM)
+        progreso['bytes'] += len(datos)
+        partes = (resto + decodificador.decode(datos, final=not datos)).replace('\n', ',').split(',')
+        resto = partes.pop() if datos else ''
+        for parte in partes:
+            parte = parte.strip()
+            if parte: # Las comas sobrantes no insertan valores vacíos
+                yield parte
+        if not datos:
+            return
+
+def _evento(nombre, datos):
+    return f'event: {nombre}\ndata: {json.dumps(datos)}\n\n'
+
+def stream_lote(estructura, aplicar):
+    # `aplicar(bloque)` ejecuta un bloque como una operación medida y devuelve (resultado, tiempo, memoria)
+    identificador = uuid.uuid4().hex
+    cancelado = threading.Event()
+    with cerrojo_cancelaciones:
+        cancelaciones[identificador] = cancelado
+    progreso = {'bytes': 0}
+    valores = _valores_stream(request.stream, progreso)
+    bytes_totales = request.content_length
+
+    def generar():
+        inicio = time.perf_counter()
+        estado = {'procesados': 0, 'bloques': 0, 'tiempo_operaciones': 0.0, 'memoria': 0.0}
+        def resumen():
+            segundos = time.perf_counter() - inicio
+            return dict(estado, tamaño=estructura.tamaño, bytes_leidos=progreso['bytes'], bytes_totales=bytes_totales,
+                        segundos=segundos, por_segundo=estado['procesados'] / segundos if segundos else 0.0)
+        try:
+            yield _evento('inicio', {'id': identificador, 'bloque': BLOQUE_STREAM, 'bytes_totales': bytes_totales})
+            while not cancelado.is_set():
+                bloque = list(islice(valores, BLOQUE_STREAM))
+                if not bloque:
+                    break
+                _, tiempo, memoria = aplicar(bloque)
+                estado['procesados'] += len(bloque)
+                estado['bloques'] += 1
+                estado['tiempo_operaciones'] += tiempo
+                estado['memoria'] += memoria
+                yield _evento('progreso', resumen())
+            yield _evento('resumen', dict(resumen(), cancelado=cancelado.is_set()))
+        finally:
+            # También al cerrarse la conexión: el servidor cierra el generador en el siguiente yield
+            with cerrojo_cancelaciones:
+                cancelaciones.pop(identificador, None)
+
+    return Response(stream_with_context(generar()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/stream/<identificador>/cancelar', methods=['POST']) # Detiene un lote en streaming al terminar el bloque actual
+def cancelar_stream(identificador):
+    with cerrojo_cancelaciones:
+        cancelado = cancelaciones.get(identificador)
+    if cancelado is None:
+        return jsonify(error='No hay ningún lote en curso con ese id'), 404
+    cancelado.set()
+    return jsonify(cancelado=True)
+
+#-------------------------------Memoria de las estructuras---------------------------------
+
+# Cada estructura lleva la cuenta de su propia memoria: memoria_bytes() suma el objeto y el contenedor
+# (nodos, arreglos, pool, índice). Nada se recorre al leerla: los contadores se actualizan en cada
+# inserción y eliminación. Los tamaños son los de sys.getsizeof.
+#
+# Los valores guardados solo se cuentan con EDL_MEMORIA_VALORES=1: contarlos una vez por objeto exige
+# un diccionario id -> apariciones que cuesta más que muchas de las estructuras (unos 80 bytes por
+# valor distinto), así que por defecto no se lleva. Activado, memoria_bytes() incluye también ese
+# diccionario, para que lo reportado sea lo que de verdad ocupa la estructura.
+MEMORIA_VALORES = os.environ.get('EDL_MEMORIA_VALORES', '0') == '1'
+BYTES_ID = sys.getsizeof(id(object())) # Las claves del contador son direcciones de memoria, enteros grandes
+app.jinja_env.globals['memoria_valores'] = MEMORIA_VALORES # Las vistas aclaran si la cifra incluye los valores
+BYTES_ENTERO = sys.getsizeof(2 ** 20) # Etiquetas, secuencias y posiciones: solo del -5 al 256 son enteros compartidos
+
+class ContadorValores:
+    # Bytes de los valores guardados, contando una sola vez cada objeto aunque ocupe varias posiciones
+    # (la misma cadena insertada varias veces, los enteros pequeños que Python comparte). Se cuenta por
+    # identidad: dos cadenas iguales creadas por separado ocupan memoria dos veces y cuentan dos veces.
+    __slots__ = ('referencias', 'bytes')
+
+    def __init__(self):
+        self.referencias = {} # id(valor) -> posiciones de la estructura que lo guardan
+        self.bytes = 0
+
+    def sumar(self, valor):
+        clave = id(valor)
+        cuenta = self.referencias.get(clave)
+        if cuenta is None:
+            self.referencias[clave] = 1
+            self.bytes += sys.getsizeof(valor)
+        else:
+            self.referencias[clave] = cuenta + 1
+
+    def restar(self, valor):
+        clave = id(valor)
+        cuenta = self.referencias[clave]
+        if cuenta == 1:
+            del self.referencias[clave] # El id puede reutilizarse en cuanto el valor se libere
+            self.bytes -= sys.getsizeof(valor)
+        else:
+            self.referencias[clave] = cuenta - 1
+
+    def sumar_varios(self, valores):
+        # Lo mismo que sumar en un bucle local; los tamaños de los objetos nuevos se suman juntos al final
+        referencias = self.referencias
+        nuevos = []
+        for valor in valores:
+            clave = id(valor)
+            cuenta = referencias.get(clave)
+            if cuenta is None:
+                referencias[clave] = 1
+                nuevos.append(valor)
+            else:
+                referencias[clave] = cuenta + 1
+        self.bytes += sum(map(sys.getsizeof, nuevos))
+
+    def restar_varios(self, valores):
+        referencias = self.referencias
+        liberados = []
+        for valor in valores:
+            clave = id(valor)
+            cuenta = referencias[clave] - 1
+            if cuenta:
+                referencias[clave] = cuenta
+            else:
+                del referencias[clave]
+                liberados.append(valor)
+        self.bytes -= sum(map(sys.getsizeof, liberados))
+
+    def memoria_bytes(self):
+        # Los valores y el propio contador; las cuentas mayores que 256 también son objetos, pero son raras
+        return self.bytes + sys.getsizeof(self) + sys.getsizeof(self.referencias) + len(self.referencias) * BYTES_ID
+
+class ContadorNulo:
+    # Lo que usan las estructuras con EDL_MEMORIA_VALORES=0: mismas operaciones, sin guardar nada
+    __slots__ = ()
+    bytes = 0
+
+    def sumar(self, valor):
+        pass
+
+    def restar(self, valor):
+        pass
+
+    def sumar_varios(self, valores):
+        pass
+
+    def restar_varios(self, valores):
+        pass
+
+    def memoria_bytes(self):
+        return 0
+
+CONTADOR_NULO = ContadorNulo()
+
+def contador_valores():
+    return ContadorValores() if MEMORIA_VALORES else CONTADOR_NULO
+
+def datos_cadena(nodo, cantidad):
+    # Los datos de una cadena recién enlazada; el contador nulo ni siquiera la recorre
+    for _ in range(cantidad):
+        yield nodo.dato
+        nodo = nodo.siguiente
+
+bytes_clases = {} # clase con __slots__ -> bytes de cada instancia
+
+def bytes_instancia(clase):
+    # Todas las instancias de una clase con __slots__ miden lo mismo: se mide una vez una vacía
+    tamaño = bytes_clases.get(clase)
+    if tamaño is None:
+        tamaño = bytes_clases[clase] = sys.getsizeof(object.__new__(clase))
+    return tamaño
+
+
+class MemoriaContada:
+    # memoria_bytes() en O(1) para las estructuras: el objeto y su __dict__ más lo que reporta
+    # _bytes_contenedor() de cada clase (con los valores y su contador si EDL_MEMORIA_VALORES=1).
+    # No toma el cerrojo: solo suma contadores.
+    def memoria_bytes(self):
+        return sys.getsizeof(self) + sys.getsizeof(self.__dict__) + self._bytes_contenedor()
+
+    def bytes_por_elemento(self):
+        tamaño = self.tamaño
+        return self.memoria_bytes() / tamaño if tamaño else None
+
+#-------------------------------Índice de valores---------------------------------
+
+INDICE_LISTAS = os.environ.get('EDL_INDICE', '0') == '1' # Activa el índice valor -> nodo en las listas globales
+
+class ArbolFenwick:
+    # Árbol de Fenwick que solo crece por el final. Cada etiqueta vale 1 mientras su nodo esté en la
+    # lista y 0 cuando se elimina, así la suma de prefijo da la posición de un nodo sin recorrer la lista.
+    def __init__(self):
+        self.arbol = [0] # La posición 0 no se usa
+
+    def agregar(self, valor=1):
+        i = len(self.arbol)
+        total = valor
+        limite = i - (i & -i) # El nodo i cubre el rango (i - lowbit(i), i]
+        j = i - 1
+        while j > limite:
+            total += self.arbol[j]
+            j -= j & -j
+        self.arbol.append(total)
+        return i
+
+    def actualizar(self, i, delta):
+        while i < len(self.arbol):
+            self.arbol[i] += delta
+            i += i & -i
+
+    def prefijo(self, i):
+        total = 0
+        while i > 0:
+            total += self.arbol[i]
+            i -= i & -i
+        return total
+
+REPETIDOS_DEQUE = 32 # Apariciones de un mismo valor a partir de las cuales se guardan en un deque
+
+# Mapas valor -> apariciones (índice de las listas, entradas de la cola de prioridad). Un valor que
+# aparece una vez apunta directo a su elemento; con repetidos pasa a una lista y, si son muchos, a un
+# deque para que quitar el primero siga siendo O(1). Cada función retorna cuántos bytes cambiaron
+# los contenedores de los repetidos, para que la memoria se lleve sin recorrer el mapa.
+def _es_repetido(apariciones):
+    return type(apariciones) is list or type(apariciones) is deque
+
+def agregar_aparicion(mapa, clave, elemento):
+    apariciones = mapa.get(clave)
+    if apariciones is None:
+        mapa[clave] = elemento
+        return 0
+    if not _es_repetido(apariciones):
+        mapa[clave] = apariciones = [apariciones, elemento]
+        return sys.getsizeof(apariciones)
+    antes = sys.getsizeof(apariciones)
+    apariciones.append(elemento)
+    if len(apariciones) > REPETIDOS_DEQUE and type(apariciones) is list:
+        mapa[clave] = apariciones = deque(apariciones)
+    return sys.getsizeof(apariciones) - antes
+
+def primera_aparicion(mapa, clave):
+    apariciones = mapa.get(clave)
+    return apariciones[0] if apariciones is not None and _es_repetido(apariciones) else apariciones
+
+def todas_las_apariciones(mapa, clave):
+    apariciones = mapa.get(clave)
+    if apariciones is None:
+        return []
+    return list(apariciones) if _es_repetido(apariciones) else [apariciones]
+
+def quitar_aparicion(mapa, clave, elemento):
+    apariciones = mapa[clave]
+    if apariciones is elemento:
+        del mapa[clave]
+        return 0
+    antes = sys.getsizeof(apariciones)
+    if apariciones[0] is elemento:
+        del apariciones[0] # O(1) en el deque; en la lista son a lo más REPETIDOS_DEQUE referencias
+    else:
+        apariciones.remove(elemento)
+    if len(apariciones) == 1:
+        mapa[clave] = apariciones[0]
+        return -antes
+    return sys.getsizeof(apariciones) - antes
+
+class IndiceLista:
+    # Índice valor -> nodos (en orden de aparición) para que buscar/eliminar no recorran la lista
+    def __init__(self):
+        self.nodos = {}
+        self.orden = ArbolFenwick()
+        self.bytes_repetidos = 0 # Lo que ocupan las listas y deques de los valores repetidos
+
+    def registrar(self, nodo):
+        nodo.etiqueta = self.orden.agregar()
+        self.bytes_repetidos += agregar_aparicion(self.nodos, nodo.dato, nodo)
+
+    def primero(self, dato):
+        return primera_aparicion(self.nodos, dato)
+
+    def apariciones(self, dato):
+        return todas_las_apariciones(self.nodos, dato)
+
+    def retirar(self, nodo):
+        self.bytes_repetidos += quitar_aparicion(self.nodos, nodo.dato, nodo)
+        self.orden.actualizar(nodo.etiqueta, -1)
+
+    def posicion(self, nodo):
+        return self.orden.prefijo(nodo.etiqueta) - 1
+
+    def necesita_compactar(self, tamaño):
+        # Las etiquetas de nodos eliminados no se reutilizan; cuando son mayoría conviene reetiquetar
+        return len(self.orden.arbol) > 2 * tamaño + 1024
+
+    def memoria_bytes(self, tamaño):
+        # El diccionario, los contenedores de los valores repetidos, la lista del árbol de Fenwick y la
+        # etiqueta de cada nodo. Las claves son los valores de la lista (los cuenta ella, si se cuentan);
+        # casi todas las sumas del árbol son enteros pequeños compartidos
+        return sys.getsizeof(self.nodos) + self.bytes_repetidos + sys.getsizeof(self.orden.arbol) + tamaño * BYTES_ENTERO
+
+MODOS_ELIMINACION = ('primera', 'todas', 'predicado')
+
+class CriterioEliminacion:
+    # Decide nodo por nodo qué sale de la lista en eliminar_varios y cuenta los eliminados por valor.
+    # 'primera' quita de cada valor tantas apariciones como veces se pidió (lo mismo que llamar a
+    # eliminar una vez por valor), 'todas' quita todas las apariciones y 'predicado' quita los datos
+    # para los que la función recibida en `valores` retorna verdadero.
+    def __init__(self, valores, modo):
+        if modo not in MODOS_ELIMINACION:
+            raise ValueError(f"El modo debe ser 'primera', 'todas' o 'predicado', no '{modo}'")
+        self.restantes = sys.maxsize # Eliminaciones que aún pueden ocurrir; en 0 el recorrido se corta
+        if modo == 'predicado':
+            self.predicado = valores
+            self.pendientes = None
+            self.cuentas = {}
+            return
+        valores = list(valores)
+        self.predicado = None
+        self.cuentas = dict.fromkeys(valores, 0) # En el orden pedido, con 0 para los que no aparezcan
+        if modo == 'todas':
+            self.pendientes = dict.fromkeys(valores, sys.maxsize)
+        else:
+            self.pendientes = Counter(valores)
+            self.restantes = len(valores)
+
+    def quitar(self, dato):
+        if self.predicado is not None:
+            if not self.predicado(dato):
+                return False
+            self.cuentas[dato] = self.cuentas.get(dato, 0) + 1
+            return True
+        if not self.pendientes.get(dato):
+            return False
+        self.pendientes[dato] -= 1
+        self.cuentas[dato] += 1
+        self.restantes -= 1
+        return True
+
+def mensaje_eliminacion(cuentas):
+    # Resumen de eliminar_varios para las vistas: cuántos se eliminaron y qué valores no estaban
+    faltantes = [str(valor) for valor, cantidad in cuentas.items() if not cantidad]
+    mensaje = f'{sum(cuentas.values())} elementos eliminados'
+    return mensaje + (f" (no encontrados: {', '.join(faltantes)})" if faltantes else '')
+
+def _eliminar_indexado(lista, criterio):
+    # eliminar_varios de las listas simple y circular con índice: cada valor pedido va directo a sus
+    # nodos y solo el predicado recorre la lista (tamaño nodos, así sirve también para el círculo)
+    if criterio.predicado is None:
+        for dato in criterio.cuentas:
+            nodo = lista.indice.primero(dato)
+            while nodo is not None and criterio.quitar(dato):
+                lista._desenlazar_indexado(nodo)
+                nodo = lista.indice.primero(dato)
+        return
+    actual = lista.cabeza
+    for _ in range(lista.tamaño):
+        siguiente = actual.siguiente
+        if criterio.quitar(actual.dato):
+            lista._desenlazar_indexado(actual)
+        actual = siguiente
+
+cerrojo_indices = threading.Lock() # Reconstrucciones perezosas del índice, que pueden pedir varios lectores a la vez
+
+#-------------------------------Almacenamiento compacto de nodos---------------------------------
+
+# 'nodos' (objetos Nodo), 'pool' (PoolNodos) o 'bloques' (lista doble desenrollada; las demás usan nodos)
+ALMACENAMIENTO = os.environ.get('EDL_ALMACENAMIENTO', 'nodos')
+if ALMACENAMIENTO not in ('nodos', 'pool', 'bloques'):
+    raise ValueError(f"EDL_ALMACENAMIENTO debe ser 'nodos', 'pool' o 'bloques', no '{ALMACENAMIENTO}'")
+
+VACIO = -1 # Hace las veces de None en los enlaces del pool
+
+class PoolNodos:
+    # Nodos guardados como "struct of arrays": el dato en una lista y los enlaces como índices enteros
+    # en arreglos array('l') preasignados. Los huecos liberados forman una lista libre encadenada por
+    # el propio arreglo siguiente, así que no se crea ningún objeto por nodo.
+    def __init__(self, doble=False, capacidad=16):
+        self.datos = [None] * capacidad
+        self.siguiente = array('l', [VACIO]) * capacidad
+        self.anterior = array('l', [VACIO]) * capacidad if doble else None
+        self.capacidad = capacidad
+        self.usados = 0 # Huecos entregados alguna vez (los siguientes nunca se han usado)
+        self.libre = VACIO # Primer hueco de la lista libre
+        self.contados = contador_valores() # Los valores de los huecos en uso
+
+    def _crecer(self):
+        extra = self.capacidad # Crecimiento geométrico: duplica la capacidad
+        self.datos.extend([None] * extra)
+        self.siguiente.extend(array('l', [VACIO]) * extra)
+        if self.anterior is not None:
+            self.anterior.extend(array('l', [VACIO]) * extra)
+        self.capacidad += extra
+
+    def reservar(self, dato):
+        if self.libre != VACIO:
+            i = self.libre
+            self.libre = self.siguiente[i]
+        else:
+            if self.usados == self.capacidad:
+                self._crecer()
+            i = self.usados
+            self.usados += 1
+        self.datos[i] = dato
+        self.siguiente[i] = VACIO
+        if self.anterior is not None:
+            self.anterior[i] = VACIO
+        self.contados.sumar(dato)
+        return i
+
+    def liberar(self, i):
+        self.contados.restar(self.datos[i])
+        self.datos[i] = None # Suelta la referencia al valor
+        self.siguiente[i] = self.libre
+        self.libre = i
+
+    def memoria_bytes(self):
+        # Los tres arreglos con su capacidad completa (también los huecos libres) y, si se cuentan, los valores en uso
+        total = sys.getsizeof(self) + sys.getsizeof(self.__dict__) + sys.getsizeof(self.datos) + sys.getsizeof(self.siguiente)
+        if self.anterior is not None:
+            total += sys.getsizeof(self.anterior)
+        return total + self.contados.memoria_bytes()
+
 # -------------------------------Lista Enlazada Simple---------------------------------
 
 class Nodo:
+    __slots__ = ('dato', 'siguiente') # Sin __dict__ por instancia: menos bytes por nodo
+
     def __init__(self, dato):
         self.dato = dato
         self.siguiente = None
 
-class ListaEnlazada:
-    def __init__(self):
+class NodoIndexado(Nodo):
+    # Nodo usado en modo índice: guarda su predecesor y su etiqueta de orden
+    __slots__ = ('previo', 'etiqueta')
+
+    def __init__(self, dato):
+        super().__init__(dato)
+        self.previo = None
+        self.etiqueta = 0
+
+class ListaEnlazada(PaginacionEnlazada, MemoriaContada):
+    def __init__(self, indexada=False):
         self.cabeza = None
         self.ultimo = None
         self.tamaño = 0
+        self.version = 0 # Aumenta con cada modificación; invalida la tabla HTML cacheada
+        self.cerrojo = CerrojoLectorEscritor() # Lecturas en paralelo, escrituras de una en una
+        self.indice = IndiceLista() if indexada else None
+        self.clase_nodo = NodoIndexado if indexada else Nodo
+        self.contados = contador_valores() # Bytes de los valores (con EDL_MEMORIA_VALORES=1), al día en cada operación
 
     @benchmark
+    @registrada
     def insertar(self, dato):
-        nuevo_nodo = Nodo(dato)
+        nuevo_nodo = self.clase_nodo(dato)
+        self.contados.sumar(dato)
+        if self.indice is not None:
+            nuevo_nodo.previo = self.ultimo if self.cabeza else None
+            self.indice.registrar(nuevo_nodo)
         if not self.cabeza:
             self.cabeza = nuevo_nodo
             self.ultimo = nuevo_nodo
@@ -48,15 +945,58 @@ class ListaEnlazada:
             self.ultimo.siguiente = nuevo_nodo
             self.ultimo = nuevo_nodo
         self.tamaño += 1
+        self.version += 1
 
     @benchmark
+    @registrada
+    def insertar_varios(self, datos):
+        # Enlaza todo el lote en una cadena local y la pega al final de una sola vez
+        clase_nodo, indice = self.clase_nodo, self.indice
+        primero = ultimo = None
+        cantidad = 0
+        for dato in datos:
+            nuevo_nodo = clase_nodo(dato)
+            if primero is None:
+                primero = nuevo_nodo
+            else:
+                ultimo.siguiente = nuevo_nodo
+                if indice is not None:
+                    nuevo_nodo.previo = ultimo
+            if indice is not None:
+                indice.registrar(nuevo_nodo)
+            ultimo = nuevo_nodo
+            cantidad += 1
+        if not cantidad:
+            return 0
+        self.contados.sumar_varios(datos_cadena(primero, cantidad))
+        if not self.cabeza:
+            self.cabeza = primero
+        else:
+            self.ultimo.siguiente = primero
+            if indice is not None:
+                primero.previo = self.ultimo
+        self.ultimo = ultimo
+        self.tamaño += cantidad
+        self.version += 1
+        return cantidad
+
+    @benchmark
+    @registrada
     def eliminar(self, dato):
         if not self.cabeza:
             return
 
+        if self.indice is not None:
+            nodo = self.indice.primero(dato)
+            if nodo:
+                self._desenlazar_indexado(nodo)
+            return
+
         if self.cabeza.dato == dato:
+            self.contados.restar(self.cabeza.dato)
             self.cabeza = self.cabeza.siguiente
             self.tamaño -= 1
+            self.version += 1
             return
 
         actual = self.cabeza
@@ -64,9 +1004,98 @@ class ListaEnlazada:
             actual = actual.siguiente
 
         if actual.siguiente:
+            if actual.siguiente == self.ultimo:
+                self.ultimo = actual # Mantiene el último correcto para las inserciones al final
+            self.contados.restar(actual.siguiente.dato)
             actual.siguiente = actual.siguiente.siguiente
             self.tamaño -= 1
+            self.version += 1
 
+    @benchmark
+    @registrada
+    def eliminar_varios(self, valores, modo='primera'):
+        # Quita todos los valores pedidos en un solo recorrido; retorna {valor: eliminados}
+        criterio = CriterioEliminacion(valores, modo)
+        if self.indice is not None:
+            _eliminar_indexado(self, criterio)
+            return criterio.cuentas
+        quitar, restar = criterio.quitar, self.contados.restar
+        previo, actual = None, self.cabeza
+        eliminados = 0
+        while actual and criterio.restantes:
+            siguiente = actual.siguiente
+            if quitar(actual.dato):
+                if previo:
+                    previo.siguiente = siguiente
+                else:
+                    self.cabeza = siguiente
+                if actual is self.ultimo:
+                    self.ultimo = previo
+                restar(actual.dato)
+                eliminados += 1
+            else:
+                previo = actual
+            actual = siguiente
+        if eliminados:
+            self.tamaño -= eliminados
+            self.version += 1
+        return criterio.cuentas
+
+    def _desenlazar_indexado(self, nodo):
+        # Con el predecesor guardado en el nodo, eliminar no necesita buscarlo desde la cabeza
+        previo, siguiente = nodo.previo, nodo.siguiente
+        if previo:
+            previo.siguiente = siguiente
+        else:
+            self.cabeza = siguiente
+        if siguiente:
+            siguiente.previo = previo
+        else:
+            self.ultimo = previo
+        self.indice.retirar(nodo)
+        self.contados.restar(nodo.dato)
+        self.tamaño -= 1
+        self.version += 1
+        if self.indice.necesita_compactar(self.tamaño):
+            self._reconstruir_indice()
+
+    def _reconstruir_indice(self):
+        self.indice = IndiceLista()
+        actual = self.cabeza
+        while actual:
+            self.indice.registrar(actual)
+            actual = actual.siguiente
+
+    def _primero(self):
+        return self.cabeza
+
+    def _siguiente(self, nodo):
+        return nodo.siguiente
+
+    def _dato(self, nodo):
+        return nodo.dato
+
+    @lectura
+    def exportar_estado(self):
+        return {'datos': self.obtener_lista()}
+
+    @escritura
+    def restaurar_estado(self, estado):
+        self.cabeza = self.ultimo = None
+        self.tamaño = 0
+        self.version += 1
+        self.contados = contador_valores()
+        if self.indice is not None:
+            self.indice = IndiceLista()
+        inspect.unwrap(ListaEnlazada.insertar_varios)(self, estado['datos'])
+
+    def _bytes_contenedor(self):
+        total = self.tamaño * bytes_instancia(self.clase_nodo) + self.contados.memoria_bytes()
+        if self.indice is not None:
+            total += self.indice.memoria_bytes(self.tamaño)
+        return total
+
+    @lectura
     def obtener_lista(self):
         datos = []
         actual = self.cabeza
@@ -76,7 +1105,11 @@ class ListaEnlazada:
         return datos
 
     @benchmark
+    @lectura
     def buscar(self, dato):
+        if self.indice is not None:
+            nodo = self.indice.primero(dato)
+            return self.indice.posicion(nodo) if nodo else -1
         actual = self.cabeza
         posicion = 0
         while actual:
@@ -86,28 +1119,163 @@ class ListaEnlazada:
             posicion += 1
         return -1
 
-lista = ListaEnlazada() # Crea una instancia de la lista enlazada simple
+class ListaEnlazadaPool(PaginacionEnlazada, MemoriaContada):
+    # Misma interfaz que ListaEnlazada, con los nodos en un PoolNodos
+    def __init__(self):
+        self.pool = PoolNodos()
+        self.cabeza = VACIO
+        self.ultimo = VACIO
+        self.tamaño = 0
+        self.version = 0
+        self.cerrojo = CerrojoLectorEscritor()
+
+    @benchmark
+    @registrada
+    def insertar(self, dato):
+        nuevo = self.pool.reservar(dato)
+        if self.cabeza == VACIO:
+            self.cabeza = nuevo
+        else:
+            self.pool.siguiente[self.ultimo] = nuevo
+        self.ultimo = nuevo
+        self.tamaño += 1
+        self.version += 1
+
+    @benchmark
+    @registrada
+    def insertar_varios(self, datos):
+        pool = self.pool
+        cantidad = 0
+        for dato in datos:
+            nuevo = pool.reservar(dato)
+            if self.cabeza == VACIO:
+                self.cabeza = nuevo
+            else:
+                pool.siguiente[self.ultimo] = nuevo
+            self.ultimo = nuevo
+            cantidad += 1
+        self.tamaño += cantidad
+        self.version += 1
+        return cantidad
+
+    @benchmark
+    @registrada
+    def eliminar(self, dato):
+        pool = self.pool
+        previo, actual = VACIO, self.cabeza
+        while actual != VACIO and pool.datos[actual] != dato:
+            previo, actual = actual, pool.siguiente[actual]
+        if actual == VACIO:
+            return
+        if previo == VACIO:
+            self.cabeza = pool.siguiente[actual]
+        else:
+            pool.siguiente[previo] = pool.siguiente[actual]
+        if actual == self.ultimo:
+            self.ultimo = previo
+        pool.liberar(actual)
+        self.tamaño -= 1
+        self.version += 1
+
+    @benchmark
+    @registrada
+    def eliminar_varios(self, valores, modo='primera'):
+        # Quita todos los valores pedidos en un solo recorrido; retorna {valor: eliminados}
+        criterio = CriterioEliminacion(valores, modo)
+        quitar = criterio.quitar
+        pool = self.pool
+        datos, enlaces = pool.datos, pool.siguiente
+        previo, actual = VACIO, self.cabeza
+        eliminados = 0
+        while actual != VACIO and criterio.restantes:
+            siguiente = enlaces[actual]
+            if quitar(datos[actual]):
+                if previo == VACIO:
+                    self.cabeza = siguiente
+                else:
+                    enlaces[previo] = siguiente
+                if actual == self.ultimo:
+                    self.ultimo = previo
+                pool.liberar(actual)
+                eliminados += 1
+            else:
+                previo = actual
+            actual = siguiente
+        if eliminados:
+            self.tamaño -= eliminados
+            self.version += 1
+        return criterio.cuentas
+
+    def _primero(self):
+        return self.cabeza
+
+    def _siguiente(self, nodo):
+        return self.pool.siguiente[nodo]
+
+    def _dato(self, nodo):
+        return self.pool.datos[nodo]
+
+    @lectura
+    def exportar_estado(self):
+        return {'datos': self.obtener_lista()}
+
+    @escritura
+    def restaurar_estado(self, estado):
+        self.pool = PoolNodos()
+        self.cabeza = self.ultimo = VACIO
+        self.tamaño = 0
+        self.version += 1
+        inspect.unwrap(ListaEnlazadaPool.insertar_varios)(self, estado['datos'])
+
+    def _bytes_contenedor(self):
+        return self.pool.memoria_bytes() # Si se cuentan, los valores los lleva el pool al reservar y liberar
+
+    @lectura
+    def obtener_lista(self):
+        datos, siguiente = self.pool.datos, self.pool.siguiente
+        resultado = []
+        actual = self.cabeza
+        while actual != VACIO:
+            resultado.append(datos[actual])
+            actual = siguiente[actual]
+        return resultado
+
+    @benchmark
+    @lectura
+    def buscar(self, dato):
+        datos, siguiente = self.pool.datos, self.pool.siguiente
+        actual = self.cabeza
+        posicion = 0
+        while actual != VACIO:
+            if datos[actual] == dato:
+                return posicion
+            actual = siguiente[actual]
+            posicion += 1
+        return -1
+
+if ALMACENAMIENTO == 'pool':
+    lista = ListaEnlazadaPool()
+else:
+    lista = ListaEnlazada(indexada=INDICE_LISTAS) # Crea una instancia de la lista enlazada simple
 
 # Rutas para Lista Simple
 @app.route('/lista-simple') # Define la ruta para la lista simple
 def lista_simple():
-    datos = lista.obtener_lista() # Obtiene los datos de la lista
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor']) # Crea un DataFrame de pandas con los datos
+    lista = obtener_estructura('lista-simple') # La instancia de la sesión o la global
     return render_template( # Renderiza la plantilla lista_simple.html
         'lista_simple.html',
-        datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+        datos=tabla_paginada(lista), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
         lista=lista) # Pasa la lista como contexto a la plantilla
 
 @app.route('/lista-simple/buscar', methods=['POST']) # Define la ruta para buscar un elemento en la lista simple
 def buscar():
+    lista = obtener_estructura('lista-simple') # La instancia de la sesión o la global
     valor = request.form['valor'] # Obtiene el valor a buscar del formulario
     posicion, tiempo, memoria = lista.buscar(valor) # Llama a la función buscar y obtiene la posición, tiempo y memoria
-    datos = lista.obtener_lista() # Obtiene los datos de la lista
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor']) # Crea un DataFrame de pandas con los datos
     mensaje = f'Elemento {"encontrado en posición " + str(posicion) if posicion >= 0 else "no encontrado"}' # Mensaje de búsqueda
     return render_template( # Renderiza la plantilla lista_simple.html
         'lista_simple.html',
-        datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+        datos=tabla_paginada(lista), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
         mensaje_busqueda=mensaje, # Mensaje de búsqueda
         lista=lista, # Pasa la lista como contexto a la plantilla
         tiempos=f"{tiempo:.7f} s", # Tiempo de ejecución
@@ -116,63 +1284,354 @@ def buscar():
 
 @app.route('/lista-simple/insertar', methods=['POST']) # Define la ruta para insertar un elemento en la lista simple
 def insertar():
+    lista = obtener_estructura('lista-simple') # La instancia de la sesión o la global
     valor = request.form['valor'] # Obtiene el valor a insertar del formulario
-    tiempos = [] # Inicializa una lista para almacenar los tiempos
-    memorias = [] # Inicializa una lista para almacenar las memorias
-    for valor in valor.split(','): # Recorre los valores separados por comas
-        _, t, m = lista.insertar(valor.strip()) # Llama a la función insertar y obtiene el tiempo y memoria
-        tiempos.append(t) # Agrega el tiempo a la lista de tiempos
-        memorias.append(m) # Agrega la memoria a la lista de memorias
-    tiempo_total = sum(tiempos) # Suma todos los tiempos
-    memoria_total = sum(memorias) # Suma todas las memorias
-    datos = lista.obtener_lista() # Obtiene los datos de la lista
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor']) # Crea un DataFrame de pandas con los datos
+    valores = [val.strip() for val in valor.split(',')] # Separa los valores por comas
+    _, tiempo_total, memoria_total = lista.insertar_varios(valores) # Inserta todo el lote en una sola operación medida
     return render_template( # Renderiza la plantilla lista_simple.html
         'lista_simple.html',
-        datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+        datos=tabla_paginada(lista), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
         lista=lista, # Pasa la lista como contexto a la plantilla
         tiempos=f"{tiempo_total:.7f} s", # Tiempo total de ejecución
         memorias=f"{memoria_total:.6f} MB" # Memoria total utilizada
     )
 
+@app.route('/lista-simple/insertar/stream', methods=['POST']) # Inserta un lote enorme enviado como texto plano, con progreso SSE
+def insertar_stream():
+    lista = obtener_estructura('lista-simple') # La instancia de la sesión o la global
+    return stream_lote(lista, lista.insertar_varios) # Cada bloque entra con una sola llamada a insertar_varios
+
 @app.route('/lista-simple/eliminar', methods=['POST']) # Define la ruta para eliminar un elemento de la lista simple
 def eliminar():
+    lista = obtener_estructura('lista-simple') # La instancia de la sesión o la global
     valor = request.form['valor'] # Obtiene el valor a eliminar del formulario
-    tiempos = [] # Inicializa una lista para almacenar los tiempos
-    memorias = [] # Inicializa una lista para almacenar las memorias
-    for valor in valor.split(','): # Recorre los valores separados por comas
-        _, t, m = lista.eliminar(valor.strip()) # Llama a la función eliminar y obtiene el tiempo y memoria
-        tiempos.append(t) # Agrega el tiempo a la lista de tiempos
-        memorias.append(m) # Agrega la memoria a la lista de memorias
-    tiempo_total = sum(tiempos) # Suma todos los tiempos
-    memoria_total = sum(memorias) # Suma todas las memorias
-    datos = lista.obtener_lista() # Obtiene los datos de la lista
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor']) # Crea un DataFrame de pandas con los datos
+    valores = [val.strip() for val in valor.split(',')] # Separa los valores por comas
+    modo = 'todas' if request.form.get('modo') == 'todas' else 'primera' # Primera aparición de cada valor o todas
+    cuentas, tiempo_total, memoria_total = lista.eliminar_varios(valores, modo) # Quita todo el lote en un solo recorrido
     return render_template( # Renderiza la plantilla lista_simple.html
         'lista_simple.html',
-        datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+        datos=tabla_paginada(lista), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
+        mensaje_busqueda=mensaje_eliminacion(cuentas), # Cuántos se eliminaron y qué valores no estaban
         lista=lista, # Pasa la lista como contexto a la plantilla
         tiempos=f"{tiempo_total:.7f} s", # Tiempo total de ejecución
         memorias=f"{memoria_total:.6f} MB" # Memoria total utilizada
     )
 
+#---------------------------------Lista Ordenada---------------------------------
+
+NIVELES_MAXIMOS = 32 # Alcanza para 4^32 elementos con p = 1/4
+PROBABILIDAD_NIVEL = 0.25 # Probabilidad de que un nodo suba un nivel más: ~1.33 enlaces por nodo
+
+def clave_orden(valor):
+    # Los números, y los textos que son números, van primero y en orden numérico ('9' antes que '10');
+    # el resto se ordena como texto. Números y textos nunca se comparan entre sí.
+    if isinstance(valor, (int, float)) and not isinstance(valor, bool) and valor == valor:
+        return (0, valor)
+    texto = str(valor)
+    try:
+        numero = float(texto)
+    except ValueError:
+        return (1, texto)
+    return (0, numero) if numero == numero else (1, texto) # 'nan' se ordena como texto
+
+class NodoSalto:
+    # Como Nodo, pero con un enlace por nivel. anchos[i] es cuántas posiciones avanza siguientes[i],
+    # con lo que la posición de un nodo se obtiene sumando anchos al bajar (skip list indexable)
+    __slots__ = ('dato', 'clave', 'siguientes', 'anchos')
+
+    def __init__(self, dato, clave, niveles):
+        self.dato = dato
+        self.clave = clave
+        self.siguientes = [None] * niveles
+        self.anchos = [1] * niveles
+
+class ListaOrdenada(PaginacionEnlazada, MemoriaContada):
+    # Skip list: los elementos quedan ordenados por clave_orden y buscar, insertar, eliminar y la
+    # posición cuestan O(log n) esperado. Los valores con la misma clave quedan en orden de llegada.
+    # Un enlace a None cuenta como si apuntara a un nodo ficticio en la posición tamaño + 1, así los
+    # anchos se actualizan igual en todos los niveles.
+    def __init__(self):
+        self.cabeza = NodoSalto(None, None, NIVELES_MAXIMOS) # Centinela: no guarda ningún dato
+        self.niveles = 1 # Niveles en uso
+        self.tamaño = 0
+        self.version = 0
+        self.cerrojo = CerrojoLectorEscritor()
+        self.bytes_nodos = 0 # Nodos con sus listas de enlaces y anchos y su clave, sin el centinela
+        self.contados = contador_valores()
+
+    def _bytes_nodo(self, nodo):
+        # La clave es una tupla nueva; su número o texto solo ocupa aparte si no es el propio dato ('10' -> 10.0)
+        clave = nodo.clave
+        total = (bytes_instancia(NodoSalto) + sys.getsizeof(nodo.siguientes) + sys.getsizeof(nodo.anchos)
+                 + sys.getsizeof(clave))
+        return total if clave[1] is nodo.dato else total + sys.getsizeof(clave[1])
+
+    def _nivel_aleatorio(self):
+        nivel = 1
+        while nivel < NIVELES_MAXIMOS and random.random() < PROBABILIDAD_NIVEL:
+            nivel += 1
+        return nivel
+
+    def _camino(self, clave, incluir_iguales):
+        # En cada nivel, el último nodo con clave menor (o menor o igual) que `clave` y su posición
+        previos = [None] * self.niveles
+        posiciones = [0] * self.niveles
+        nodo, posicion = self.cabeza, 0
+        for nivel in range(self.niveles - 1, -1, -1):
+            siguiente = nodo.siguientes[nivel]
+            while siguiente is not None and (siguiente.clave < clave or (incluir_iguales and siguiente.clave == clave)):
+                posicion += nodo.anchos[nivel]
+                nodo = siguiente
+                siguiente = nodo.siguientes[nivel]
+            previos[nivel] = nodo
+            posiciones[nivel] = posicion
+        return previos, posiciones
+
+    def _camino_posicion(self, posicion):
+        # En cada nivel, el último nodo antes de la posición dada (1 es el primer elemento)
+        previos = [None] * self.niveles
+        nodo, actual = self.cabeza, 0
+        for nivel in range(self.niveles - 1, -1, -1):
+            while nodo.siguientes[nivel] is not None and actual + nodo.anchos[nivel] < posicion:
+                actual += nodo.anchos[nivel]
+                nodo = nodo.siguientes[nivel]
+            previos[nivel] = nodo
+        return previos
+
+    def _insertar(self, dato):
+        clave = clave_orden(dato)
+        nivel = self._nivel_aleatorio()
+        if nivel > self.niveles:
+            for i in range(self.niveles, nivel):
+                self.cabeza.siguientes[i] = None
+                self.cabeza.anchos[i] = self.tamaño + 1
+            self.niveles = nivel
+        previos, posiciones = self._camino(clave, True) # Después de los iguales: orden de llegada
+        posicion = posiciones[0] + 1
+        nuevo = NodoSalto(dato, clave, nivel)
+        for i in range(nivel):
+            previo = previos[i]
+            nuevo.siguientes[i] = previo.siguientes[i]
+            previo.siguientes[i] = nuevo
+            nuevo.anchos[i] = previo.anchos[i] - (posicion - posiciones[i]) + 1
+            previo.anchos[i] = posicion - posiciones[i]
+        for i in range(nivel, self.niveles):
+            previos[i].anchos[i] += 1 # El enlace que pasa por encima ahora salta un elemento más
+        self.tamaño += 1
+        self.bytes_nodos += self._bytes_nodo(nuevo)
+        self.contados.sumar(dato)
+
+    def _buscar_nodo(self, dato):
+        # Retorna (posición desde 1, nodo) del primer elemento igual a `dato`, o (0, None).
+        # Entre claves iguales ('1' y '1.0') se compara el dato.
+        clave = clave_orden(dato)
+        previos, posiciones = self._camino(clave, False)
+        nodo, posicion = previos[0].siguientes[0], posiciones[0] + 1
+        while nodo is not None and nodo.clave == clave:
+            if nodo.dato == dato:
+                return posicion, nodo
+            nodo = nodo.siguientes[0]
+            posicion += 1
+        return 0, None
+
+    @benchmark
+    @registrada
+    def insertar(self, dato):
+        self._insertar(dato)
+        self.version += 1
+
+    @benchmark
+    @registrada
+    def insertar_varios(self, datos):
+        cantidad = 0
+        for dato in datos:
+            self._insertar(dato)
+            cantidad += 1
+        if cantidad:
+            self.version += 1
+        return cantidad
+
+    @benchmark
+    @registrada
+    def eliminar(self, dato):
+        posicion, nodo = self._buscar_nodo(dato)
+        if nodo is None:
+            return False
+        previos = self._camino_posicion(posicion)
+        for i in range(self.niveles):
+            previo = previos[i]
+            if previo.siguientes[i] is nodo:
+                previo.siguientes[i] = nodo.siguientes[i]
+                previo.anchos[i] += nodo.anchos[i] - 1
+            else:
+                previo.anchos[i] -= 1
+        while self.niveles > 1 and self.cabeza.siguientes[self.niveles - 1] is None:
+            self.niveles -= 1
+        self.tamaño -= 1
+        self.version += 1
+        self.bytes_nodos -= self._bytes_nodo(nodo)
+        self.contados.restar(nodo.dato)
+        return True
+
+    @benchmark
+    @lectura
+    def buscar(self, dato):
+        posicion, _ = self._buscar_nodo(dato)
+        return posicion - 1 # -1 si no está
+
+    @benchmark
+    @lectura
+    def rango(self, minimo, maximo):
+        # Todos los valores con clave entre las de `minimo` y `maximo`, ambos incluidos: O(log n + k)
+        desde, hasta = clave_orden(minimo), clave_orden(maximo)
+        previos, _ = self._camino(desde, False)
+        nodo = previos[0].siguientes[0]
+        datos = []
+        while nodo is not None and nodo.clave <= hasta:
+            datos.append(nodo.dato)
+            nodo = nodo.siguientes[0]
+        return datos
+
+    def _primero(self):
+        return self.cabeza.siguientes[0]
+
+    def _siguiente(self, nodo):
+        return nodo.siguientes[0]
+
+    def _dato(self, nodo):
+        return nodo.dato
+
+    def _nodo_en(self, posicion):
+        # Cualquier página se alcanza en O(log n) bajando por los anchos; no hace falta el índice de saltos
+        return self._camino_posicion(posicion + 1)[0].siguientes[0]
+
+    @lectura
+    def exportar_estado(self):
+        return {'datos': self.obtener_lista()}
+
+    @escritura
+    def restaurar_estado(self, estado):
+        self.cabeza = NodoSalto(None, None, NIVELES_MAXIMOS)
+        self.niveles = 1
+        self.tamaño = 0
+        self.bytes_nodos = 0
+        self.contados = contador_valores()
+        inspect.unwrap(ListaOrdenada.insertar_varios)(self, estado['datos'])
+        self.version += 1
+
+    def _bytes_contenedor(self):
+        centinela = bytes_instancia(NodoSalto) + sys.getsizeof(self.cabeza.siguientes) + sys.getsizeof(self.cabeza.anchos)
+        return centinela + self.bytes_nodos + self.contados.memoria_bytes()
+
+    @lectura
+    def obtener_lista(self):
+        datos = []
+        actual = self.cabeza.siguientes[0]
+        while actual:
+            datos.append(actual.dato)
+            actual = actual.siguientes[0]
+        return datos
+
+lista_ordenada = ListaOrdenada() # Instancia global
+
+@app.route('/lista-ordenada') # Define la ruta para la lista ordenada
+def mostrar_lista_ordenada():
+    lista_ordenada = obtener_estructura('lista-ordenada') # La instancia de la sesión o la global
+    return render_template('lista_ordenada.html', # Renderiza la plantilla lista_ordenada.html
+                           datos=tabla_paginada(lista_ordenada), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
+                           lista=lista_ordenada) # Pasa la lista como contexto a la plantilla
+
+@app.route('/lista-ordenada/insertar', methods=['POST']) # Define la ruta para insertar elementos en la lista ordenada
+def insertar_lista_ordenada():
+    lista_ordenada = obtener_estructura('lista-ordenada') # La instancia de la sesión o la global
+    valores = [valor.strip() for valor in request.form['valor'].split(',')] # Separa los valores por comas
+    _, tiempo_total, memoria_total = lista_ordenada.insertar_varios(valores) # Inserta todo el lote en una sola operación medida
+    return render_template('lista_ordenada.html', # Renderiza la plantilla lista_ordenada.html
+                           datos=tabla_paginada(lista_ordenada), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
+                           lista=lista_ordenada, # Pasa la lista como contexto a la plantilla
+                           tiempos=f"{tiempo_total:.7f} s", # Tiempo total de ejecución
+                           memorias=f"{memoria_total:.6f} MB") # Memoria total utilizada
+
+@app.route('/lista-ordenada/eliminar', methods=['POST']) # Define la ruta para eliminar elementos de la lista ordenada
+def eliminar_lista_ordenada():
+    lista_ordenada = obtener_estructura('lista-ordenada') # La instancia de la sesión o la global
+    tiempos = [] # Inicializa una lista para almacenar los tiempos
+    memorias = [] # Inicializa una lista para almacenar las memorias
+    for valor in request.form['valor'].split(','): # Recorre los valores separados por comas
+        _, t, m = lista_ordenada.eliminar(valor.strip()) # Llama a la función eliminar y obtiene el tiempo y memoria
+        tiempos.append(t) # Agrega el tiempo a la lista de tiempos
+        memorias.append(m) # Agrega la memoria a la lista de memorias
+    return render_template('lista_ordenada.html', # Renderiza la plantilla lista_ordenada.html
+                           datos=tabla_paginada(lista_ordenada), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
+                           lista=lista_ordenada, # Pasa la lista como contexto a la plantilla
+                           tiempos=f"{sum(tiempos):.7f} s", # Tiempo total de ejecución
+                           memorias=f"{sum(memorias):.6f} MB") # Memoria total utilizada
+
+@app.route('/lista-ordenada/buscar', methods=['POST']) # Define la ruta para buscar un elemento en la lista ordenada
+def buscar_lista_ordenada():
+    lista_ordenada = obtener_estructura('lista-ordenada') # La instancia de la sesión o la global
+    valor = request.form['valor'].strip() # Obtiene el valor a buscar del formulario
+    posicion, tiempo, memoria = lista_ordenada.buscar(valor) # Llama a la función buscar y obtiene la posición, tiempo y memoria
+    mensaje = f'Elemento {"encontrado en posición " + str(posicion) if posicion >= 0 else "no encontrado"}' # Mensaje de búsqueda
+    return render_template('lista_ordenada.html', # Renderiza la plantilla lista_ordenada.html
+                           datos=tabla_paginada(lista_ordenada), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
+                           lista=lista_ordenada, # Pasa la lista como contexto a la plantilla
+                           mensaje_busqueda=mensaje, # Mensaje de búsqueda
+                           tiempos=f"{tiempo:.7f} s", # Tiempo de ejecución
+                           memorias=f"{memoria:.6f} MB") # Memoria utilizada
+
+@app.route('/lista-ordenada/rango', methods=['POST']) # Define la ruta para consultar los valores entre dos extremos
+def rango_lista_ordenada():
+    lista_ordenada = obtener_estructura('lista-ordenada') # La instancia de la sesión o la global
+    minimo = request.form['minimo'].strip() # Extremo inferior (incluido)
+    maximo = request.form['maximo'].strip() # Extremo superior (incluido)
+    valores, tiempo, memoria = lista_ordenada.rango(minimo, maximo) # Obtiene los valores del rango, el tiempo y la memoria
+    mostrados = ', '.join(str(valor) for valor in valores[:50]) # Solo los primeros en el mensaje
+    resto = f' y {len(valores) - 50} más' if len(valores) > 50 else ''
+    mensaje = f'{len(valores)} elementos entre {minimo} y {maximo}' + (f': {mostrados}{resto}' if valores else '') # Mensaje del rango
+    return render_template('lista_ordenada.html', # Renderiza la plantilla lista_ordenada.html
+                           datos=tabla_paginada(lista_ordenada), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
+                           lista=lista_ordenada, # Pasa la lista como contexto a la plantilla
+                           mensaje_busqueda=mensaje, # Mensaje del rango
+                           tiempos=f"{tiempo:.7f} s", # Tiempo de ejecución
+                           memorias=f"{memoria:.6f} MB") # Memoria utilizada
+
 #---------------------------------Lista Enlazada Doble---------------------------------
 
 class NodoDoble:
+    __slots__ = ('dato', 'siguiente', 'anterior')
+
     def __init__(self, dato):
         self.dato = dato
         self.siguiente = None
         self.anterior = None
 
-class ListaEnlazadaDoble:
-    def __init__(self):
+class NodoDobleIndexado(NodoDoble):
+    # Nodo usado en modo índice: el anterior ya existe, solo falta la etiqueta de orden
+    __slots__ = ('etiqueta',)
+
+    def __init__(self, dato):
+        super().__init__(dato)
+        self.etiqueta = 0
+
+class ListaEnlazadaDoble(PaginacionEnlazada, MemoriaContada):
+    def __init__(self, indexada=False):
         self.cabeza = None
         self.ultimo = None
         self.tamaño = 0
+        self.version = 0
+        self.cerrojo = CerrojoLectorEscritor()
+        self.indice = IndiceLista() if indexada else None
+        self.clase_nodo = NodoDobleIndexado if indexada else NodoDoble
+        self.contados = contador_valores()
 
     @benchmark
+    @registrada
     def insertar(self, dato):
-        nuevo_nodo = NodoDoble(dato)
+        nuevo_nodo = self.clase_nodo(dato)
+        self.contados.sumar(dato)
+        if self.indice is not None:
+            self.indice.registrar(nuevo_nodo)
         if not self.cabeza:
             self.cabeza = nuevo_nodo
             self.ultimo = nuevo_nodo
@@ -181,29 +1640,138 @@ class ListaEnlazadaDoble:
             self.ultimo.siguiente = nuevo_nodo
             self.ultimo = nuevo_nodo
         self.tamaño += 1
+        self.version += 1
+
+    @benchmark
+    @registrada
+    def insertar_varios(self, datos):
+        # Enlaza todo el lote en una cadena local y la pega al final de una sola vez
+        clase_nodo, indice = self.clase_nodo, self.indice
+        primero = ultimo = None
+        cantidad = 0
+        for dato in datos:
+            nuevo_nodo = clase_nodo(dato)
+            if primero is None:
+                primero = nuevo_nodo
+            else:
+                nuevo_nodo.anterior = ultimo
+                ultimo.siguiente = nuevo_nodo
+            if indice is not None:
+                indice.registrar(nuevo_nodo)
+            ultimo = nuevo_nodo
+            cantidad += 1
+        if not cantidad:
+            return 0
+        self.contados.sumar_varios(datos_cadena(primero, cantidad))
+        if not self.cabeza:
+            self.cabeza = primero
+        else:
+            primero.anterior = self.ultimo
+            self.ultimo.siguiente = primero
+        self.ultimo = ultimo
+        self.tamaño += cantidad
+        self.version += 1
+        return cantidad
 
     @benchmark
+    @registrada
     def eliminar(self, dato):
         if not self.cabeza:
             return
 
+        if self.indice is not None:
+            actual = self.indice.primero(dato) # O(1): el nodo ya conoce a su anterior
+        else:
+            actual = self.cabeza
+            while actual and actual.dato != dato:
+                actual = actual.siguiente
+
+        if actual:
+            self._desenlazar(actual)
+            self.version += 1
+
+    @benchmark
+    @registrada
+    def eliminar_varios(self, valores, modo='primera'):
+        # Quita todos los valores pedidos en un solo recorrido; retorna {valor: eliminados}
+        criterio = CriterioEliminacion(valores, modo)
+        eliminados = 0
+        if self.indice is not None and criterio.predicado is None:
+            for dato in criterio.cuentas: # Con índice cada valor va directo a sus nodos
+                nodo = self.indice.primero(dato)
+                while nodo is not None and criterio.quitar(dato):
+                    self._desenlazar(nodo)
+                    eliminados += 1
+                    nodo = self.indice.primero(dato)
+        else:
+            quitar = criterio.quitar
+            actual = self.cabeza
+            while actual and criterio.restantes:
+                siguiente = actual.siguiente
+                if quitar(actual.dato):
+                    self._desenlazar(actual)
+                    eliminados += 1
+                actual = siguiente
+        if eliminados:
+            self.version += 1
+        return criterio.cuentas
+
+    def _desenlazar(self, actual):
+        # El nodo conoce a sus dos vecinos: quitarlo no necesita recorrer la lista
+        if actual.anterior:
+            actual.anterior.siguiente = actual.siguiente
+        else:
+            self.cabeza = actual.siguiente
+
+        if actual.siguiente:
+            actual.siguiente.anterior = actual.anterior
+        else:
+            self.ultimo = actual.anterior
+
+        self.contados.restar(actual.dato)
+        self.tamaño -= 1
+        if self.indice is not None:
+            self.indice.retirar(actual)
+            if self.indice.necesita_compactar(self.tamaño):
+                self._reconstruir_indice()
+
+    def _reconstruir_indice(self):
+        self.indice = IndiceLista()
         actual = self.cabeza
-        while actual and actual.dato != dato:
+        while actual:
+            self.indice.registrar(actual)
             actual = actual.siguiente
 
-        if actual:
-            if actual.anterior:
-                actual.anterior.siguiente = actual.siguiente
-            else:
-                self.cabeza = actual.siguiente
+    def _primero(self):
+        return self.cabeza
 
-            if actual.siguiente:
-                actual.siguiente.anterior = actual.anterior
-            else:
-                self.ultimo = actual.anterior
+    def _siguiente(self, nodo):
+        return nodo.siguiente
 
-            self.tamaño -= 1
+    def _dato(self, nodo):
+        return nodo.dato
+
+    @lectura
+    def exportar_estado(self):
+        return {'datos': self.obtener_lista()}
 
+    @escritura
+    def restaurar_estado(self, estado):
+        self.cabeza = self.ultimo = None
+        self.tamaño = 0
+        self.version += 1
+        self.contados = contador_valores()
+        if self.indice is not None:
+            self.indice = IndiceLista()
+        inspect.unwrap(ListaEnlazadaDoble.insertar_varios)(self, estado['datos'])
+
+    def _bytes_contenedor(self):
+        total = self.tamaño * bytes_instancia(self.clase_nodo) + self.contados.memoria_bytes()
+        if self.indice is not None:
+            total += self.indice.memoria_bytes(self.tamaño)
+        return total
+
+    @lectura
     def obtener_lista(self):
         datos = []
         actual = self.cabeza
@@ -213,7 +1781,11 @@ class ListaEnlazadaDoble:
         return datos
 
     @benchmark
+    @lectura
     def buscar(self, dato):
+        if self.indice is not None:
+            nodo = self.indice.primero(dato)
+            return self.indice.posicion(nodo) if nodo else -1
         actual = self.cabeza
         posicion = 0
         while actual:
@@ -223,27 +1795,442 @@ class ListaEnlazadaDoble:
             posicion += 1
         return -1
 
-lista_doble = ListaEnlazadaDoble() # Crea una instancia de la lista enlazada doble
+class ListaEnlazadaDoblePool(PaginacionEnlazada, MemoriaContada):
+    # Misma interfaz que ListaEnlazadaDoble, con los nodos en un PoolNodos doble
+    def __init__(self):
+        self.pool = PoolNodos(doble=True)
+        self.cabeza = VACIO
+        self.ultimo = VACIO
+        self.tamaño = 0
+        self.version = 0
+        self.cerrojo = CerrojoLectorEscritor()
+
+    @benchmark
+    @registrada
+    def insertar(self, dato):
+        nuevo = self.pool.reservar(dato)
+        if self.cabeza == VACIO:
+            self.cabeza = nuevo
+        else:
+            self.pool.anterior[nuevo] = self.ultimo
+            self.pool.siguiente[self.ultimo] = nuevo
+        self.ultimo = nuevo
+        self.tamaño += 1
+        self.version += 1
+
+    @benchmark
+    @registrada
+    def insertar_varios(self, datos):
+        pool = self.pool
+        cantidad = 0
+        for dato in datos:
+            nuevo = pool.reservar(dato)
+            if self.cabeza == VACIO:
+                self.cabeza = nuevo
+            else:
+                pool.anterior[nuevo] = self.ultimo
+                pool.siguiente[self.ultimo] = nuevo
+            self.ultimo = nuevo
+            cantidad += 1
+        self.tamaño += cantidad
+        self.version += 1
+        return cantidad
+
+    @benchmark
+    @registrada
+    def eliminar(self, dato):
+        pool = self.pool
+        actual = self.cabeza
+        while actual != VACIO and pool.datos[actual] != dato:
+            actual = pool.siguiente[actual]
+        if actual == VACIO:
+            return
+        anterior, siguiente = pool.anterior[actual], pool.siguiente[actual]
+        if anterior != VACIO:
+            pool.siguiente[anterior] = siguiente
+        else:
+            self.cabeza = siguiente
+        if siguiente != VACIO:
+            pool.anterior[siguiente] = anterior
+        else:
+            self.ultimo = anterior
+        pool.liberar(actual)
+        self.tamaño -= 1
+        self.version += 1
+
+    @benchmark
+    @registrada
+    def eliminar_varios(self, valores, modo='primera'):
+        # Quita todos los valores pedidos en un solo recorrido; retorna {valor: eliminados}
+        criterio = CriterioEliminacion(valores, modo)
+        quitar = criterio.quitar
+        pool = self.pool
+        datos, enlaces, anteriores = pool.datos, pool.siguiente, pool.anterior
+        previo, actual = VACIO, self.cabeza
+        eliminados = 0
+        while actual != VACIO and criterio.restantes:
+            siguiente = enlaces[actual]
+            if quitar(datos[actual]):
+                if previo == VACIO:
+                    self.cabeza = siguiente
+                else:
+                    enlaces[previo] = siguiente
+                if siguiente == VACIO:
+                    self.ultimo = previo
+                else:
+                    anteriores[siguiente] = previo
+                pool.liberar(actual)
+                eliminados += 1
+            else:
+                previo = actual
+            actual = siguiente
+        if eliminados:
+            self.tamaño -= eliminados
+            self.version += 1
+        return criterio.cuentas
+
+    def _primero(self):
+        return self.cabeza
+
+    def _siguiente(self, nodo):
+        return self.pool.siguiente[nodo]
+
+    def _dato(self, nodo):
+        return self.pool.datos[nodo]
+
+    @lectura
+    def exportar_estado(self):
+        return {'datos': self.obtener_lista()}
+
+    @escritura
+    def restaurar_estado(self, estado):
+        self.pool = PoolNodos(doble=True)
+        self.cabeza = self.ultimo = VACIO
+        self.tamaño = 0
+        self.version += 1
+        inspect.unwrap(ListaEnlazadaDoblePool.insertar_varios)(self, estado['datos'])
+
+    def _bytes_contenedor(self):
+        return self.pool.memoria_bytes()
+
+    @lectura
+    def obtener_lista(self):
+        datos, siguiente = self.pool.datos, self.pool.siguiente
+        resultado = []
+        actual = self.cabeza
+        while actual != VACIO:
+            resultado.append(datos[actual])
+            actual = siguiente[actual]
+        return resultado
+
+    @benchmark
+    @lectura
+    def buscar(self, dato):
+        datos, siguiente = self.pool.datos, self.pool.siguiente
+        actual = self.cabeza
+        posicion = 0
+        while actual != VACIO:
+            if datos[actual] == dato:
+                return posicion
+            actual = siguiente[actual]
+            posicion += 1
+        return -1
+
+CAPACIDAD_BLOQUE = int(os.environ.get('EDL_BLOQUE', '64')) # Valores por bloque de la lista desenrollada
+
+BYTES_LISTA = sys.getsizeof([])
+
+class BloqueDoble:
+    # Nodo de la lista desenrollada: hasta CAPACIDAD_BLOQUE valores seguidos en una lista de Python
+    __slots__ = ('datos', 'siguiente', 'anterior')
+
+    def __init__(self, datos):
+        self.datos = datos
+        self.siguiente = None
+        self.anterior = None
+
+class ListaDobleDesenrollada(MemoriaContada):
+    # Lista doble cuyos nodos guardan bloques de valores (unrolled linked list). Recorrer y buscar saltan
+    # de bloque en bloque y dentro de cada uno usan las operaciones en C de list (in, index, extend);
+    # cada valor cuesta una referencia de 8 bytes en lugar de un NodoDoble. Un bloque que se llena se
+    # parte en dos mitades y uno que queda por debajo de la mitad se fusiona con su vecino o le pide
+    # valores, así llegar a una posición cuesta O(n / capacidad) saltos.
+    def __init__(self, capacidad=None):
+        self.capacidad = max(2, capacidad or CAPACIDAD_BLOQUE)
+        self.cabeza = None
+        self.ultimo = None
+        self.tamaño = 0
+        self.version = 0
+        self.cerrojo = CerrojoLectorEscritor()
+        self.bloques = 0
+        self.contados = contador_valores()
+
+    def _enlazar_despues(self, bloque, nuevo):
+        # Enlaza `nuevo` tras `bloque` (al principio si `bloque` es None)
+        nuevo.anterior = bloque
+        nuevo.siguiente = bloque.siguiente if bloque else self.cabeza
+        if nuevo.siguiente:
+            nuevo.siguiente.anterior = nuevo
+        else:
+            self.ultimo = nuevo
+        if bloque:
+            bloque.siguiente = nuevo
+        else:
+            self.cabeza = nuevo
+        self.bloques += 1
+
+    def _quitar_bloque(self, bloque):
+        if bloque.anterior:
+            bloque.anterior.siguiente = bloque.siguiente
+        else:
+            self.cabeza = bloque.siguiente
+        if bloque.siguiente:
+            bloque.siguiente.anterior = bloque.anterior
+        else:
+            self.ultimo = bloque.anterior
+        self.bloques -= 1
+
+    def _ubicar(self, posicion):
+        # Bloque que contiene la posición (0 <= posicion < tamaño) y el índice dentro de él, entrando
+        # por el extremo más cercano
+        if posicion < self.tamaño // 2:
+            bloque = self.cabeza
+            while posicion >= len(bloque.datos):
+                posicion -= len(bloque.datos)
+                bloque = bloque.siguiente
+            return bloque, posicion
+        restantes = self.tamaño - posicion # Valores desde la posición hasta el final
+        bloque = self.ultimo
+        while restantes > len(bloque.datos):
+            restantes -= len(bloque.datos)
+            bloque = bloque.anterior
+        return bloque, len(bloque.datos) - restantes
+
+    def _reequilibrar(self, bloque):
+        # Tras quitar un valor: el bloque vacío se descarta y el que queda por debajo de la mitad se
+        # fusiona con un vecino si caben juntos o se reparte con él
+        datos = bloque.datos
+        if not datos:
+            self._quitar_bloque(bloque)
+            return
+        if len(datos) >= self.capacidad // 2:
+            return
+        primero, segundo = bloque, bloque.siguiente
+        if segundo is None:
+            primero, segundo = bloque.anterior, bloque
+            if primero is None:
+                return # Es el único bloque
+        if len(primero.datos) + len(segundo.datos) <= self.capacidad:
+            primero.datos.extend(segundo.datos)
+            self._quitar_bloque(segundo)
+        else:
+            juntos = primero.datos + segundo.datos
+            mitad = len(juntos) // 2
+            primero.datos, segundo.datos = juntos[:mitad], juntos[mitad:]
+
+    @benchmark
+    @registrada
+    def insertar(self, dato):
+        if self.ultimo is not None and len(self.ultimo.datos) < self.capacidad:
+            self.ultimo.datos.append(dato)
+        else:
+            self._enlazar_despues(self.ultimo, BloqueDoble([dato]))
+        self.contados.sumar(dato)
+        self.tamaño += 1
+        self.version += 1
+
+    @benchmark
+    @registrada
+    def insertar_varios(self, datos):
+        # Completa el último bloque y corta el resto del lote en bloques llenos
+        datos = list(datos)
+        if not datos:
+            return 0
+        capacidad = self.capacidad
+        inicio = 0
+        if self.ultimo is not None:
+            inicio = capacidad - len(self.ultimo.datos)
+            self.ultimo.datos.extend(datos[:inicio])
+        for corte in range(inicio, len(datos), capacidad):
+            self._enlazar_despues(self.ultimo, BloqueDoble(datos[corte:corte + capacidad]))
+        self.contados.sumar_varios(datos)
+        self.tamaño += len(datos)
+        self.version += 1
+        return len(datos)
+
+    @benchmark
+    @registrada
+    def insertar_en(self, posicion, dato):
+        # Las posiciones fuera de rango se ajustan al principio o al final
+        posicion = max(0, min(posicion, self.tamaño))
+        if posicion == self.tamaño:
+            inspect.unwrap(ListaDobleDesenrollada.insertar)(self, dato)
+            return posicion
+        bloque, i = self._ubicar(posicion)
+        bloque.datos.insert(i, dato)
+        if len(bloque.datos) > self.capacidad:
+            mitad = len(bloque.datos) // 2
+            self._enlazar_despues(bloque, BloqueDoble(bloque.datos[mitad:]))
+            del bloque.datos[mitad:]
+        self.contados.sumar(dato)
+        self.tamaño += 1
+        self.version += 1
+        return posicion
+
+    @benchmark
+    @registrada
+    def eliminar(self, dato):
+        bloque = self.cabeza
+        while bloque:
+            if dato in bloque.datos:
+                quitado = bloque.datos.pop(bloque.datos.index(dato)) # El objeto guardado, que puede no ser `dato`
+                self.contados.restar(quitado)
+                self._reequilibrar(bloque)
+                self.tamaño -= 1
+                self.version += 1
+                return
+            bloque = bloque.siguiente
+
+    @benchmark
+    @registrada
+    def eliminar_varios(self, valores, modo='primera'):
+        # Filtra cada bloque con una comprensión y después compacta los bloques que quedaron cortos;
+        # retorna {valor: eliminados}
+        criterio = CriterioEliminacion(valores, modo)
+        quitar = criterio.quitar
+        quitados = []
+        guardar = quitados.append # Retorna None: lo quitado se guarda y queda fuera de la comprensión
+        eliminados = 0
+        bloque = self.cabeza
+        while bloque and criterio.restantes:
+            quedan = [dato for dato in bloque.datos if not quitar(dato) or guardar(dato)]
+            if len(quedan) != len(bloque.datos):
+                eliminados += len(bloque.datos) - len(quedan)
+                bloque.datos = quedan
+            bloque = bloque.siguiente
+        if not eliminados:
+            return criterio.cuentas
+        self.contados.restar_varios(quitados)
+        # Segunda pasada: se descartan los bloques vacíos y cada bloque corto absorbe a los siguientes
+        # mientras quepan o, si no, se reparte con el siguiente
+        mitad = self.capacidad // 2
+        bloque = self.cabeza
+        while bloque:
+            siguiente = bloque.siguiente
+            if not bloque.datos:
+                self._quitar_bloque(bloque)
+            elif len(bloque.datos) < mitad:
+                while siguiente and len(bloque.datos) + len(siguiente.datos) <= self.capacidad:
+                    bloque.datos.extend(siguiente.datos)
+                    self._quitar_bloque(siguiente)
+                    siguiente = bloque.siguiente
+                if siguiente and len(bloque.datos) < mitad:
+                    juntos = bloque.datos + siguiente.datos
+                    corte = len(juntos) // 2
+                    bloque.datos, siguiente.datos = juntos[:corte], juntos[corte:]
+            bloque = siguiente
+        if self.ultimo:
+            self._reequilibrar(self.ultimo) # El último no tiene siguiente: se apoya en su anterior
+        self.tamaño -= eliminados
+        self.version += 1
+        return criterio.cuentas
+
+    @benchmark
+    @registrada
+    def eliminar_en(self, posicion):
+        # Retorna el valor quitado o None si la posición no existe
+        if not 0 <= posicion < self.tamaño:
+            return None
+        bloque, i = self._ubicar(posicion)
+        dato = bloque.datos.pop(i)
+        self.contados.restar(dato)
+        self._reequilibrar(bloque)
+        self.tamaño -= 1
+        self.version += 1
+        return dato
+
+    @lectura
+    def pagina(self, inicio, cantidad, desde=None):
+        # El cursor de la página siguiente es el par (bloque, índice) donde continuar
+        fin = min(inicio + cantidad, self.tamaño)
+        if inicio >= fin:
+            return [], None
+        bloque, i = self._ubicar(inicio) if desde is None else desde
+        datos = []
+        while True:
+            trozo = bloque.datos[i:i + (fin - inicio) - len(datos)]
+            datos.extend(trozo)
+            i += len(trozo)
+            if len(datos) == fin - inicio:
+                break
+            bloque, i = bloque.siguiente, 0
+        if fin == self.tamaño:
+            return datos, None
+        return datos, ((bloque, i) if i < len(bloque.datos) else (bloque.siguiente, 0))
+
+    @lectura
+    def exportar_estado(self):
+        return {'datos': self.obtener_lista()}
+
+    @escritura
+    def restaurar_estado(self, estado):
+        self.cabeza = self.ultimo = None
+        self.tamaño = 0
+        self.bloques = 0
+        self.contados = contador_valores()
+        self.version += 1 # También si el estado está vacío y insertar_varios no cambia nada
+        inspect.unwrap(ListaDobleDesenrollada.insertar_varios)(self, estado['datos'])
+
+    def _bytes_contenedor(self):
+        # Cada bloque con su lista vacía más una referencia por valor; no cuenta el espacio que las
+        # listas de los bloques reservan de más al crecer con append
+        return self.bloques * (bytes_instancia(BloqueDoble) + BYTES_LISTA) + 8 * self.tamaño + self.contados.memoria_bytes()
+
+    @lectura
+    def obtener_lista(self):
+        datos = []
+        bloque = self.cabeza
+        while bloque:
+            datos.extend(bloque.datos)
+            bloque = bloque.siguiente
+        return datos
+
+    @benchmark
+    @lectura
+    def buscar(self, dato):
+        bloque = self.cabeza
+        posicion = 0
+        while bloque:
+            if dato in bloque.datos:
+                return posicion + bloque.datos.index(dato)
+            posicion += len(bloque.datos)
+            bloque = bloque.siguiente
+        return -1
+
+if ALMACENAMIENTO == 'pool':
+    lista_doble = ListaEnlazadaDoblePool()
+elif ALMACENAMIENTO == 'bloques':
+    lista_doble = ListaDobleDesenrollada()
+else:
+    lista_doble = ListaEnlazadaDoble(indexada=INDICE_LISTAS) # Crea una instancia de la lista enlazada doble
 
 # Rutas para Lista Doble
 @app.route('/lista-doble') # Define la ruta para la lista doble
 def mostrar_lista_doble():
-    datos = lista_doble.obtener_lista() # Obtiene los datos de la lista
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor']) # Crea un DataFrame de pandas con los datos
+    lista_doble = obtener_estructura('lista-doble') # La instancia de la sesión o la global
     return render_template('lista_doble.html', # Renderiza la plantilla lista_doble.html
-                         datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+                         datos=tabla_paginada(lista_doble), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
                          lista=lista_doble) # Pasa la lista como contexto a la plantilla
 
 @app.route('/lista-doble/buscar', methods=['POST']) # Define la ruta para buscar un elemento en la lista doble
 def buscar_doble():
+    lista_doble = obtener_estructura('lista-doble') # La instancia de la sesión o la global
     valor = request.form['valor'] # Obtiene el valor a buscar del formulario
     posicion, tiempo, memoria = lista_doble.buscar(valor) # Llama a la función buscar y obtiene la posición, tiempo y memoria
-    datos = lista_doble.obtener_lista() # Obtiene los datos de la lista
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor']) # Crea un DataFrame de pandas con los datos
     mensaje = f'Elemento {"encontrado en posición " + str(posicion) if posicion >= 0 else "no encontrado"}' # Mensaje de búsqueda
     return render_template( # Renderiza la plantilla lista_doble.html
         'lista_doble.html',
-        datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+        datos=tabla_paginada(lista_doble), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
         mensaje_busqueda=mensaje, # Mensaje de búsqueda
         lista=lista_doble, # Pasa la lista como contexto a la plantilla
         tiempos=f"{tiempo:.7f} s", # Tiempo de ejecución
@@ -252,20 +2239,13 @@ def buscar_doble():
 
 @app.route('/lista-doble/insertar', methods=['POST']) # Define la ruta para insertar un elemento en la lista doble
 def insertar_doble():
+    lista_doble = obtener_estructura('lista-doble') # La instancia de la sesión o la global
     valor = request.form['valor'] # Obtiene el valor a insertar del formulario
-    tiempos = [] # Inicializa una lista para almacenar los tiempos
-    memorias = [] # Inicializa una lista para almacenar las memorias
-    for valor in valor.split(','): # Recorre los valores separados por comas
-        _, t, m = lista_doble.insertar(valor.strip()) # Llama a la función insertar y obtiene el tiempo y memoria
-        tiempos.append(t) # Agrega el tiempo a la lista de tiempos
-        memorias.append(m) # Agrega la memoria a la lista de memorias
-    tiempo_total = sum(tiempos) # Suma todos los tiempos
-    memoria_total = sum(memorias) # Suma todas las memorias
-    datos = lista_doble.obtener_lista() # Obtiene los datos de la lista
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor']) # Crea un DataFrame de pandas con los datos
+    valores = [val.strip() for val in valor.split(',')] # Separa los valores por comas
+    _, tiempo_total, memoria_total = lista_doble.insertar_varios(valores) # Inserta todo el lote en una sola operación medida
     return render_template( # Renderiza la plantilla lista_doble.html
         'lista_doble.html',
-        datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+        datos=tabla_paginada(lista_doble), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
         lista=lista_doble, # Pasa la lista como contexto a la plantilla
         tiempos=f"{tiempo_total:.7f} s", # Tiempo total de ejecución
         memorias=f"{memoria_total:.6f} MB" # Memoria total utilizada
@@ -273,59 +2253,167 @@ def insertar_doble():
 
 @app.route('/lista-doble/eliminar', methods=['POST']) # Define la ruta para eliminar un elemento de la lista doble
 def eliminar_doble():
+    lista_doble = obtener_estructura('lista-doble') # La instancia de la sesión o la global
     valor = request.form['valor'] # Obtiene el valor a eliminar del formulario
-    tiempos = [] # Inicializa una lista para almacenar los tiempos
-    memorias = [] # Inicializa una lista para almacenar las memorias
-    for valor in valor.split(','): # Recorre los valores separados por comas
-        _, t, m = lista_doble.eliminar(valor.strip()) # Llama a la función eliminar y obtiene el tiempo y memoria
-        tiempos.append(t) # Agrega el tiempo a la lista de tiempos
-        memorias.append(m) # Agrega la memoria a la lista de memorias
-    tiempo_total = sum(tiempos) # Suma todos los tiempos
-    memoria_total = sum(memorias) # Suma todas las memorias
-    datos = lista_doble.obtener_lista() # Obtiene los datos de la lista
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor']) # Crea un DataFrame de pandas con los datos
+    valores = [val.strip() for val in valor.split(',')] # Separa los valores por comas
+    modo = 'todas' if request.form.get('modo') == 'todas' else 'primera' # Primera aparición de cada valor o todas
+    cuentas, tiempo_total, memoria_total = lista_doble.eliminar_varios(valores, modo) # Quita todo el lote en un solo recorrido
     return render_template( # Renderiza la plantilla lista_doble.html
         'lista_doble.html',
-        datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+        datos=tabla_paginada(lista_doble), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
+        mensaje_busqueda=mensaje_eliminacion(cuentas), # Cuántos se eliminaron y qué valores no estaban
         lista=lista_doble, # Pasa la lista como contexto a la plantilla
         tiempos=f"{tiempo_total:.7f} s", # Tiempo total de ejecución
         memorias=f"{memoria_total:.6f} MB" # Memoria total utilizada
     )
 
+def _entero_formulario(campo, minimo, defecto=None):
+    # Entero del formulario o `defecto` si el campo viene vacío; ValueError si no es un entero >= minimo
+    texto = request.form.get(campo, '').strip()
+    if not texto:
+        return defecto
+    valor = int(texto)
+    if valor < minimo:
+        raise ValueError(f"'{campo}' debe ser al menos {minimo}")
+    return valor
+
+def _posicion_formulario():
+    # Posición del formulario o None si no es un entero no negativo (la API JSON responde 400 igual)
+    try:
+        return _entero_formulario('posicion', 0)
+    except ValueError:
+        return None
+
+@app.route('/lista-doble/insertar-en', methods=['POST']) # Inserta un valor en una posición (solo la lista desenrollada)
+def insertar_en_doble():
+    lista_doble = obtener_estructura('lista-doble') # La instancia de la sesión o la global
+    if not hasattr(lista_doble, 'insertar_en'):
+        return render_template('lista_doble.html', datos=tabla_paginada(lista_doble), lista=lista_doble,
+                               mensaje_busqueda='Insertar por posición requiere EDL_ALMACENAMIENTO=bloques')
+    posicion = _posicion_formulario() # Posición donde queda el nuevo valor
+    if posicion is None:
+        return render_template('lista_doble.html', datos=tabla_paginada(lista_doble), lista=lista_doble,
+                               mensaje_busqueda='La posición debe ser un entero no negativo'), 400
+    valor = request.form['valor'].strip() # Obtiene el valor a insertar del formulario
+    posicion, tiempo, memoria = lista_doble.insertar_en(posicion, valor) # Inserta y obtiene la posición real, tiempo y memoria
+    return render_template('lista_doble.html', # Renderiza la plantilla lista_doble.html
+                           datos=tabla_paginada(lista_doble), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
+                           mensaje_busqueda=f'{valor} insertado en la posición {posicion}', # Mensaje de inserción
+                           lista=lista_doble, # Pasa la lista como contexto a la plantilla
+                           tiempos=f"{tiempo:.7f} s", # Tiempo de ejecución
+                           memorias=f"{memoria:.6f} MB") # Memoria utilizada
+
+@app.route('/lista-doble/eliminar-en', methods=['POST']) # Elimina el valor de una posición (solo la lista desenrollada)
+def eliminar_en_doble():
+    lista_doble = obtener_estructura('lista-doble') # La instancia de la sesión o la global
+    if not hasattr(lista_doble, 'eliminar_en'):
+        return render_template('lista_doble.html', datos=tabla_paginada(lista_doble), lista=lista_doble,
+                               mensaje_busqueda='Eliminar por posición requiere EDL_ALMACENAMIENTO=bloques')
+    posicion = _posicion_formulario() # Posición del valor a eliminar
+    if posicion is None:
+        return render_template('lista_doble.html', datos=tabla_paginada(lista_doble), lista=lista_doble,
+                               mensaje_busqueda='La posición debe ser un entero no negativo'), 400
+    dato, tiempo, memoria = lista_doble.eliminar_en(posicion) # Elimina y obtiene el valor, tiempo y memoria
+    mensaje = f'Elemento eliminado: {dato}' if dato is not None else f'No existe la posición {posicion}' # Mensaje de eliminación
+    return render_template('lista_doble.html', # Renderiza la plantilla lista_doble.html
+                           datos=tabla_paginada(lista_doble), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
+                           mensaje_busqueda=mensaje, # Mensaje de eliminación
+                           lista=lista_doble, # Pasa la lista como contexto a la plantilla
+                           tiempos=f"{tiempo:.7f} s", # Tiempo de ejecución
+                           memorias=f"{memoria:.6f} MB") # Memoria utilizada
+
 #-----------------------Lista Circular---------------------------------
 
-class ListaCircular:
-    def __init__(self):
+class ListaCircular(PaginacionEnlazada, MemoriaContada):
+    def __init__(self, indexada=False):
         self.cabeza = None
         self.ultimo = None
         self.tamaño = 0
+        self.version = 0
+        self.cerrojo = CerrojoLectorEscritor()
+        self.indice = IndiceLista() if indexada else None
+        self.clase_nodo = NodoIndexado if indexada else Nodo
+        self.indice_desordenado = False # rotar e insertar_despues dejan el índice fuera del orden del círculo
+        self.cursor = None # Nodo del cursor persistente (avanzar, rotar, insertar_despues, eliminar_en_cursor)
+        self.previo_cursor = None # Su predecesor: quitar el nodo del cursor no necesita recorrer el círculo
+        self.contados = contador_valores()
 
     @benchmark
+    @registrada
     def insertar(self, dato):
-        nuevo_nodo = Nodo(dato)
+        nuevo_nodo = self.clase_nodo(dato)
+        self.contados.sumar(dato)
+        if self.indice is not None:
+            self.indice.registrar(nuevo_nodo)
         if not self.cabeza:
             self.cabeza = nuevo_nodo
             self.ultimo = nuevo_nodo
             nuevo_nodo.siguiente = nuevo_nodo
+            if self.indice is not None:
+                nuevo_nodo.previo = nuevo_nodo
         else:
             nuevo_nodo.siguiente = self.cabeza
             self.ultimo.siguiente = nuevo_nodo
+            if self.indice is not None:
+                nuevo_nodo.previo = self.ultimo
+                self.cabeza.previo = nuevo_nodo
             self.ultimo = nuevo_nodo
         self.tamaño += 1
+        self.version += 1
+        self._cursor_tras_insertar()
+
+    @benchmark
+    @registrada
+    def insertar_varios(self, datos):
+        # Enlaza todo el lote en una cadena local y la pega al final de una sola vez
+        clase_nodo, indice = self.clase_nodo, self.indice
+        primero = ultimo = None
+        cantidad = 0
+        for dato in datos:
+            nuevo_nodo = clase_nodo(dato)
+            if primero is None:
+                primero = nuevo_nodo
+            else:
+                ultimo.siguiente = nuevo_nodo
+                if indice is not None:
+                    nuevo_nodo.previo = ultimo
+            if indice is not None:
+                indice.registrar(nuevo_nodo)
+            ultimo = nuevo_nodo
+            cantidad += 1
+        if not cantidad:
+            return 0
+        self.contados.sumar_varios(datos_cadena(primero, cantidad))
+        if not self.cabeza:
+            self.cabeza = primero
+        else:
+            self.ultimo.siguiente = primero
+            if indice is not None:
+                primero.previo = self.ultimo
+        ultimo.siguiente = self.cabeza # Cierra el círculo
+        if indice is not None:
+            self.cabeza.previo = ultimo
+        self.ultimo = ultimo
+        self.tamaño += cantidad
+        self.version += 1
+        self._cursor_tras_insertar()
+        return cantidad
 
     @benchmark
+    @registrada
     def eliminar(self, dato):
         if not self.cabeza:
             return
 
+        if self.indice is not None:
+            self._ordenar_indice()
+            nodo = self.indice.primero(dato)
+            if nodo:
+                self._desenlazar_indexado(nodo)
+            return
+
         if self.cabeza.dato == dato:
-            if self.tamaño == 1:
-                self.cabeza = None
-                self.ultimo = None
-            else:
-                self.cabeza = self.cabeza.siguiente
-                self.ultimo.siguiente = self.cabeza
-            self.tamaño -= 1
+            self._desenlazar(self.cabeza, self.ultimo)
             return
 
         actual = self.cabeza
@@ -333,11 +2421,242 @@ class ListaCircular:
             actual = actual.siguiente
 
         if actual.siguiente != self.cabeza:
-            if actual.siguiente == self.ultimo:
-                self.ultimo = actual
-            actual.siguiente = actual.siguiente.siguiente
-            self.tamaño -= 1
+            self._desenlazar(actual.siguiente, actual)
+
+    def _desenlazar(self, nodo, previo):
+        # Quita `nodo` conociendo su predecesor, en O(1)
+        siguiente = nodo.siguiente
+        if self.tamaño == 1:
+            self.cabeza = None
+            self.ultimo = None
+        else:
+            previo.siguiente = siguiente
+            if nodo is self.cabeza:
+                self.cabeza = siguiente
+            if nodo is self.ultimo:
+                self.ultimo = previo
+        self.contados.restar(nodo.dato)
+        self.tamaño -= 1
+        self.version += 1
+        self._cursor_tras_quitar(nodo, previo, siguiente)
+
+    @benchmark
+    @registrada
+    def eliminar_varios(self, valores, modo='primera'):
+        # Quita todos los valores pedidos en una sola vuelta al círculo; retorna {valor: eliminados}
+        criterio = CriterioEliminacion(valores, modo)
+        if not self.cabeza:
+            return criterio.cuentas
+        if self.indice is not None:
+            self._ordenar_indice()
+            _eliminar_indexado(self, criterio)
+            return criterio.cuentas
+        quitar, restar = criterio.quitar, self.contados.restar
+        previo, actual = self.ultimo, self.cabeza # El predecesor de la cabeza es el último
+        eliminados = 0
+        for _ in range(self.tamaño):
+            if not criterio.restantes:
+                break
+            siguiente = actual.siguiente
+            if quitar(actual.dato):
+                previo.siguiente = siguiente # Si era la cabeza, esto también actualiza el enlace del último
+                if actual is self.cabeza:
+                    self.cabeza = siguiente
+                if actual is self.ultimo:
+                    self.ultimo = previo
+                self._cursor_tras_quitar(actual, previo, siguiente)
+                restar(actual.dato)
+                eliminados += 1
+            else:
+                previo = actual
+            actual = siguiente
+        if eliminados:
+            if eliminados == self.tamaño:
+                self.cabeza = self.ultimo = None
+                self.cursor = self.previo_cursor = None
+            self.tamaño -= eliminados
+            self.version += 1
+        return criterio.cuentas
+
+    def _desenlazar_indexado(self, nodo):
+        # El predecesor guardado en cada nodo (la cabeza apunta al último) evita recorrer el círculo
+        previo, siguiente = nodo.previo, nodo.siguiente
+        if self.tamaño == 1:
+            self.cabeza = None
+            self.ultimo = None
+        else:
+            previo.siguiente = siguiente
+            siguiente.previo = previo
+            if nodo is self.cabeza:
+                self.cabeza = siguiente
+            if nodo is self.ultimo:
+                self.ultimo = previo
+        self.indice.retirar(nodo)
+        self.contados.restar(nodo.dato)
+        self.tamaño -= 1
+        self.version += 1
+        self._cursor_tras_quitar(nodo, previo, siguiente)
+        if self.indice.necesita_compactar(self.tamaño):
+            self._reconstruir_indice()
+
+    def _reconstruir_indice(self):
+        # Se arma aparte y se publica entero: los lectores pueden llegar aquí desde _ordenar_indice
+        indice = IndiceLista()
+        actual = self.cabeza
+        for _ in range(self.tamaño):
+            indice.registrar(actual)
+            actual = actual.siguiente
+        self.indice = indice
+        self.indice_desordenado = False
+
+    def _ordenar_indice(self):
+        # El índice asume que las etiquetas siguen el círculo desde la cabeza y que cada valor guarda sus
+        # nodos en ese orden. rotar e insertar_despues lo rompen sin recorrer nada; se reconstruye la
+        # próxima vez que se usa. Varios lectores pueden llegar a la vez, así que se serializa aparte.
+        if self.indice_desordenado:
+            with cerrojo_indices:
+                if self.indice_desordenado:
+                    self._reconstruir_indice()
+
+    def _cursor_tras_insertar(self):
+        # Lo insertado al final queda entre el último y la cabeza: si el cursor está en la cabeza, su
+        # predecesor pasa a ser el nuevo último. En una lista que estaba vacía el cursor empieza en la cabeza.
+        if self.cursor is None or self.cursor is self.cabeza:
+            self.cursor, self.previo_cursor = self.cabeza, self.ultimo
+
+    def _cursor_tras_quitar(self, nodo, previo, siguiente):
+        # Tras desenlazar `nodo`: si era el cursor, este pasa al siguiente; si era su predecesor, lo
+        # reemplaza el predecesor de `nodo`
+        if self.cabeza is None:
+            self.cursor = self.previo_cursor = None
+        elif nodo is self.cursor:
+            self.cursor = siguiente
+        elif nodo is self.previo_cursor:
+            self.previo_cursor = previo
+
+    def _mover_cursor(self, k):
+        for _ in range(k % self.tamaño): # Da la vuelta: nunca más de tamaño - 1 pasos
+            self.previo_cursor, self.cursor = self.cursor, self.cursor.siguiente
+
+    def _quitar_cursor(self):
+        nodo = self.cursor
+        if self.indice is not None:
+            self._desenlazar_indexado(nodo) # El nodo indexado ya conoce a su predecesor
+        else:
+            self._desenlazar(nodo, self.previo_cursor)
+        return nodo.dato
 
+    @benchmark
+    @registrada
+    def avanzar(self, k=1):
+        # Mueve el cursor k pasos y retorna su dato (None si la lista está vacía)
+        if self.cursor is None:
+            return None
+        self._mover_cursor(k)
+        return self.cursor.dato
+
+    @benchmark
+    @registrada
+    def rotar(self):
+        # La cabeza pasa a ser el nodo del cursor reasignando solo cabeza y último: O(1)
+        if self.cursor is None or self.cursor is self.cabeza:
+            return
+        self.cabeza, self.ultimo = self.cursor, self.previo_cursor
+        self.version += 1
+        if self.indice is not None:
+            self.indice_desordenado = True
+
+    @benchmark
+    @registrada
+    def insertar_despues(self, dato):
+        # Inserta tras el cursor sin moverlo; tras el último (o en una lista vacía) es insertar al final
+        if self.cursor is None or self.cursor is self.ultimo:
+            inspect.unwrap(ListaCircular.insertar)(self, dato)
+            return
+        nuevo_nodo = self.clase_nodo(dato)
+        self.contados.sumar(dato)
+        siguiente = self.cursor.siguiente
+        nuevo_nodo.siguiente = siguiente
+        self.cursor.siguiente = nuevo_nodo
+        if self.indice is not None:
+            nuevo_nodo.previo = self.cursor
+            siguiente.previo = nuevo_nodo
+            self.indice.registrar(nuevo_nodo)
+            self.indice_desordenado = True
+        self.tamaño += 1
+        self.version += 1
+
+    @benchmark
+    @registrada
+    def eliminar_en_cursor(self):
+        # Quita el nodo del cursor en O(1) y el cursor pasa al siguiente. Retorna el dato quitado
+        if self.cursor is None:
+            return None
+        return self._quitar_cursor()
+
+    @benchmark
+    @registrada
+    def eliminar_cada_k(self, k, cantidad=None):
+        # Josephus: contando el cursor como 1, quita el k-ésimo nodo y sigue contando desde el siguiente,
+        # dando vueltas, hasta quitar `cantidad` nodos (por defecto una vuelta: tamaño // k). Cada
+        # eliminación avanza k - 1 pasos desde la anterior y nunca recorre desde la cabeza, así que una
+        # vuelta es O(n). Retorna los datos quitados en orden; el cursor queda tras el último quitado
+        if self.cursor is None or k < 1:
+            return []
+        if cantidad is None:
+            cantidad = self.tamaño // k
+        quitados = []
+        for _ in range(min(cantidad, self.tamaño)):
+            self._mover_cursor(k - 1)
+            quitados.append(self._quitar_cursor())
+        return quitados
+
+    @lectura
+    def ver_cursor(self):
+        return self.cursor.dato if self.cursor is not None else None
+
+    def _primero(self):
+        return self.cabeza
+
+    def _siguiente(self, nodo):
+        return nodo.siguiente
+
+    def _dato(self, nodo):
+        return nodo.dato
+
+    @lectura
+    def exportar_estado(self):
+        datos = []
+        cursor = 0 # Posición del cursor contada desde la cabeza
+        actual = self.cabeza
+        for posicion in range(self.tamaño):
+            if actual is self.cursor:
+                cursor = posicion
+            datos.append(actual.dato)
+            actual = actual.siguiente
+        return {'datos': datos, 'cursor': cursor}
+
+    @escritura
+    def restaurar_estado(self, estado):
+        self.cabeza = self.ultimo = None
+        self.cursor = self.previo_cursor = None
+        self.tamaño = 0
+        self.version += 1
+        self.contados = contador_valores()
+        if self.indice is not None:
+            self.indice = IndiceLista()
+            self.indice_desordenado = False
+        inspect.unwrap(ListaCircular.insertar_varios)(self, estado['datos'])
+        if self.cursor is not None:
+            self._mover_cursor(estado.get('cursor', 0)) # Los estados guardados antes del cursor no lo traen
+
+    def _bytes_contenedor(self):
+        total = self.tamaño * bytes_instancia(self.clase_nodo) + self.contados.memoria_bytes()
+        if self.indice is not None:
+            total += self.indice.memoria_bytes(self.tamaño)
+        return total
+
+    @lectura
     def obtener_lista(self):
         if not self.cabeza:
             return []
@@ -351,9 +2670,14 @@ class ListaCircular:
         return datos
 
     @benchmark
+    @lectura
     def buscar(self, dato):
         if not self.cabeza:
             return -1
+        if self.indice is not None:
+            self._ordenar_indice()
+            nodo = self.indice.primero(dato)
+            return self.indice.posicion(nodo) if nodo else -1
         actual = self.cabeza
         posicion = 0
         while True:
@@ -365,48 +2689,285 @@ class ListaCircular:
                 break
         return -1
 
-lista_circular = ListaCircular() # Crea una instancia de la lista circular
+class ListaCircularPool(PaginacionEnlazada, MemoriaContada):
+    # Misma interfaz que ListaCircular, con los nodos en un PoolNodos (el último enlaza con la cabeza)
+    def __init__(self):
+        self.pool = PoolNodos()
+        self.cabeza = VACIO
+        self.ultimo = VACIO
+        self.tamaño = 0
+        self.version = 0
+        self.cerrojo = CerrojoLectorEscritor()
+        self.cursor = VACIO
+        self.previo_cursor = VACIO
+
+    @benchmark
+    @registrada
+    def insertar(self, dato):
+        nuevo = self.pool.reservar(dato)
+        if self.cabeza == VACIO:
+            self.cabeza = nuevo
+        else:
+            self.pool.siguiente[self.ultimo] = nuevo
+        self.pool.siguiente[nuevo] = self.cabeza
+        self.ultimo = nuevo
+        self.tamaño += 1
+        self.version += 1
+        self._cursor_tras_insertar()
+
+    @benchmark
+    @registrada
+    def insertar_varios(self, datos):
+        pool = self.pool
+        cantidad = 0
+        for dato in datos:
+            nuevo = pool.reservar(dato)
+            if self.cabeza == VACIO:
+                self.cabeza = nuevo
+            else:
+                pool.siguiente[self.ultimo] = nuevo
+            self.ultimo = nuevo
+            cantidad += 1
+        if cantidad:
+            pool.siguiente[self.ultimo] = self.cabeza # Cierra el círculo
+            self._cursor_tras_insertar()
+        self.tamaño += cantidad
+        self.version += 1
+        return cantidad
+
+    @benchmark
+    @registrada
+    def eliminar(self, dato):
+        if self.cabeza == VACIO:
+            return
+        pool = self.pool
+        previo, actual = self.ultimo, self.cabeza
+        for _ in range(self.tamaño):
+            if pool.datos[actual] == dato:
+                break
+            previo, actual = actual, pool.siguiente[actual]
+        else:
+            return
+        self._desenlazar(actual, previo)
+
+    def _desenlazar(self, nodo, previo):
+        # Quita `nodo` conociendo su predecesor, en O(1); retorna su dato
+        pool = self.pool
+        dato, siguiente = pool.datos[nodo], pool.siguiente[nodo]
+        if self.tamaño == 1:
+            self.cabeza = self.ultimo = VACIO
+        else:
+            pool.siguiente[previo] = siguiente
+            if nodo == self.cabeza:
+                self.cabeza = siguiente
+            if nodo == self.ultimo:
+                self.ultimo = previo
+        pool.liberar(nodo)
+        self.tamaño -= 1
+        self.version += 1
+        self._cursor_tras_quitar(nodo, previo, siguiente)
+        return dato
+
+    def _cursor_tras_insertar(self):
+        # Mismas reglas que ListaCircular: el cursor en la cabeza cambia de predecesor con cada inserción al final
+        if self.cursor == VACIO or self.cursor == self.cabeza:
+            self.cursor, self.previo_cursor = self.cabeza, self.ultimo
+
+    def _cursor_tras_quitar(self, nodo, previo, siguiente):
+        if self.cabeza == VACIO:
+            self.cursor = self.previo_cursor = VACIO
+        elif nodo == self.cursor:
+            self.cursor = siguiente
+        elif nodo == self.previo_cursor:
+            self.previo_cursor = previo
+
+    def _mover_cursor(self, k):
+        siguiente = self.pool.siguiente
+        for _ in range(k % self.tamaño):
+            self.previo_cursor, self.cursor = self.cursor, siguiente[self.cursor]
+
+    @benchmark
+    @registrada
+    def avanzar(self, k=1):
+        if self.cursor == VACIO:
+            return None
+        self._mover_cursor(k)
+        return self.pool.datos[self.cursor]
+
+    @benchmark
+    @registrada
+    def rotar(self):
+        if self.cursor == VACIO or self.cursor == self.cabeza:
+            return
+        self.cabeza, self.ultimo = self.cursor, self.previo_cursor
+        self.version += 1
+
+    @benchmark
+    @registrada
+    def insertar_despues(self, dato):
+        if self.cursor == VACIO or self.cursor == self.ultimo:
+            inspect.unwrap(ListaCircularPool.insertar)(self, dato)
+            return
+        pool = self.pool
+        nuevo = pool.reservar(dato)
+        pool.siguiente[nuevo] = pool.siguiente[self.cursor]
+        pool.siguiente[self.cursor] = nuevo
+        self.tamaño += 1
+        self.version += 1
+
+    @benchmark
+    @registrada
+    def eliminar_en_cursor(self):
+        if self.cursor == VACIO:
+            return None
+        return self._desenlazar(self.cursor, self.previo_cursor)
+
+    @benchmark
+    @registrada
+    def eliminar_cada_k(self, k, cantidad=None):
+        if self.cursor == VACIO or k < 1:
+            return []
+        if cantidad is None:
+            cantidad = self.tamaño // k
+        quitados = []
+        for _ in range(min(cantidad, self.tamaño)):
+            self._mover_cursor(k - 1)
+            quitados.append(self._desenlazar(self.cursor, self.previo_cursor))
+        return quitados
+
+    @lectura
+    def ver_cursor(self):
+        return self.pool.datos[self.cursor] if self.cursor != VACIO else None
+
+    @benchmark
+    @registrada
+    def eliminar_varios(self, valores, modo='primera'):
+        # Quita todos los valores pedidos en una sola vuelta al círculo; retorna {valor: eliminados}
+        criterio = CriterioEliminacion(valores, modo)
+        if self.cabeza == VACIO:
+            return criterio.cuentas
+        quitar = criterio.quitar
+        pool = self.pool
+        datos, enlaces = pool.datos, pool.siguiente
+        previo, actual = self.ultimo, self.cabeza
+        eliminados = 0
+        for _ in range(self.tamaño):
+            if not criterio.restantes:
+                break
+            siguiente = enlaces[actual]
+            if quitar(datos[actual]):
+                enlaces[previo] = siguiente
+                if actual == self.cabeza:
+                    self.cabeza = siguiente
+                if actual == self.ultimo:
+                    self.ultimo = previo
+                pool.liberar(actual)
+                self._cursor_tras_quitar(actual, previo, siguiente)
+                eliminados += 1
+            else:
+                previo = actual
+            actual = siguiente
+        if eliminados:
+            if eliminados == self.tamaño:
+                self.cabeza = self.ultimo = VACIO
+                self.cursor = self.previo_cursor = VACIO
+            self.tamaño -= eliminados
+            self.version += 1
+        return criterio.cuentas
+
+    def _primero(self):
+        return self.cabeza
+
+    def _siguiente(self, nodo):
+        return self.pool.siguiente[nodo]
+
+    def _dato(self, nodo):
+        return self.pool.datos[nodo]
+
+    @lectura
+    def exportar_estado(self):
+        datos, siguiente = self.pool.datos, self.pool.siguiente
+        resultado = []
+        cursor = 0
+        actual = self.cabeza
+        for posicion in range(self.tamaño):
+            if actual == self.cursor:
+                cursor = posicion
+            resultado.append(datos[actual])
+            actual = siguiente[actual]
+        return {'datos': resultado, 'cursor': cursor}
+
+    @escritura
+    def restaurar_estado(self, estado):
+        self.pool = PoolNodos()
+        self.cabeza = self.ultimo = VACIO
+        self.cursor = self.previo_cursor = VACIO
+        self.tamaño = 0
+        self.version += 1
+        inspect.unwrap(ListaCircularPool.insertar_varios)(self, estado['datos'])
+        if self.cursor != VACIO:
+            self._mover_cursor(estado.get('cursor', 0))
+
+    def _bytes_contenedor(self):
+        return self.pool.memoria_bytes()
+
+    @lectura
+    def obtener_lista(self):
+        datos, siguiente = self.pool.datos, self.pool.siguiente
+        resultado = []
+        actual = self.cabeza
+        for _ in range(self.tamaño):
+            resultado.append(datos[actual])
+            actual = siguiente[actual]
+        return resultado
+
+    @benchmark
+    @lectura
+    def buscar(self, dato):
+        datos, siguiente = self.pool.datos, self.pool.siguiente
+        actual = self.cabeza
+        for posicion in range(self.tamaño):
+            if datos[actual] == dato:
+                return posicion
+            actual = siguiente[actual]
+        return -1
+
+if ALMACENAMIENTO == 'pool':
+    lista_circular = ListaCircularPool()
+else:
+    lista_circular = ListaCircular(indexada=INDICE_LISTAS) # Crea una instancia de la lista circular
 
 @app.route('/lista-circular') # Define la ruta para la lista circular
 def mostrar_lista_circular():
-    datos = lista_circular.obtener_lista() # Obtiene los datos de la lista
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor']) # Crea un DataFrame de pandas con los datos
+    lista_circular = obtener_estructura('lista-circular') # La instancia de la sesión o la global
     return render_template('lista_circular.html', # Renderiza la plantilla lista_circular.html
-                         datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+                         datos=tabla_paginada(lista_circular), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
                          lista=lista_circular) # Pasa la lista como contexto a la plantilla
 
 @app.route('/lista-circular/buscar', methods=['POST']) # Define la ruta para buscar un elemento en la lista circular
 def buscar_circular():
+    lista_circular = obtener_estructura('lista-circular') # La instancia de la sesión o la global
     valor = request.form['valor'] # Obtiene el valor a buscar del formulario
     posicion, tiempo, memoria = lista_circular.buscar(valor) # Llama a la función buscar y obtiene la posición, tiempo y memoria
-    datos = lista_circular.obtener_lista() # Obtiene los datos de la lista
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor']) # Crea un DataFrame de pandas con los datos
     mensaje = f'Elemento {"encontrado en posición " + str(posicion) if posicion >= 0 else "no encontrado"}' # Mensaje de búsqueda
     return render_template( # Renderiza la plantilla lista_circular.html
         'lista_circular.html',
-        datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+        datos=tabla_paginada(lista_circular), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
         mensaje_busqueda=mensaje, # Mensaje de búsqueda
         lista=lista_circular, # Pasa la lista como contexto a la plantilla
         tiempos=f"{tiempo:.7f} s", # Tiempo de ejecución
         memorias=f"{memoria:.6f} MB" # Memoria utilizada
-    )
-
-@app.route('/lista-circular/insertar', methods=['POST']) # Define la ruta para insertar un elemento en la lista circular
-def insertar_circular():
-    valor = request.form['valor'] # Obtiene el valor a insertar del formulario
-    tiempos = [] # Inicializa una lista para almacenar los tiempos
-    memorias = [] # Inicializa una lista para almacenar las memorias
-    for valor in valor.split(','): # Recorre los valores separados por comas
-        _, t, m = lista_circular.insertar(valor.strip()) # Llama a la función insertar y obtiene el tiempo y memoria
-        tiempos.append(t) # Agrega el tiempo a la lista de tiempos
-        memorias.append(m) # Agrega la memoria a la lista de memorias
-    tiempo_total = sum(tiempos) # Suma todos los tiempos
-    memoria_total = sum(memorias) # Suma todas las memorias
-    datos = lista_circular.obtener_lista() # Obtiene los datos de la lista
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor']) # Crea un DataFrame de pandas con los datos
+    )
+
+@app.route('/lista-circular/insertar', methods=['POST']) # Define la ruta para insertar un elemento en la lista circular
+def insertar_circular():
+    lista_circular = obtener_estructura('lista-circular') # La instancia de la sesión o la global
+    valor = request.form['valor'] # Obtiene el valor a insertar del formulario
+    valores = [val.strip() for val in valor.split(',')] # Separa los valores por comas
+    _, tiempo_total, memoria_total = lista_circular.insertar_varios(valores) # Inserta todo el lote en una sola operación medida
     return render_template( # Renderiza la plantilla lista_circular.html
         'lista_circular.html',
-        datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+        datos=tabla_paginada(lista_circular), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
         lista=lista_circular, # Pasa la lista como contexto a la plantilla
         tiempos=f"{tiempo_total:.7f} s", # Tiempo total de ejecución
         memorias=f"{memoria_total:.6f} MB" # Memoria total utilizada
@@ -414,54 +2975,158 @@ def insertar_circular():
 
 @app.route('/lista-circular/eliminar', methods=['POST']) # Define la ruta para eliminar un elemento de la lista circular
 def eliminar_circular():
+    lista_circular = obtener_estructura('lista-circular') # La instancia de la sesión o la global
     valor = request.form['valor'] # Obtiene el valor a eliminar del formulario
-    tiempos = [] # Inicializa una lista para almacenar los tiempos
-    memorias = [] # Inicializa una lista para almacenar las memorias
-    for valor in valor.split(','): # Recorre los valores separados por comas
-        _, t, m = lista_circular.eliminar(valor.strip()) # Llama a la función eliminar y obtiene el tiempo y memoria
-        tiempos.append(t) # Agrega el tiempo a la lista de tiempos
-        memorias.append(m) # Agrega la memoria a la lista de memorias
-    tiempo_total = sum(tiempos) # Suma todos los tiempos
-    memoria_total = sum(memorias) # Suma todas las memorias
-    datos = lista_circular.obtener_lista() # Obtiene los datos de la lista
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor']) # Crea un DataFrame de pandas con los datos
+    valores = [val.strip() for val in valor.split(',')] # Separa los valores por comas
+    modo = 'todas' if request.form.get('modo') == 'todas' else 'primera' # Primera aparición de cada valor o todas
+    cuentas, tiempo_total, memoria_total = lista_circular.eliminar_varios(valores, modo) # Quita todo el lote en un solo recorrido
     return render_template( # Renderiza la plantilla lista_circular.html
         'lista_circular.html',
-        datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+        datos=tabla_paginada(lista_circular), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
+        mensaje_busqueda=mensaje_eliminacion(cuentas), # Cuántos se eliminaron y qué valores no estaban
         lista=lista_circular, # Pasa la lista como contexto a la plantilla
         tiempos=f"{tiempo_total:.7f} s", # Tiempo total de ejecución
         memorias=f"{memoria_total:.6f} MB" # Memoria total utilizada
     )
 
+@app.route('/lista-circular/avanzar', methods=['POST']) # Mueve el cursor k pasos alrededor del círculo
+def avanzar_circular():
+    lista_circular = obtener_estructura('lista-circular') # La instancia de la sesión o la global
+    try:
+        k = _entero_formulario('k', 0, defecto=1) # Pasos a avanzar, uno si el campo viene vacío
+    except ValueError:
+        return render_template('lista_circular.html', datos=tabla_paginada(lista_circular), lista=lista_circular,
+                               mensaje_busqueda='Los pasos deben ser un entero no negativo'), 400
+    dato, tiempo, memoria = lista_circular.avanzar(k) # Avanza y obtiene el dato del cursor, tiempo y memoria
+    mensaje = f'Cursor en: {dato}' if dato is not None else 'La lista está vacía' # Mensaje del cursor
+    return render_template('lista_circular.html', # Renderiza la plantilla lista_circular.html
+                           datos=tabla_paginada(lista_circular), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
+                           mensaje_busqueda=mensaje, # Mensaje del cursor
+                           lista=lista_circular, # Pasa la lista como contexto a la plantilla
+                           tiempos=f"{tiempo:.7f} s", # Tiempo de ejecución
+                           memorias=f"{memoria:.6f} MB") # Memoria utilizada
+
+@app.route('/lista-circular/rotar', methods=['POST']) # La cabeza pasa a ser el nodo del cursor
+def rotar_circular():
+    lista_circular = obtener_estructura('lista-circular') # La instancia de la sesión o la global
+    _, tiempo, memoria = lista_circular.rotar() # Rota en O(1) y obtiene tiempo y memoria
+    return render_template('lista_circular.html', # Renderiza la plantilla lista_circular.html
+                           datos=tabla_paginada(lista_circular), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
+                           mensaje_busqueda=f'Nueva cabeza: {lista_circular.ver_cursor()}', # Mensaje de rotación
+                           lista=lista_circular, # Pasa la lista como contexto a la plantilla
+                           tiempos=f"{tiempo:.7f} s", # Tiempo de ejecución
+                           memorias=f"{memoria:.6f} MB") # Memoria utilizada
+
+@app.route('/lista-circular/insertar-despues', methods=['POST']) # Inserta un valor justo después del cursor
+def insertar_despues_circular():
+    lista_circular = obtener_estructura('lista-circular') # La instancia de la sesión o la global
+    valor = request.form['valor'].strip() # Obtiene el valor a insertar del formulario
+    _, tiempo, memoria = lista_circular.insertar_despues(valor) # Inserta tras el cursor y obtiene tiempo y memoria
+    return render_template('lista_circular.html', # Renderiza la plantilla lista_circular.html
+                           datos=tabla_paginada(lista_circular), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
+                           mensaje_busqueda=f'{valor} insertado después de {lista_circular.ver_cursor()}', # Mensaje de inserción
+                           lista=lista_circular, # Pasa la lista como contexto a la plantilla
+                           tiempos=f"{tiempo:.7f} s", # Tiempo de ejecución
+                           memorias=f"{memoria:.6f} MB") # Memoria utilizada
+
+@app.route('/lista-circular/eliminar-cursor', methods=['POST']) # Quita el nodo del cursor
+def eliminar_cursor_circular():
+    lista_circular = obtener_estructura('lista-circular') # La instancia de la sesión o la global
+    dato, tiempo, memoria = lista_circular.eliminar_en_cursor() # Elimina y obtiene el valor, tiempo y memoria
+    mensaje = f'Elemento eliminado: {dato}' if dato is not None else 'La lista está vacía' # Mensaje de eliminación
+    return render_template('lista_circular.html', # Renderiza la plantilla lista_circular.html
+                           datos=tabla_paginada(lista_circular), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
+                           mensaje_busqueda=mensaje, # Mensaje de eliminación
+                           lista=lista_circular, # Pasa la lista como contexto a la plantilla
+                           tiempos=f"{tiempo:.7f} s", # Tiempo de ejecución
+                           memorias=f"{memoria:.6f} MB") # Memoria utilizada
+
+@app.route('/lista-circular/eliminar-cada-k', methods=['POST']) # Josephus: quita cada k-ésimo nodo desde el cursor
+def eliminar_cada_k_circular():
+    lista_circular = obtener_estructura('lista-circular') # La instancia de la sesión o la global
+    try:
+        k = _entero_formulario('k', 1) # Cada cuántos nodos se elimina uno
+        cantidad = _entero_formulario('cantidad', 0) # Sin cantidad, una vuelta
+    except ValueError:
+        k = None
+    if k is None:
+        return render_template('lista_circular.html', datos=tabla_paginada(lista_circular), lista=lista_circular,
+                               mensaje_busqueda='k debe ser un entero mayor o igual que 1 y la cantidad, si se indica, un entero no negativo'), 400
+    quitados, tiempo, memoria = lista_circular.eliminar_cada_k(k, cantidad) # Elimina y obtiene los valores en orden
+    mensaje = f'Eliminados en orden: {", ".join(map(str, quitados))}' if quitados else 'No se eliminó ningún elemento' # Mensaje de eliminación
+    return render_template('lista_circular.html', # Renderiza la plantilla lista_circular.html
+                           datos=tabla_paginada(lista_circular), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
+                           mensaje_busqueda=mensaje, # Mensaje de eliminación
+                           lista=lista_circular, # Pasa la lista como contexto a la plantilla
+                           tiempos=f"{tiempo:.7f} s", # Tiempo de ejecución
+                           memorias=f"{memoria:.6f} MB") # Memoria utilizada
+
 #-----------------------Pila basada en lista enlazada-----------------------------
 
-class PilaLista:
+class PilaLista(PaginacionEnlazada, MemoriaContada):
     def __init__(self):
         self.tope = None
         self.tamaño = 0
+        self.version = 0
+        self.cerrojo = CerrojoLectorEscritor()
+        self.contados = contador_valores()
 
     @benchmark
+    @registrada
     def push(self, dato):
         nuevo_nodo = Nodo(dato)
         nuevo_nodo.siguiente = self.tope
         self.tope = nuevo_nodo
+        self.contados.sumar(dato)
         self.tamaño += 1
+        self.version += 1
 
     @benchmark
+    @registrada
     def pop(self):
         if not self.tope:
             return None
         dato = self.tope.dato
         self.tope = self.tope.siguiente
+        self.contados.restar(dato)
         self.tamaño -= 1
+        self.version += 1
         return dato
 
     @benchmark
+    @lectura
     def peek(self):
         if not self.tope:
             return None
         return self.tope.dato
 
+    def _primero(self):
+        return self.tope
+
+    def _siguiente(self, nodo):
+        return nodo.siguiente
+
+    def _dato(self, nodo):
+        return nodo.dato
+
+    @lectura
+    def exportar_estado(self):
+        return {'datos': self.obtener_pila()} # Del tope a la base
+
+    @escritura
+    def restaurar_estado(self, estado):
+        self.tope = None
+        self.tamaño = 0
+        self.version += 1
+        self.contados = contador_valores()
+        push = inspect.unwrap(PilaLista.push)
+        for dato in reversed(estado['datos']):
+            push(self, dato)
+
+    def _bytes_contenedor(self):
+        return self.tamaño * bytes_instancia(Nodo) + self.contados.memoria_bytes()
+
+    @lectura
     def obtener_pila(self):
         datos = []
         actual = self.tope
@@ -470,20 +3135,97 @@ class PilaLista:
             actual = actual.siguiente
         return datos
 
-pila_lista = PilaLista() # Crea una instancia de la pila basada en lista enlazada
+class PilaListaPool(PaginacionEnlazada, MemoriaContada):
+    # Misma interfaz que PilaLista, con los nodos en un PoolNodos
+    def __init__(self):
+        self.pool = PoolNodos()
+        self.tope = VACIO
+        self.tamaño = 0
+        self.version = 0
+        self.cerrojo = CerrojoLectorEscritor()
+
+    @benchmark
+    @registrada
+    def push(self, dato):
+        nuevo = self.pool.reservar(dato)
+        self.pool.siguiente[nuevo] = self.tope
+        self.tope = nuevo
+        self.tamaño += 1
+        self.version += 1
+
+    @benchmark
+    @registrada
+    def pop(self):
+        if self.tope == VACIO:
+            return None
+        tope = self.tope
+        dato = self.pool.datos[tope]
+        self.tope = self.pool.siguiente[tope]
+        self.pool.liberar(tope)
+        self.tamaño -= 1
+        self.version += 1
+        return dato
+
+    @benchmark
+    @lectura
+    def peek(self):
+        if self.tope == VACIO:
+            return None
+        return self.pool.datos[self.tope]
+
+    def _primero(self):
+        return self.tope
+
+    def _siguiente(self, nodo):
+        return self.pool.siguiente[nodo]
+
+    def _dato(self, nodo):
+        return self.pool.datos[nodo]
+
+    @lectura
+    def exportar_estado(self):
+        return {'datos': self.obtener_pila()} # Del tope a la base
+
+    @escritura
+    def restaurar_estado(self, estado):
+        self.pool = PoolNodos()
+        self.tope = VACIO
+        self.tamaño = 0
+        self.version += 1
+        push = inspect.unwrap(PilaListaPool.push)
+        for dato in reversed(estado['datos']):
+            push(self, dato)
+
+    def _bytes_contenedor(self):
+        return self.pool.memoria_bytes()
+
+    @lectura
+    def obtener_pila(self):
+        datos, siguiente = self.pool.datos, self.pool.siguiente
+        resultado = []
+        actual = self.tope
+        while actual != VACIO:
+            resultado.append(datos[actual])
+            actual = siguiente[actual]
+        return resultado
+
+if ALMACENAMIENTO == 'pool':
+    pila_lista = PilaListaPool()
+else:
+    pila_lista = PilaLista() # Crea una instancia de la pila basada en lista enlazada
 
 @app.route('/pila-lista')
 def mostrar_pila_lista():
-    datos = pila_lista.obtener_pila() # Obtiene los datos de la pila
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor']) # Crea un DataFrame de pandas con los datos
+    pila_lista = obtener_estructura('pila-lista') # La instancia de la sesión o la global
     return render_template( # Renderiza la plantilla pila_lista.html
         'pila_lista.html',
-        datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+        datos=tabla_paginada(pila_lista), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
         lista=pila_lista, # Pasa la lista como contexto a la plantilla
     )
 
 @app.route('/pila-lista/push', methods=['POST']) # Define la ruta para insertar un elemento en la pila
 def push_pila_lista():
+    pila_lista = obtener_estructura('pila-lista') # La instancia de la sesión o la global
     valor = request.form['valor'] # Obtiene el valor a insertar del formulario
     tiempos = [] # Inicializa una lista para almacenar los tiempos
     memorias = [] # Inicializa una lista para almacenar las memorias
@@ -494,11 +3236,9 @@ def push_pila_lista():
     tiempo_total = sum(tiempos) # Suma todos los tiempos
     memoria_total = sum(memorias) # Suma todas las memorias
 
-    datos = pila_lista.obtener_pila() # Obtiene los datos de la pila
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor']) # Crea un DataFrame de pandas con los datos
     return render_template( # Renderiza la plantilla pila_lista.html
         'pila_lista.html',
-        datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+        datos=tabla_paginada(pila_lista), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
         lista=pila_lista, # Pasa la lista como contexto a la plantilla
         tiempos=f"{tiempo_total:.7f} s", # Tiempo total de ejecución
         memorias=f"{memoria_total:.6f} MB" # Memoria total utilizada
@@ -506,14 +3246,13 @@ def push_pila_lista():
 
 @app.route('/pila-lista/pop', methods=['POST']) # Define la ruta para eliminar un elemento de la pila
 def pop_pila_lista():
+    pila_lista = obtener_estructura('pila-lista') # La instancia de la sesión o la global
     dato, tiempo, memoria = pila_lista.pop() # Llama a la función pop y obtiene el dato, tiempo y memoria
     mensaje = f'Elemento extraído: {dato}' if dato else 'Pila vacía' # Mensaje de extracción
 
-    datos = pila_lista.obtener_pila() # Obtiene los datos de la pila
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor']) # Crea un DataFrame de pandas con los datos
     return render_template( # Renderiza la plantilla pila_lista.html
         'pila_lista.html',
-        datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+        datos=tabla_paginada(pila_lista), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
         lista=pila_lista, # Pasa la lista como contexto a la plantilla
         mensaje_busqueda=mensaje, # Mensaje de extracción
         tiempos=f"{tiempo:.7f} s", # Tiempo de ejecución
@@ -522,40 +3261,273 @@ def pop_pila_lista():
 
 @app.route('/pila-lista/peek', methods=['POST']) # Define la ruta para ver el elemento en la parte superior de la pila
 def peek_pila_lista():
+    pila_lista = obtener_estructura('pila-lista') # La instancia de la sesión o la global
     dato, tiempo, memoria = pila_lista.peek() # Llama a la función peek y obtiene el dato, tiempo y memoria
     mensaje = f'Elemento en el tope: {dato}' if dato else 'Pila vacía' # Mensaje de vista
 
-    datos = pila_lista.obtener_pila() # Obtiene los datos de la pila
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor']) # Crea un DataFrame de pandas con los datos
     return render_template( # Renderiza la plantilla pila_lista.html
         'pila_lista.html',
-        datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+        datos=tabla_paginada(pila_lista), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
         lista=pila_lista, # Pasa la lista como contexto a la plantilla
         mensaje_busqueda=mensaje, # Mensaje de vista
         tiempos=f"{tiempo:.7f} s", # Tiempo de ejecución
         memorias=f"{memoria:.6f} MB" # Memoria utilizada
     )
 
+#-------------------------------Búsqueda vectorizada---------------------------------
+
+np = None # numpy se importa en la primera búsqueda sobre una pila o cola de arreglo
+
+def _numpy():
+    global np
+    if np is None:
+        import numpy as np
+    return np
+
+cerrojo_espejos = threading.Lock() # Los lectores comparten el cerrojo de lectura: crear un espejo se serializa aparte
+
+class EspejoColumnar:
+    # Copia en columna de los items de una pila o cola de arreglo. Cada valor distinto recibe un código
+    # entero (codificación por diccionario) y la columna guarda el código de cada ranura en la misma
+    # posición física que items, así una búsqueda es una pasada de numpy sobre enteros en lugar de un
+    # bucle de Python que compara valores.
+    def __init__(self, items):
+        self.codigos = {} # valor -> código
+        self.valores = [] # código -> valor (incluye valores que ya salieron de la estructura)
+        _numpy()
+        self.columna = np.empty(max(16, len(items)), dtype=np.int32)
+        self.escribir(0, items)
+
+    def _codificar(self, datos):
+        codigos, valores = self.codigos, self.valores
+        resultado = []
+        for dato in datos:
+            codigo = codigos.get(dato)
+            if codigo is None:
+                codigo = codigos[dato] = len(valores)
+                valores.append(dato)
+            resultado.append(codigo)
+        return resultado
+
+    def _reservar(self, fin):
+        # Crece al doble si la columna no llega hasta `fin`
+        if fin > len(self.columna):
+            columna = np.empty(max(fin, 2 * len(self.columna)), dtype=np.int32)
+            columna[:len(self.columna)] = self.columna
+            self.columna = columna
+
+    def escribir(self, inicio, datos):
+        # Copia los códigos de `datos` a partir de la ranura `inicio`
+        codigos = self._codificar(datos)
+        self._reservar(inicio + len(codigos))
+        self.columna[inicio:inicio + len(codigos)] = codigos
+
+    def escribir_uno(self, i, dato):
+        # El caso de push y encolar, sin listas intermedias
+        codigo = self.codigos.get(dato)
+        if codigo is None:
+            codigo = self.codigos[dato] = len(self.valores)
+            self.valores.append(dato)
+        if i >= len(self.columna):
+            self._reservar(i + 1)
+        self.columna[i] = codigo
+
+    def descartar_inicio(self, cantidad, longitud):
+        # Sigue a `del items[:cantidad]` de la cola simple
+        self.columna[:longitud - cantidad] = self.columna[cantidad:longitud]
+
+    def reordenar(self, tramos, capacidad):
+        # Sigue a _reubicar de la cola circular: los tramos del frente al final pasan al principio
+        columna = np.empty(max(16, capacidad), dtype=np.int32)
+        juntos = np.concatenate([self.columna[inicio:fin] for inicio, fin in tramos])
+        columna[:len(juntos)] = juntos
+        self.columna = columna
+
+    def memoria_bytes(self):
+        # La columna y los dos diccionarios de códigos. Los valores que ya salieron de la estructura y
+        # el espejo aún conserva no se cuentan
+        return self.columna.nbytes + sys.getsizeof(self.codigos) + sys.getsizeof(self.valores)
+
+class BusquedaColumnar:
+    # Búsquedas de las pilas y colas de arreglo sobre un EspejoColumnar. El espejo se crea en la primera
+    # búsqueda y desde ahí cada operación que escribe en items lo actualiza con _sincronizar. Cada clase
+    # indica con _tramos() qué rebanadas físicas de items forman la estructura, en orden lógico (en la
+    # cola circular son dos cuando da la vuelta).
+    espejo = None
+    invertida = False # La pila numera desde el tope: la posición 0 es el último de items
+
+    def _sincronizar(self, i, dato):
+        self.espejo.escribir_uno(i, dato)
+        if len(self.espejo.valores) > 2 * self.tamaño + 1024:
+            self.espejo = None # Sobran códigos de valores que ya salieron: la próxima búsqueda recodifica
+
+    def _sincronizar_varios(self, inicio, datos):
+        self.espejo.escribir(inicio, datos)
+        if len(self.espejo.valores) > 2 * self.tamaño + 1024:
+            self.espejo = None
+
+    def _bytes_espejo(self):
+        espejo = self.espejo
+        return espejo.memoria_bytes() if espejo is not None else 0
+
+    def _espejo(self):
+        espejo = self.espejo
+        if espejo is None:
+            with cerrojo_espejos:
+                if self.espejo is None:
+                    self.espejo = EspejoColumnar(self.items)
+                espejo = self.espejo
+        return espejo
+
+    def _coincidencias(self, espejo, codigos):
+        # Posiciones lógicas (de menor a mayor) cuyas ranuras tienen alguno de los códigos, y el código de cada una
+        partes, codigos_partes = [], []
+        desplazamiento = 0
+        for inicio, fin in self._tramos():
+            tramo = espejo.columna[inicio:fin]
+            indices = np.flatnonzero(tramo == codigos[0] if len(codigos) == 1 else np.isin(tramo, codigos))
+            partes.append(indices + desplazamiento)
+            codigos_partes.append(tramo[indices])
+            desplazamiento += fin - inicio
+        posiciones = np.concatenate(partes) if partes else np.empty(0, dtype=np.int64)
+        encontrados = np.concatenate(codigos_partes) if codigos_partes else np.empty(0, dtype=np.int32)
+        if self.invertida:
+            return self.tamaño - 1 - posiciones[::-1], encontrados[::-1]
+        return posiciones, encontrados
+
+    def _por_valor(self, valores, espejo, solo_cantidad=False):
+        # {valor: posiciones} o {valor: cantidad} con una sola pasada sobre la columna
+        pedidos = {valor: espejo.codigos.get(valor) for valor in valores}
+        codigos = [codigo for codigo in pedidos.values() if codigo is not None]
+        if not codigos:
+            return {valor: (0 if solo_cantidad else []) for valor in pedidos}
+        posiciones, encontrados = self._coincidencias(espejo, codigos)
+        resultado = {}
+        for valor, codigo in pedidos.items():
+            coincide = encontrados == codigo if codigo is not None else None
+            if solo_cantidad:
+                resultado[valor] = int(np.count_nonzero(coincide)) if coincide is not None else 0
+            else:
+                resultado[valor] = posiciones[coincide].tolist() if coincide is not None else []
+        return resultado
+
+    @benchmark
+    @lectura
+    def buscar_todos(self, valores):
+        # Todas las posiciones de cada valor pedido: {valor: [posiciones]}
+        return self._por_valor(list(valores), self._espejo())
+
+    @benchmark
+    @lectura
+    def contar(self, valores):
+        # Apariciones de cada valor pedido: {valor: cantidad}
+        return self._por_valor(list(valores), self._espejo(), solo_cantidad=True)
+
+    @benchmark
+    @lectura
+    def buscar_prefijo(self, prefijo):
+        # Posiciones de los textos que empiezan por `prefijo`: {valor: [posiciones]}. Solo se recorre
+        # el diccionario de valores distintos para elegir los códigos
+        espejo = self._espejo()
+        candidatos = [valor for valor in espejo.valores if isinstance(valor, str) and valor.startswith(prefijo)]
+        return {valor: posiciones for valor, posiciones in self._por_valor(candidatos, espejo).items() if posiciones}
+
+POSICIONES_MOSTRADAS = 20 # Posiciones por valor en el mensaje de las vistas
+
+def buscar_en_arreglo(estructura):
+    # Formulario de búsqueda de pila-arreglo, cola-simple y cola-circular: todas las posiciones de uno o
+    # varios valores separados por comas, cuántas veces aparece cada uno o los valores con un prefijo.
+    # Retorna (mensaje, tiempo, memoria)
+    if not hasattr(estructura, 'buscar_todos'):
+        return 'Esta estructura no admite búsquedas', 0.0, 0.0 # La cola en memoria compartida
+    modo = request.form.get('modo', 'posiciones')
+    texto = request.form['valor'].strip()
+    if modo == 'prefijo':
+        resultado, tiempo, memoria = estructura.buscar_prefijo(texto)
+        if not resultado:
+            return f'Ningún valor empieza por {texto}', tiempo, memoria
+    else:
+        buscar = estructura.contar if modo == 'contar' else estructura.buscar_todos
+        resultado, tiempo, memoria = buscar([val.strip() for val in texto.split(',')])
+    partes = []
+    for valor, encontrado in resultado.items():
+        if modo == 'contar':
+            partes.append(f'{valor}: {encontrado} apariciones')
+        elif not encontrado:
+            partes.append(f'{valor}: no encontrado')
+        else:
+            muestra = ', '.join(map(str, encontrado[:POSICIONES_MOSTRADAS]))
+            resto = f' y {len(encontrado) - POSICIONES_MOSTRADAS} más' if len(encontrado) > POSICIONES_MOSTRADAS else ''
+            partes.append(f'{valor}: posiciones {muestra}{resto}')
+    return ' · '.join(partes), tiempo, memoria
+
 #-----------------------Pila basada en arreglo-----------------------------
 
-class PilaArreglo:
+class PilaArreglo(BusquedaColumnar, MemoriaContada):
+    invertida = True
+
     def __init__(self):
         self.items = []
         self.tamaño = 0
+        self.version = 0
+        self.cerrojo = CerrojoLectorEscritor()
+        self.contados = contador_valores()
 
     @benchmark
+    @registrada
     def push(self, dato):
         self.items.append(dato)
+        self.contados.sumar(dato)
         self.tamaño += 1
+        self.version += 1
+        if self.espejo is not None:
+            self._sincronizar(self.tamaño - 1, dato)
 
     @benchmark
+    @registrada
+    def push_varios(self, datos):
+        # Apila todo el lote con una sola extensión del arreglo; el último valor queda en el tope
+        antes = self.tamaño
+        self.items.extend(datos)
+        cantidad = len(self.items) - antes
+        if not cantidad:
+            return 0
+        nuevos = self.items[antes:]
+        self.contados.sumar_varios(nuevos)
+        self.tamaño += cantidad
+        self.version += 1
+        if self.espejo is not None:
+            self._sincronizar_varios(antes, nuevos)
+        return cantidad
+
+    @benchmark
+    @registrada
     def pop(self):
         if self.esta_vacia():
             return None
         self.tamaño -= 1
-        return self.items.pop()
+        self.version += 1
+        dato = self.items.pop()
+        self.contados.restar(dato)
+        return dato
+
+    @benchmark
+    @registrada
+    def pop_varios(self, k):
+        # Saca hasta k elementos con una sola rebanada. Retorna del tope hacia abajo, como k llamadas a pop
+        k = min(k, self.tamaño)
+        if k <= 0:
+            return []
+        datos = self.items[-k:]
+        del self.items[-k:]
+        self.contados.restar_varios(datos)
+        datos.reverse()
+        self.tamaño -= k
+        self.version += 1
+        return datos
 
     @benchmark
+    @lectura
     def peek(self):
         if self.esta_vacia():
             return None
@@ -564,48 +3536,262 @@ class PilaArreglo:
     def esta_vacia(self):
         return self.tamaño == 0
 
+    @lectura
+    def pagina(self, inicio, cantidad, desde=None):
+        # El tope es la posición 0: la página es una rebanada invertida, sin copiar toda la pila
+        fin = min(inicio + cantidad, self.tamaño)
+        if inicio >= fin:
+            return [], None
+        datos = self.items[self.tamaño - fin:self.tamaño - inicio]
+        datos.reverse()
+        return datos, (fin if fin < self.tamaño else None)
+
+    @lectura
+    def exportar_estado(self):
+        return {'datos': self.items[:]} # De la base al tope
+
+    @escritura
+    def restaurar_estado(self, estado):
+        self.items = list(estado['datos'])
+        self.tamaño = len(self.items)
+        self.version += 1
+        self.espejo = None
+        self.contados = contador_valores()
+        self.contados.sumar_varios(self.items)
+
+    def _tramos(self):
+        return [(0, self.tamaño)]
+
+    def _bytes_contenedor(self):
+        # La lista de referencias con su sobreasignación, el espejo de búsqueda si existe y los valores
+        return sys.getsizeof(self.items) + self._bytes_espejo() + self.contados.memoria_bytes()
+
+    @lectura
+    def obtener_pila(self):
+        # Iterador del tope a la base, sin copiar la pila. Solo es coherente mientras quien lo recorre
+        # tiene el cerrojo de lectura; la API usa copiar_pila
+        return reversed(self.items)
+
+    @lectura
+    def copiar_pila(self):
+        return self.items[::-1] # Copia del tope a la base hecha con el cerrojo tomado
+
+#-----------------------Pila tipada-----------------------------
+
+# Con EDL_PILA_TIPO=entero o real la pila de arreglo guarda los números dentro de un array contiguo, 8 bytes
+# por elemento, en lugar de una lista de referencias a objetos int o float (8 bytes más 24 a 32 del objeto).
+TIPOS_PILA = {'entero': ('q', 'int64'), 'real': ('d', 'float64')} # tipo -> (código de array, dtype de numpy)
+PILA_TIPO = os.environ.get('EDL_PILA_TIPO', 'objetos')
+if PILA_TIPO != 'objetos' and PILA_TIPO not in TIPOS_PILA:
+    raise ValueError(f"EDL_PILA_TIPO debe ser 'objetos', 'entero' o 'real', no '{PILA_TIPO}'")
+CAPACIDAD_MINIMA_PILA = 16
+LIMITE_ENTERO = 2 ** 63 # Los enteros de la pila tipada son de 64 bits con signo
+
+def convertir_numero(dato, tipo):
+    # El número que representa `dato` en una pila de ese tipo, o None si no lo es. '3.5' no es un entero
+    # y 3.0 sí; los textos de los formularios se convierten
+    try:
+        if tipo == 'real':
+            return float(dato)
+        if isinstance(dato, float):
+            if not dato.is_integer():
+                return None
+            dato = int(dato)
+        numero = int(dato)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return numero if -LIMITE_ENTERO <= numero < LIMITE_ENTERO else None
+
+class NumerosTipados:
+    # Hace de diccionario valor -> código para BusquedaColumnar: en la pila tipada el código es el número
+    def __init__(self, tipo):
+        self.tipo = tipo
+
+    def get(self, valor):
+        return convertir_numero(valor, self.tipo)
+
+class EspejoTipado:
+    # El espejo de la pila tipada no copia nada: la columna es el propio array visto por numpy. Se crea
+    # en cada búsqueda, así que nunca hay que mantenerlo al día
+    def __init__(self, pila):
+        _numpy()
+        self.columna = np.frombuffer(pila.items, dtype=TIPOS_PILA[pila.tipo][1])
+        self.codigos = NumerosTipados(pila.tipo)
+        self.tamaño = pila.tamaño
+
+    @property
+    def valores(self):
+        # Los números distintos como texto, para buscar_prefijo
+        return [str(numero) for numero in np.unique(self.columna[:self.tamaño]).tolist()]
+
+class PilaArregloTipada(PilaArreglo):
+    # items es un array de capacidad fija que crece al doble al llenarse y se reduce a la mitad al quedar
+    # a un cuarto; tamaño dice cuántas ranuras están en uso. Los valores que no son números del tipo
+    # de la pila se rechazan.
+    def __init__(self, tipo='entero'):
+        self.tipo = tipo
+        self.codigo = TIPOS_PILA[tipo][0]
+        self.items = array(self.codigo, bytes(CAPACIDAD_MINIMA_PILA * 8))
+        self.tamaño = 0
+        self.version = 0
+        self.cerrojo = CerrojoLectorEscritor()
+
+    def _redimensionar(self, capacidad):
+        # Siempre arma un array nuevo en lugar de crecer en sitio: una vista de obtener_pila o la columna
+        # de una búsqueda que siga abierta conserva el array anterior en vez de impedir el cambio
+        items = self.items[:self.tamaño]
+        items.frombytes(bytes((capacidad - self.tamaño) * items.itemsize))
+        self.items = items
+
+    def _encoger(self):
+        capacidad = len(self.items)
+        while capacidad // 2 >= CAPACIDAD_MINIMA_PILA and self.tamaño * 4 <= capacidad:
+            capacidad //= 2
+        if capacidad < len(self.items):
+            self._redimensionar(capacidad)
+
+    @benchmark
+    @registrada
+    def push(self, dato):
+        # Retorna False si el valor no es un número del tipo de la pila
+        numero = convertir_numero(dato, self.tipo)
+        if numero is None:
+            return False
+        if self.tamaño == len(self.items):
+            self._redimensionar(2 * self.tamaño)
+        self.items[self.tamaño] = numero
+        self.tamaño += 1
+        self.version += 1
+        return True
+
+    @benchmark
+    @registrada
+    def push_varios(self, datos):
+        # Convierte el lote, lo copia con una sola asignación de rebanada y retorna cuántos se apilaron
+        tipo = self.tipo
+        numeros = array(self.codigo, [numero for numero in (convertir_numero(dato, tipo) for dato in datos) if numero is not None])
+        if not numeros:
+            return 0
+        fin = self.tamaño + len(numeros)
+        if fin > len(self.items):
+            self._redimensionar(max(fin, 2 * len(self.items)))
+        self.items[self.tamaño:fin] = numeros # Mismo largo: no cambia el tamaño del array
+        self.tamaño = fin
+        self.version += 1
+        return len(numeros)
+
+    @benchmark
+    @registrada
+    def pop(self):
+        if self.esta_vacia():
+            return None
+        self.tamaño -= 1
+        self.version += 1
+        dato = self.items[self.tamaño]
+        self._encoger()
+        return dato
+
+    @benchmark
+    @registrada
+    def pop_varios(self, k):
+        k = min(k, self.tamaño)
+        if k <= 0:
+            return []
+        inicio = self.tamaño - k
+        datos = self.items[inicio:self.tamaño].tolist()
+        datos.reverse()
+        self.tamaño = inicio
+        self.version += 1
+        self._encoger()
+        return datos
+
+    @benchmark
+    @lectura
+    def peek(self):
+        if self.esta_vacia():
+            return None
+        return self.items[self.tamaño - 1]
+
+    @lectura
+    def pagina(self, inicio, cantidad, desde=None):
+        fin = min(inicio + cantidad, self.tamaño)
+        if inicio >= fin:
+            return [], None
+        datos = self.items[self.tamaño - fin:self.tamaño - inicio].tolist()
+        datos.reverse()
+        return datos, (fin if fin < self.tamaño else None)
+
+    def _espejo(self):
+        return EspejoTipado(self)
+
+    def _bytes_contenedor(self):
+        return sys.getsizeof(self.items) # Los números viven dentro del array; el espejo no se guarda
+
+    @lectura
+    def exportar_estado(self):
+        return {'datos': self.items[:self.tamaño].tolist()} # De la base al tope
+
+    @escritura
+    def restaurar_estado(self, estado):
+        numeros = [convertir_numero(dato, self.tipo) for dato in estado['datos']]
+        self.items = array(self.codigo, [numero for numero in numeros if numero is not None])
+        self.tamaño = len(self.items)
+        self._redimensionar(max(CAPACIDAD_MINIMA_PILA, self.tamaño))
+        self.version += 1
+
+    @lectura
     def obtener_pila(self):
-        return self.items[::-1]  # Retorna una copia invertida para mostrar el tope arriba
+        # Vista de memoria invertida sobre las ranuras en uso: del tope a la base sin copiar. Ve los push
+        # y pop posteriores, así que solo es coherente mientras quien la lee tiene el cerrojo de lectura
+        return memoryview(self.items)[:self.tamaño][::-1]
+
+    @lectura
+    def copiar_pila(self):
+        datos = self.items[:self.tamaño].tolist()
+        datos.reverse()
+        return datos
 
-pila_arreglo = PilaArreglo()  # Instancia global de la pila
+if PILA_TIPO == 'objetos':
+    pila_arreglo = PilaArreglo()  # Instancia global de la pila
+else:
+    pila_arreglo = PilaArregloTipada(PILA_TIPO)
 
 @app.route('/pila-arreglo') # Define la ruta para la pila basada en arreglo
 def mostrar_pila_arreglo():
-    datos = pila_arreglo.obtener_pila() # Obtiene los datos de la pila
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor']) # Crea un DataFrame de pandas con los datos
+    pila_arreglo = obtener_estructura('pila-arreglo') # La instancia de la sesión o la global
     return render_template('pila_arreglo.html', # Renderiza la plantilla pila_arreglo.html
-                         datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+                         datos=tabla_paginada(pila_arreglo), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
                          lista=pila_arreglo) # Pasa la lista como contexto a la plantilla
 
 @app.route('/pila-arreglo/push', methods=['POST']) # Define la ruta para insertar un elemento en la pila basada en arreglo
 def push_pila_arreglo():
+    pila_arreglo = obtener_estructura('pila-arreglo') # La instancia de la sesión o la global
     valor = request.form['valor'] # Obtiene el valor a insertar del formulario
-    tiempos = [] # Inicializa una lista para almacenar los tiempos
-    memorias = [] # Inicializa una lista para almacenar las memorias
-    for val in valor.split(','): # Recorre los valores separados por comas
-        _, t, m = pila_arreglo.push(val.strip()) # Llama a la función push y obtiene el tiempo y memoria
-        tiempos.append(t) # Agrega el tiempo a la lista de tiempos
-        memorias.append(m) # Agrega la memoria a la lista de memorias
-    tiempo_total = sum(tiempos) # Suma todos los tiempos
-    memoria_total = sum(memorias) # Suma todas las memorias
+    valores = [val.strip() for val in valor.split(',')] # Separa los valores por comas
+    cantidad, tiempo_total, memoria_total = pila_arreglo.push_varios(valores) # Apila todo el lote en una sola operación medida
+    rechazados = len(valores) - cantidad # Solo la pila tipada rechaza valores
+    mensaje = f'{rechazados} valores no son números de tipo {pila_arreglo.tipo} y no se apilaron' if rechazados else None
 
-    datos = pila_arreglo.obtener_pila() # Obtiene los datos de la pila
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor']) # Crea un DataFrame de pandas con los datos
     return render_template('pila_arreglo.html', # Renderiza la plantilla pila_arreglo.html
-                         datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+                         datos=tabla_paginada(pila_arreglo), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
                          lista=pila_arreglo, # Pasa la lista como contexto a la plantilla
+                         mensaje_busqueda=mensaje, # Valores rechazados, si los hubo
                          tiempos=f"{tiempo_total:.7f} s", # Tiempo total de ejecución
                          memorias=f"{memoria_total:.6f} MB") # Memoria total utilizada
 
 @app.route('/pila-arreglo/pop', methods=['POST']) # Define la ruta para eliminar un elemento de la pila basada en arreglo
 def pop_pila_arreglo():
-    dato, tiempo, memoria = pila_arreglo.pop() # Llama a la función pop y obtiene el dato, tiempo y memoria
-    mensaje = f'Elemento extraído: {dato}' if dato else 'Pila vacía' # Mensaje de extracción
+    pila_arreglo = obtener_estructura('pila-arreglo') # La instancia de la sesión o la global
+    cantidad = int(request.form.get('cantidad') or 1) # Cuántos elementos sacar, uno si el campo viene vacío
+    if cantidad > 1:
+        datos, tiempo, memoria = pila_arreglo.pop_varios(cantidad) # Saca todos con una sola rebanada
+        mensaje = f'Elementos extraídos: {", ".join(map(str, datos))}' if datos else 'Pila vacía' # Mensaje de extracción
+    else:
+        dato, tiempo, memoria = pila_arreglo.pop() # Llama a la función pop y obtiene el dato, tiempo y memoria
+        mensaje = f'Elemento extraído: {dato}' if dato is not None else 'Pila vacía' # Mensaje de extracción
 
-    datos = pila_arreglo.obtener_pila() # Obtiene los datos de la pila
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor']) # Crea un DataFrame de pandas con los datos
     return render_template('pila_arreglo.html', # Renderiza la plantilla pila_arreglo.html
-                         datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+                         datos=tabla_paginada(pila_arreglo), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
                          lista=pila_arreglo, # Pasa la lista como contexto a la plantilla
                          mensaje_busqueda=mensaje, # Mensaje de extracción
                          tiempos=f"{tiempo:.7f} s", # Tiempo de ejecución
@@ -613,86 +3799,176 @@ def pop_pila_arreglo():
 
 @app.route('/pila-arreglo/peek', methods=['POST']) # Define la ruta para ver el elemento en la parte superior de la pila basada en arreglo
 def peek_pila_arreglo():
+    pila_arreglo = obtener_estructura('pila-arreglo') # La instancia de la sesión o la global
     dato, tiempo, memoria = pila_arreglo.peek() # Llama a la función peek y obtiene el dato, tiempo y memoria
-    mensaje = f'Elemento en el tope: {dato}' if dato else 'Pila vacía' # Mensaje de vista
+    mensaje = f'Elemento en el tope: {dato}' if dato is not None else 'Pila vacía' # Mensaje de vista
 
-    datos = pila_arreglo.obtener_pila() # Obtiene los datos de la pila
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor']) # Crea un DataFrame de pandas con los datos
     return render_template('pila_arreglo.html', # Renderiza la plantilla pila_arreglo.html
-                         datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+                         datos=tabla_paginada(pila_arreglo), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
                          lista=pila_arreglo, # Pasa la lista como contexto a la plantilla
                          mensaje_busqueda=mensaje, # Mensaje de vista
                          tiempos=f"{tiempo:.7f} s", # Tiempo de ejecución
                          memorias=f"{memoria:.6f} MB") # Memoria utilizada
 
+@app.route('/pila-arreglo/buscar', methods=['POST']) # Busca todas las posiciones de uno o varios valores (0 es el tope)
+def buscar_pila_arreglo():
+    pila_arreglo = obtener_estructura('pila-arreglo') # La instancia de la sesión o la global
+    mensaje, tiempo, memoria = buscar_en_arreglo(pila_arreglo) # Una pasada vectorizada para todos los valores
+
+    return render_template('pila_arreglo.html', # Renderiza la plantilla pila_arreglo.html
+                         datos=tabla_paginada(pila_arreglo), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
+                         lista=pila_arreglo, # Pasa la lista como contexto a la plantilla
+                         mensaje_busqueda=mensaje, # Mensaje de búsqueda
+                         tiempos=f"{tiempo:.7f} s", # Tiempo de ejecución
+                         memorias=f"{memoria:.6f} MB") # Memoria utilizada
+
 #-------------------------------Cola Simple-------------------------------------
 
-class ColaSimple:
+class ColaSimple(BusquedaColumnar, MemoriaContada):
     def __init__(self):
         self.items = []
+        self.frente = 0 # Posición del primer elemento en items; lo anterior ya fue desencolado
         self.tamaño = 0
+        self.version = 0
+        self.cerrojo = CerrojoLectorEscritor()
+        self.contados = contador_valores()
 
     @benchmark
+    @registrada
     def encolar(self, dato):
         self.items.append(dato)
+        self.contados.sumar(dato)
         self.tamaño += 1
+        self.version += 1
+        if self.espejo is not None:
+            self._sincronizar(len(self.items) - 1, dato)
+
+    @benchmark
+    @registrada
+    def encolar_varios(self, datos):
+        antes = len(self.items)
+        self.items.extend(datos)
+        cantidad = len(self.items) - antes
+        nuevos = self.items[antes:]
+        self.contados.sumar_varios(nuevos)
+        self.tamaño += cantidad
+        self.version += 1
+        if self.espejo is not None:
+            self._sincronizar_varios(antes, nuevos)
+        return cantidad
 
     @benchmark
+    @registrada
     def desencolar(self):
         if self.esta_vacia():
             return None
+        dato = self.items[self.frente]
+        self.items[self.frente] = None # Suelta la referencia sin desplazar el resto del arreglo
+        self.contados.restar(dato)
+        self.frente += 1
         self.tamaño -= 1
-        return self.items.pop(0)
+        self.version += 1
+        self._compactar()
+        return dato
+
+    @benchmark
+    @registrada
+    def desencolar_varios(self, k):
+        k = min(k, self.tamaño)
+        if k <= 0:
+            return []
+        fin = self.frente + k
+        datos = self.items[self.frente:fin]
+        self.items[self.frente:fin] = [None] * k
+        self.contados.restar_varios(datos)
+        self.frente = fin
+        self.tamaño -= k
+        self.version += 1
+        self._compactar()
+        return datos
+
+    def _compactar(self):
+        # Descarta el prefijo ya desencolado cuando ocupa la mitad del arreglo: cada elemento se mueve
+        # a lo sumo una vez por compactación, así que desencolar queda en O(1) amortizado
+        if self.tamaño == 0:
+            self.items = [] # Devuelve la memoria en cuanto la cola se vacía
+            self.frente = 0
+        elif self.frente >= 32 and self.frente * 2 >= len(self.items):
+            if self.espejo is not None:
+                self.espejo.descartar_inicio(self.frente, len(self.items))
+            del self.items[:self.frente]
+            self.frente = 0
 
     def esta_vacia(self):
         return self.tamaño == 0
 
+    @lectura
+    def pagina(self, inicio, cantidad, desde=None):
+        fin = min(inicio + cantidad, self.tamaño)
+        if inicio >= fin:
+            return [], None
+        return self.items[self.frente + inicio:self.frente + fin], (fin if fin < self.tamaño else None)
+
+    @lectura
+    def exportar_estado(self):
+        return {'datos': self.obtener_cola()}
+
+    @escritura
+    def restaurar_estado(self, estado):
+        self.items = list(estado['datos'])
+        self.frente = 0
+        self.tamaño = len(self.items)
+        self.version += 1
+        self.espejo = None
+        self.contados = contador_valores()
+        self.contados.sumar_varios(self.items)
+
+    def _tramos(self):
+        return [(self.frente, self.frente + self.tamaño)]
+
+    def _bytes_contenedor(self):
+        # La lista incluye las ranuras del prefijo ya desencolado que aún no se compactó
+        return sys.getsizeof(self.items) + self._bytes_espejo() + self.contados.memoria_bytes()
+
+    @lectura
     def obtener_cola(self):
-        return self.items
+        return self.items[self.frente:]
 
     @benchmark
+    @lectura
     def peek(self):
-        return self.items[0] if not self.esta_vacia() else None
+        return self.items[self.frente] if not self.esta_vacia() else None
 
 cola_simple = ColaSimple()  # Instancia global de la cola
 
 @app.route('/cola-simple') # Define la ruta para la cola simple
 def mostrar_cola_simple():
-    datos = cola_simple.obtener_cola() # Obtiene los datos de la cola
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor']) # Crea un DataFrame de pandas con los datos
+    cola_simple = obtener_estructura('cola-simple') # La instancia de la sesión o la global
     return render_template('cola_simple.html', # Renderiza la plantilla cola_simple.html
-                         datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+                         datos=tabla_paginada(cola_simple), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
                          lista=cola_simple) # Pasa la lista como contexto a la plantilla
 
 @app.route('/cola-simple/encolar', methods=['POST']) # Define la ruta para insertar un elemento en la cola simple
 def encolar_cola_simple():
+    cola_simple = obtener_estructura('cola-simple') # La instancia de la sesión o la global
     valor = request.form['valor'] # Obtiene el valor a insertar del formulario
-    tiempos = [] # Inicializa una lista para almacenar los tiempos
-    memorias = [] # Inicializa una lista para almacenar las memorias
-    for val in valor.split(','): # Recorre los valores separados por comas
-        _, t, m = cola_simple.encolar(val.strip()) # Llama a la función encolar y obtiene el tiempo y memoria
-        tiempos.append(t) # Agrega el tiempo a la lista de tiempos
-        memorias.append(m) # Agrega la memoria a la lista de memorias
-    tiempo_total = sum(tiempos) # Suma todos los tiempos
-    memoria_total = sum(memorias) # Suma todas las memorias
+    valores = [val.strip() for val in valor.split(',')] # Separa los valores por comas
+    _, tiempo_total, memoria_total = cola_simple.encolar_varios(valores) # Encola todo el lote en una sola operación medida
 
-    datos = cola_simple.obtener_cola() # Obtiene los datos de la cola
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor']) # Crea un DataFrame de pandas con los datos
     return render_template('cola_simple.html', # Renderiza la plantilla cola_simple.html
-                         datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+                         datos=tabla_paginada(cola_simple), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
                          lista=cola_simple, # Pasa la lista como contexto a la plantilla
                          tiempos=f"{tiempo_total:.7f} s", # Tiempo total de ejecución
                          memorias=f"{memoria_total:.6f} MB") # Memoria total utilizada
 
 @app.route('/cola-simple/desencolar', methods=['POST']) # Define la ruta para eliminar un elemento de la cola simple
 def desencolar_cola_simple():
+    cola_simple = obtener_estructura('cola-simple') # La instancia de la sesión o la global
     dato, tiempo, memoria = cola_simple.desencolar() # Llama a la función desencolar y obtiene el dato, tiempo y memoria
     mensaje = f'Elemento desencolado: {dato}' if dato else 'Cola vacía' # Mensaje de extracción
 
-    datos = cola_simple.obtener_cola() # Obtiene los datos de la cola
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor']) # Crea un DataFrame de pandas con los datos
     return render_template('cola_simple.html', # Renderiza la plantilla cola_simple.html
-                         datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+                         datos=tabla_paginada(cola_simple), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
                          lista=cola_simple, # Pasa la lista como contexto a la plantilla
                          mensaje_busqueda=mensaje, # Mensaje de extracción
                          tiempos=f"{tiempo:.7f} s", # Tiempo de ejecución
@@ -700,47 +3976,87 @@ def desencolar_cola_simple():
 
 @app.route('/cola-simple/peek', methods=['POST']) # Define la ruta para ver el elemento en la parte superior de la cola simple
 def peek_cola_simple():
+    cola_simple = obtener_estructura('cola-simple') # La instancia de la sesión o la global
     dato, tiempo, memoria = cola_simple.peek() # Llama a la función peek y obtiene el dato, tiempo y memoria
     mensaje = f'Primer elemento en la cola: {dato}' if dato else 'Cola vacía' # Mensaje de vista
 
-    datos = cola_simple.obtener_cola() # Obtiene los datos de la cola
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor']) # Crea un DataFrame de pandas con los datos
     return render_template('cola_simple.html', # Renderiza la plantilla cola_simple.html
-                         datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+                         datos=tabla_paginada(cola_simple), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
                          lista=cola_simple, # Pasa la lista como contexto a la plantilla
                          mensaje_busqueda=mensaje, # Mensaje de vista
                          tiempos=f"{tiempo:.7f} s", # Tiempo de ejecución
                          memorias=f"{memoria:.6f} MB") # Memoria utilizada
 
+@app.route('/cola-simple/buscar', methods=['POST']) # Busca todas las posiciones de uno o varios valores (0 es el frente)
+def buscar_cola_simple():
+    cola_simple = obtener_estructura('cola-simple') # La instancia de la sesión o la global
+    mensaje, tiempo, memoria = buscar_en_arreglo(cola_simple) # Una pasada vectorizada para todos los valores
+
+    return render_template('cola_simple.html', # Renderiza la plantilla cola_simple.html
+                         datos=tabla_paginada(cola_simple), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
+                         lista=cola_simple, # Pasa la lista como contexto a la plantilla
+                         mensaje_busqueda=mensaje, # Mensaje de búsqueda
+                         tiempos=f"{tiempo:.7f} s", # Tiempo de ejecución
+                         memorias=f"{memoria:.6f} MB") # Memoria utilizada
+
 #---------------------------------------Cola Circular---------------------------------
 
-class ColaCircular:
-    def __init__(self, capacidad=5):
+FACTOR_MAXIMO = 10.0 # Un factor mayor pediría de golpe arreglos enormes al crecer
+
+def factor_valido(factor):
+    # nan, inf o factores enormes pasarían un simple `factor > 1` y romperían el siguiente crecimiento
+    return math.isfinite(factor) and 1 < factor <= FACTOR_MAXIMO
+
+class ColaCircular(BusquedaColumnar, MemoriaContada):
+    def __init__(self, capacidad=5, elastica=False, factor_crecimiento=2.0):
         self.capacidad = capacidad
         self.items = [None] * capacidad
         self.frente = 0
         self.final = 0
         self.tamaño = 0
+        self.version = 0
+        self.cerrojo = CerrojoLectorEscritor()
+        self.elastica = elastica # En modo elástico crece al llenarse en lugar de rechazar
+        self.factor_crecimiento = factor_crecimiento
+        self.capacidad_minima = capacidad # Nunca se encoge por debajo de la capacidad configurada
+        self.redimensionamientos = 0
+        self.contados = contador_valores()
 
     @benchmark
+    @registrada
     def encolar(self, dato):
         if self.is_full():
-            return False  # No se puede encolar si está llena
+            if not self.elastica:
+                contar_rechazo('ColaCircular', 'llena')
+                return False  # No se puede encolar si está llena
+            self._reubicar(max(self.capacidad + 1, int(self.capacidad * self.factor_crecimiento)))
 
         self.items[self.final] = dato
+        self.contados.sumar(dato)
+        if self.espejo is not None:
+            self._sincronizar(self.final, dato)
         self.final = (self.final + 1) % self.capacidad
         self.tamaño += 1
+        self.version += 1
         return True
 
     @benchmark
+    @registrada
     def desencolar(self):
         if self.is_empty():
             return None
 
         dato = self.items[self.frente]
         self.items[self.frente] = None  # Limpiar la posición
+        self.contados.restar(dato)
         self.frente = (self.frente + 1) % self.capacidad
         self.tamaño -= 1
+        self.version += 1
+        # Histéresis: solo se encoge al bajar de 1/factor² de ocupación, así tras encogerse queda a 1/factor
+        # y una racha de encolar/desencolar en el límite no provoca redimensiones en cadena
+        if (self.elastica and self.capacidad > self.capacidad_minima
+                and self.tamaño <= self.capacidad / (self.factor_crecimiento ** 2)):
+            self._reubicar(max(self.capacidad_minima, int(self.capacidad / self.factor_crecimiento)))
         return dato
 
     def is_empty(self):
@@ -749,6 +4065,60 @@ class ColaCircular:
     def is_full(self):
         return self.tamaño == self.capacidad
 
+    @lectura
+    def pagina(self, inicio, cantidad, desde=None):
+        # La página ocupa a lo sumo dos rebanadas del arreglo: hasta el final y, si da la vuelta, desde el inicio
+        fin = min(inicio + cantidad, self.tamaño)
+        if inicio >= fin:
+            return [], None
+        desde_fisico = (self.frente + inicio) % self.capacidad
+        hasta_fisico = desde_fisico + (fin - inicio)
+        if hasta_fisico <= self.capacidad:
+            datos = self.items[desde_fisico:hasta_fisico]
+        else:
+            datos = self.items[desde_fisico:] + self.items[:hasta_fisico - self.capacidad]
+        return datos, (fin if fin < self.tamaño else None)
+
+    @lectura
+    def exportar_estado(self):
+        return {
+            'datos': self.obtener_cola(),
+            'capacidad': self.capacidad,
+            'capacidad_minima': self.capacidad_minima,
+            'elastica': self.elastica,
+            'factor_crecimiento': self.factor_crecimiento,
+            'redimensionamientos': self.redimensionamientos,
+        }
+
+    @escritura
+    def restaurar_estado(self, estado):
+        datos = estado['datos']
+        self.capacidad = estado['capacidad']
+        self.items = list(datos) + [None] * (self.capacidad - len(datos))
+        self.frente = 0
+        self.tamaño = len(datos)
+        self.final = self.tamaño % self.capacidad
+        self.capacidad_minima = estado['capacidad_minima']
+        self.elastica = estado['elastica']
+        self.factor_crecimiento = estado['factor_crecimiento']
+        self.redimensionamientos = estado['redimensionamientos']
+        self.version += 1
+        self.espejo = None
+        self.contados = contador_valores()
+        self.contados.sumar_varios(datos)
+
+    def _bytes_contenedor(self):
+        # El arreglo de `capacidad` ranuras, también las vacías
+        return sys.getsizeof(self.items) + self._bytes_espejo() + self.contados.memoria_bytes()
+
+    def _tramos(self):
+        # Del frente al final del arreglo y, si la cola da la vuelta, desde el inicio hasta final
+        fin = self.frente + self.tamaño
+        if fin <= self.capacidad:
+            return [(self.frente, fin)]
+        return [(self.frente, self.capacidad), (0, fin - self.capacidad)]
+
+    @lectura
     def obtener_cola(self):
         if self.is_empty():
             return []
@@ -768,32 +4138,316 @@ class ColaCircular:
         else:
             return 'Cola con elementos'
 
+    def _reubicar(self, nueva_capacidad):
+        # Copia los elementos al nuevo arreglo con a lo sumo dos rebanadas contiguas (los tramos)
+        tramos = self._tramos()
+        elementos = []
+        for inicio, fin in tramos:
+            elementos.extend(self.items[inicio:fin])
+        elementos.extend([None] * (nueva_capacidad - self.tamaño))
+        if self.espejo is not None:
+            self.espejo.reordenar(tramos, nueva_capacidad)
+        self.items = elementos
+        self.capacidad = nueva_capacidad
+        self.frente = 0
+        self.final = self.tamaño % nueva_capacidad
+        self.redimensionamientos += 1
+
+    @registrada
+    def configurar_modo(self, elastica, factor_crecimiento):
+        if not factor_valido(factor_crecimiento):
+            raise ValueError(f'El factor de crecimiento debe ser mayor que 1 y como mucho {FACTOR_MAXIMO}, no {factor_crecimiento}')
+        self.elastica = elastica
+        self.factor_crecimiento = factor_crecimiento
+
+    @registrada
     def redimensionar(self, nueva_capacidad):
+        if nueva_capacidad < 1:
+            raise ValueError(f'La capacidad debe ser al menos 1, no {nueva_capacidad}') # Antes de tocar el arreglo
         if nueva_capacidad < self.tamaño:
             return False  # No se puede reducir si hay más elementos
 
-        # Crear nueva cola con los elementos actuales
-        elementos_actuales = self.obtener_cola()
-        self.__init__(nueva_capacidad)
+        self._reubicar(nueva_capacidad)
+        self.capacidad_minima = nueva_capacidad
+        return True
+
+#-------------------------------Cola circular en memoria compartida---------------------------------
+
+# Con varios procesos del servidor cada uno tendría su propia cola_circular. Si EDL_COLA_COMPARTIDA da
+# un nombre, la cola vive en un segmento de multiprocessing.shared_memory con ese nombre y todos los
+# procesos que lo abren encolan y desencolan sobre el mismo anillo.
+#
+# Segmento: cabecera de COLA_CABECERA y después `maximo` ranuras de tamaño fijo, cada una con la
+# longitud del valor (uint32) y el valor codificado con marshal (a lo sumo `ranura` bytes).
+COLA_COMPARTIDA = os.environ.get('EDL_COLA_COMPARTIDA')
+COLA_MAXIMO = int(os.environ.get('EDL_COLA_MAXIMO', '4096')) # Ranuras reservadas: límite de la capacidad
+COLA_RANURA = int(os.environ.get('EDL_COLA_RANURA', '64')) # Bytes máximos de un valor codificado
+if COLA_COMPARTIDA and os.environ.get('EDL_DURABLE'):
+    # El segmento sobrevive al proceso con la cola dentro: reproducir el registro sobre él la duplicaría
+    # y pisaría lo que otros procesos escribieron sin anotarlo
+    raise ValueError("EDL_DURABLE no se puede combinar con EDL_COLA_COMPARTIDA: la cola compartida ya se conserva en su segmento")
+
+COLA_CABECERA = struct.Struct('<10qd')
+(C_MAXIMO, C_RANURA, C_CAPACIDAD, C_MINIMA, C_FRENTE, C_FINAL, C_TAMAÑO, C_VERSION,
+ C_REDIMENSIONES, C_ELASTICA, C_FACTOR) = range(11)
+LONGITUD_RANURA = struct.Struct('<I')
+
+def _abrir_memoria(nombre, tamaño_bytes):
+    # Retorna (segmento, creado). Python < 3.13 registra el segmento en el resource_tracker de cada
+    # proceso y lo borra cuando ese proceso termina; la cola debe sobrevivir a los procesos que la
+    # usan, así que solo se borra con destruir().
+    try:
+        return shared_memory.SharedMemory(nombre, create=True, size=tamaño_bytes, track=False), True
+    except FileExistsError:
+        return shared_memory.SharedMemory(nombre, track=False), False
+    except TypeError:
+        pass
+    try:
+        memoria, creado = shared_memory.SharedMemory(nombre, create=True, size=tamaño_bytes), True
+    except FileExistsError:
+        memoria, creado = shared_memory.SharedMemory(nombre), False
+    resource_tracker.unregister(memoria._name, 'shared_memory')
+    return memoria, creado
+
+class ColaCircularCompartida(MemoriaContada):
+    # Misma interfaz que ColaCircular. Cada operación toma un cerrojo de hilos y un flock exclusivo
+    # sobre un archivo junto al segmento, así es atómica entre hilos y entre procesos. La capacidad
+    # puede cambiar (redimensionar o modo elástico) pero nunca pasar de `maximo` ranuras.
+    def __init__(self, nombre, capacidad=5, maximo=COLA_MAXIMO, ranura=COLA_RANURA, elastica=False, factor_crecimiento=2.0):
+        self.nombre = nombre
+        self.cerrojo = CerrojoLectorEscritor()
+        self.cerrojo_hilos = threading.Lock() # flock no excluye a los hilos que comparten el descriptor
+        self.bloqueo = open(os.path.join(tempfile.gettempdir(), f'{nombre}.lock'), 'w')
+        with self._exclusivo():
+            # Se crea e inicializa con el flock tomado: quien se conecta después ya ve la cabecera escrita
+            memoria, creado = _abrir_memoria(nombre, COLA_CABECERA.size + maximo * (LONGITUD_RANURA.size + ranura))
+            self.memoria = memoria
+            self.buffer = memoria.buf
+            if creado:
+                COLA_CABECERA.pack_into(self.buffer, 0, maximo, ranura, min(capacidad, maximo), min(capacidad, maximo),
+                                        0, 0, 0, 0, 0, int(elastica), factor_crecimiento)
+            cabecera = self._cabecera()
+        self.maximo = cabecera[C_MAXIMO] # Los procesos que se conectan usan las medidas de quien lo creó
+        self.ranura = cabecera[C_RANURA]
+        self.paso = LONGITUD_RANURA.size + self.ranura
+
+    @contextmanager
+    def _exclusivo(self):
+        with self.cerrojo_hilos:
+            fcntl.flock(self.bloqueo, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self.bloqueo, fcntl.LOCK_UN)
+
+    def _cabecera(self):
+        return list(COLA_CABECERA.unpack_from(self.buffer, 0))
+
+    def _guardar(self, cabecera):
+        COLA_CABECERA.pack_into(self.buffer, 0, *cabecera)
+
+    def _campo(self, i):
+        # Lectura suelta de un campo para mostrarlo; las operaciones leen la cabecera con el flock tomado
+        return COLA_CABECERA.unpack_from(self.buffer, 0)[i]
+
+    capacidad = property(lambda self: self._campo(C_CAPACIDAD))
+    capacidad_minima = property(lambda self: self._campo(C_MINIMA))
+    frente = property(lambda self: self._campo(C_FRENTE))
+    final = property(lambda self: self._campo(C_FINAL))
+    tamaño = property(lambda self: self._campo(C_TAMAÑO))
+    version = property(lambda self: self._campo(C_VERSION))
+    redimensionamientos = property(lambda self: self._campo(C_REDIMENSIONES))
+    elastica = property(lambda self: bool(self._campo(C_ELASTICA)))
+    factor_crecimiento = property(lambda self: self._campo(C_FACTOR))
+
+    def _ranura_cruda(self, i):
+        inicio = COLA_CABECERA.size + i * self.paso
+        return bytes(self.buffer[inicio:inicio + self.paso])
+
+    def _escribir_cruda(self, i, cruda):
+        inicio = COLA_CABECERA.size + i * self.paso
+        self.buffer[inicio:inicio + len(cruda)] = cruda
+
+    def _leer(self, i):
+        inicio = COLA_CABECERA.size + i * self.paso
+        longitud = LONGITUD_RANURA.unpack_from(self.buffer, inicio)[0]
+        inicio += LONGITUD_RANURA.size
+        return marshal.loads(self.buffer[inicio:inicio + longitud])
+
+    def _leer_desde(self, cabecera, inicio, cantidad):
+        capacidad, frente = cabecera[C_CAPACIDAD], cabecera[C_FRENTE]
+        return [self._leer((frente + i) % capacidad) for i in range(inicio, inicio + cantidad)]
+
+    @benchmark
+    @registrada
+    def encolar(self, dato):
+        codificado = marshal.dumps(dato)
+        if len(codificado) > self.ranura:
+            contar_rechazo('ColaCircularCompartida', 'ranura')
+            return False # No cabe en una ranura
+        with self._exclusivo():
+            cabecera = self._cabecera()
+            capacidad = cabecera[C_CAPACIDAD]
+            if cabecera[C_TAMAÑO] == capacidad:
+                if not cabecera[C_ELASTICA] or capacidad >= self.maximo:
+                    contar_rechazo('ColaCircularCompartida', 'llena')
+                    return False
+                self._reubicar(cabecera, min(self.maximo, max(capacidad + 1, int(capacidad * cabecera[C_FACTOR]))))
+            self._escribir_cruda(cabecera[C_FINAL], LONGITUD_RANURA.pack(len(codificado)) + codificado)
+            cabecera[C_FINAL] = (cabecera[C_FINAL] + 1) % cabecera[C_CAPACIDAD]
+            cabecera[C_TAMAÑO] += 1
+            cabecera[C_VERSION] += 1
+            self._guardar(cabecera)
+        return True
+
+    @benchmark
+    @registrada
+    def desencolar(self):
+        with self._exclusivo():
+            cabecera = self._cabecera()
+            if cabecera[C_TAMAÑO] == 0:
+                return None
+            dato = self._leer(cabecera[C_FRENTE])
+            cabecera[C_FRENTE] = (cabecera[C_FRENTE] + 1) % cabecera[C_CAPACIDAD]
+            cabecera[C_TAMAÑO] -= 1
+            cabecera[C_VERSION] += 1
+            capacidad, factor = cabecera[C_CAPACIDAD], cabecera[C_FACTOR]
+            if cabecera[C_ELASTICA] and capacidad > cabecera[C_MINIMA] and cabecera[C_TAMAÑO] <= capacidad / (factor ** 2):
+                self._reubicar(cabecera, max(cabecera[C_MINIMA], int(capacidad / factor)))
+            self._guardar(cabecera)
+        return dato
+
+    def is_empty(self):
+        return self.tamaño == 0
+
+    def is_full(self):
+        cabecera = self._cabecera()
+        return cabecera[C_TAMAÑO] == cabecera[C_CAPACIDAD]
+
+    @lectura
+    def pagina(self, inicio, cantidad, desde=None):
+        with self._exclusivo():
+            cabecera = self._cabecera()
+            fin = min(inicio + cantidad, cabecera[C_TAMAÑO])
+            if inicio >= fin:
+                return [], None
+            return self._leer_desde(cabecera, inicio, fin - inicio), (fin if fin < cabecera[C_TAMAÑO] else None)
+
+    @lectura
+    def obtener_cola(self):
+        with self._exclusivo():
+            cabecera = self._cabecera()
+            return self._leer_desde(cabecera, 0, cabecera[C_TAMAÑO])
+
+    @lectura
+    def exportar_estado(self):
+        with self._exclusivo():
+            cabecera = self._cabecera()
+            return {
+                'datos': self._leer_desde(cabecera, 0, cabecera[C_TAMAÑO]),
+                'capacidad': cabecera[C_CAPACIDAD],
+                'capacidad_minima': cabecera[C_MINIMA],
+                'elastica': bool(cabecera[C_ELASTICA]),
+                'factor_crecimiento': cabecera[C_FACTOR],
+                'redimensionamientos': cabecera[C_REDIMENSIONES],
+            }
+
+    @escritura
+    def restaurar_estado(self, estado):
+        datos = estado['datos']
+        if len(datos) > self.maximo:
+            raise ValueError(f'El estado tiene {len(datos)} elementos y el segmento solo {self.maximo} ranuras')
+        with self._exclusivo():
+            cabecera = self._cabecera()
+            for i, dato in enumerate(datos):
+                codificado = marshal.dumps(dato)
+                self._escribir_cruda(i, LONGITUD_RANURA.pack(len(codificado)) + codificado)
+            cabecera[C_CAPACIDAD] = max(len(datos), min(estado['capacidad'], self.maximo))
+            cabecera[C_MINIMA] = min(estado['capacidad_minima'], cabecera[C_CAPACIDAD])
+            cabecera[C_FRENTE] = 0
+            cabecera[C_TAMAÑO] = len(datos)
+            cabecera[C_FINAL] = len(datos) % cabecera[C_CAPACIDAD]
+            cabecera[C_ELASTICA] = int(estado['elastica'])
+            cabecera[C_FACTOR] = estado['factor_crecimiento']
+            cabecera[C_REDIMENSIONES] = estado['redimensionamientos']
+            cabecera[C_VERSION] += 1
+            self._guardar(cabecera)
 
-        # Volver a insertar los elementos
-        for elemento in elementos_actuales:
-            self.items[self.final] = elemento
-            self.final = (self.final + 1) % self.capacidad
-            self.tamaño += 1
+    def get_estado(self):
+        if self.is_empty():
+            return 'Cola vacia'
+        elif self.is_full():
+            return 'Cola llena'
+        else:
+            return 'Cola con elementos'
 
+    def _reubicar(self, cabecera, nueva_capacidad):
+        # Mueve las ranuras ocupadas al principio del segmento sin decodificarlas. Requiere el flock.
+        crudas = [self._ranura_cruda((cabecera[C_FRENTE] + i) % cabecera[C_CAPACIDAD]) for i in range(cabecera[C_TAMAÑO])]
+        for i, cruda in enumerate(crudas):
+            self._escribir_cruda(i, cruda)
+        cabecera[C_CAPACIDAD] = nueva_capacidad
+        cabecera[C_FRENTE] = 0
+        cabecera[C_FINAL] = cabecera[C_TAMAÑO] % nueva_capacidad
+        cabecera[C_REDIMENSIONES] += 1
+        cabecera[C_VERSION] += 1
+
+    @registrada
+    def configurar_modo(self, elastica, factor_crecimiento):
+        if not factor_valido(factor_crecimiento):
+            raise ValueError(f'El factor de crecimiento debe ser mayor que 1 y como mucho {FACTOR_MAXIMO}, no {factor_crecimiento}')
+        with self._exclusivo():
+            cabecera = self._cabecera()
+            cabecera[C_ELASTICA] = int(elastica)
+            cabecera[C_FACTOR] = factor_crecimiento
+            cabecera[C_VERSION] += 1
+            self._guardar(cabecera)
+
+    @registrada
+    def redimensionar(self, nueva_capacidad):
+        if nueva_capacidad < 1:
+            raise ValueError(f'La capacidad debe ser al menos 1, no {nueva_capacidad}') # Antes de tocar el segmento
+        with self._exclusivo():
+            cabecera = self._cabecera()
+            if nueva_capacidad < cabecera[C_TAMAÑO] or nueva_capacidad > self.maximo:
+                return False # No caben los elementos o el segmento no tiene tantas ranuras
+            self._reubicar(cabecera, nueva_capacidad)
+            cabecera[C_MINIMA] = nueva_capacidad
+            self._guardar(cabecera)
         return True
 
-cola_circular = ColaCircular()  # Instancia global de la cola circular
+    def cerrar(self):
+        self.buffer.release()
+        self.memoria.close()
+        self.bloqueo.close()
+
+    def _bytes_contenedor(self):
+        # El segmento completo: las ranuras se reservan al crearlo y los valores viven codificados en ellas
+        return self.memoria.size
+
+    def destruir(self):
+        # Borra el segmento del sistema; los procesos que aún lo tengan abierto siguen viéndolo hasta cerrarlo
+        if getattr(self.memoria, '_track', None) is None:
+            resource_tracker.register(self.memoria._name, 'shared_memory') # unlink() de Python < 3.13 lo vuelve a quitar
+        self.memoria.unlink()
+        try:
+            os.remove(self.bloqueo.name)
+        except FileNotFoundError:
+            pass
+        self.cerrar()
+
+if COLA_COMPARTIDA:
+    cola_circular = ColaCircularCompartida(COLA_COMPARTIDA)
+else:
+    cola_circular = ColaCircular()  # Instancia global de la cola circular
 
 # Rutas para Cola Circular
 @app.route('/cola-circular')
 def mostrar_cola_circular():
-    datos = cola_circular.obtener_cola()
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor'])
+    cola_circular = obtener_estructura('cola-circular') # La instancia de la sesión o la global
     estado = cola_circular.get_estado()
     return render_template('cola_circular.html',
-                           datos=df.to_html(index=False),
+                           datos=tabla_paginada(cola_circular),
                            lista=cola_circular,
                            mensaje_busqueda=estado,
                            capacidad_total = cola_circular.capacidad,
@@ -801,6 +4455,7 @@ def mostrar_cola_circular():
 
 @app.route('/cola-circular/encolar', methods=['POST'])
 def encolar_cola_circular():
+    cola_circular = obtener_estructura('cola-circular') # La instancia de la sesión o la global
     valor = request.form['valor']
     tiempos = []
     memorias = []
@@ -825,11 +4480,8 @@ def encolar_cola_circular():
     else:
         mensaje = f"Elementos encolados exitosamente. <br> {cola_circular.get_estado()}"
 
-    datos = cola_circular.obtener_cola()
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor'])
-
     return render_template('cola_circular.html',
-                           datos=df.to_html(index=False),
+                           datos=tabla_paginada(cola_circular),
                            lista=cola_circular,
                            mensaje_busqueda=mensaje,
                            tiempos=f"{tiempo_total:.7f} s",
@@ -839,14 +4491,12 @@ def encolar_cola_circular():
 
 @app.route('/cola-circular/desencolar', methods=['POST'])
 def desencolar_cola_circular():
+    cola_circular = obtener_estructura('cola-circular') # La instancia de la sesión o la global
     dato, tiempo, memoria = cola_circular.desencolar()
     mensaje = f'Elemento desencolado: {dato} <br> {cola_circular.get_estado()}' if dato else 'Cola vacía'
 
-    datos = cola_circular.obtener_cola()
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor'])
-
     return render_template('cola_circular.html',
-                           datos=df.to_html(index=False),
+                           datos=tabla_paginada(cola_circular),
                            lista=cola_circular,
                            mensaje_busqueda=mensaje,
                            tiempos=f"{tiempo:.7f} s",
@@ -854,29 +4504,46 @@ def desencolar_cola_circular():
                            capacidad_total=cola_circular.capacidad,
                            espacios_disponibles=cola_circular.capacidad - cola_circular.tamaño)
 
+@app.route('/cola-circular/buscar', methods=['POST'])
+def buscar_cola_circular():
+    cola_circular = obtener_estructura('cola-circular') # La instancia de la sesión o la global
+    mensaje, tiempo, memoria = buscar_en_arreglo(cola_circular) # Las posiciones cuentan desde el frente aunque la cola dé la vuelta
+
+    return render_template('cola_circular.html',
+                           datos=tabla_paginada(cola_circular),
+                           lista=cola_circular,
+                           mensaje_busqueda=escape(mensaje), # La plantilla no escapa este mensaje
+                           tiempos=f"{tiempo:.7f} s",
+                           memorias=f"{memoria:.6f} MB",
+                           capacidad_total=cola_circular.capacidad,
+                           espacios_disponibles=cola_circular.capacidad - cola_circular.tamaño)
+
 @app.route('/cola-circular/configuracion', methods=['POST'])
 def configurar_cola_circular():
+    cola_circular = obtener_estructura('cola-circular') # La instancia de la sesión o la global
     try:
         nueva_capacidad = int(request.form['capacidad'])
+        factor = float(request.form.get('factor') or cola_circular.factor_crecimiento)
         if nueva_capacidad <= 0:
             mensaje = "La capacidad debe ser un número positivo"
+        elif not factor_valido(factor):
+            mensaje = f"El factor de crecimiento debe ser mayor que 1 y como mucho {FACTOR_MAXIMO:g}"
         elif nueva_capacidad < cola_circular.tamaño:
             mensaje = f"No se puede reducir la capacidad a {nueva_capacidad}. Hay {cola_circular.tamaño} elementos en la cola"
         else:
             exito = cola_circular.redimensionar(nueva_capacidad)
+            cola_circular.configurar_modo(request.form.get('modo') == 'elastica', factor)
             if exito:
                 mensaje = f"Cola redimensionada exitosamente. Nueva capacidad: {nueva_capacidad}"
             else:
                 mensaje = "Error al redimensionar la cola"
     except ValueError:
-        mensaje = "Por favor ingrese un número válido para la capacidad"
+        mensaje = "Por favor ingrese un número válido para la capacidad y el factor"
 
-    datos = cola_circular.obtener_cola()
-    df = pd.DataFrame(datos, columns=['Valor']) if datos else pd.DataFrame(columns=['Valor'])
     estado = cola_circular.get_estado()
 
     return render_template('cola_circular.html',
-                           datos=df.to_html(index=False),
+                           datos=tabla_paginada(cola_circular),
                            lista=cola_circular,
                            estado=estado,
                            mensaje_busqueda=mensaje,
@@ -885,83 +4552,251 @@ def configurar_cola_circular():
 
 #-------------------------------Cola de Prioridad-------------------------------------
 
-class ColaPrioridad:
+
+class EntradaPrioridad:
+    __slots__ = ('prioridad', 'secuencia', 'valor', 'posicion') # posicion = índice actual en el montículo
+
+    def __init__(self, prioridad, secuencia, valor):
+        self.prioridad = prioridad
+        self.secuencia = secuencia
+        self.valor = valor
+        self.posicion = 0
+
+class ColaPrioridad(MemoriaContada):
+    # Montículo binario indexado: cada entrada sabe en qué posición está y el mapa valor -> entradas
+    # permite cambiar la prioridad o eliminar en O(log n). La secuencia de llegada desempata las
+    # prioridades iguales en orden FIFO sin comparar los valores.
     def __init__(self):
         self.heap = []
+        self.entradas = {} # valor -> su entrada, o las entradas con ese valor en orden de llegada si se repite
+        self.bytes_repetidos = 0 # Contenedores de las entradas de valores repetidos
+        self.secuencia = 0
         self.tamaño = 0
+        self.version = 0
+        self.cerrojo = CerrojoLectorEscritor()
+        self.orden_cache = None
+        self.contados = contador_valores() # Valores y prioridades de las entradas
+
+    def _menor(self, a, b):
+        return a.prioridad < b.prioridad or (a.prioridad == b.prioridad and a.secuencia < b.secuencia)
+
+    def _colocar(self, entrada, i):
+        self.heap[i] = entrada
+        entrada.posicion = i
+
+    def _subir(self, i):
+        entrada = self.heap[i]
+        while i > 0:
+            padre = (i - 1) >> 1
+            if not self._menor(entrada, self.heap[padre]):
+                break
+            self._colocar(self.heap[padre], i)
+            i = padre
+        self._colocar(entrada, i)
+
+    def _bajar(self, i):
+        entrada = self.heap[i]
+        n = len(self.heap)
+        while True:
+            hijo = 2 * i + 1
+            if hijo >= n:
+                break
+            if hijo + 1 < n and self._menor(self.heap[hijo + 1], self.heap[hijo]):
+                hijo += 1
+            if not self._menor(self.heap[hijo], entrada):
+                break
+            self._colocar(self.heap[hijo], i)
+            i = hijo
+        self._colocar(entrada, i)
+
+    def _quitar(self, entrada):
+        # Saca la entrada del montículo y del mapa de valores
+        ultima = self.heap.pop()
+        if ultima is not entrada:
+            self._colocar(ultima, entrada.posicion)
+            self._subir(ultima.posicion)
+            self._bajar(ultima.posicion)
+        self.bytes_repetidos += quitar_aparicion(self.entradas, entrada.valor, entrada)
+        self._restar_entrada(entrada)
+        self.tamaño -= 1
+        self.version += 1
+
+    def _sumar_entrada(self, entrada):
+        sumar = self.contados.sumar
+        sumar(entrada.valor)
+        sumar(entrada.prioridad)
+
+    def _restar_entrada(self, entrada):
+        restar = self.contados.restar
+        restar(entrada.valor)
+        restar(entrada.prioridad)
 
     @benchmark
+    @registrada
     def encolar(self, valor, prioridad):
-        heapq.heappush(self.heap, (prioridad, valor))
+        entrada = EntradaPrioridad(prioridad, self.secuencia, valor)
+        self.secuencia += 1
+        self.heap.append(entrada)
+        self._subir(len(self.heap) - 1)
+        self.bytes_repetidos += agregar_aparicion(self.entradas, valor, entrada)
+        self._sumar_entrada(entrada)
         self.tamaño += 1
+        self.version += 1
 
     @benchmark
+    @registrada
+    def encolar_varios(self, valores, prioridad):
+        # Todo el lote con la misma prioridad. Si el lote es más grande que el montículo sale más barato
+        # agregarlo al final y reconstruir en O(n) que subir cada entrada en O(log n).
+        heap, entradas = self.heap, self.entradas
+        antes = len(heap)
+        repetidos = 0
+        for valor in valores:
+            entrada = EntradaPrioridad(prioridad, self.secuencia, valor)
+            self.secuencia += 1
+            entrada.posicion = len(heap)
+            heap.append(entrada)
+            repetidos += agregar_aparicion(entradas, valor, entrada)
+            self._sumar_entrada(entrada)
+        self.bytes_repetidos += repetidos
+        agregadas = len(heap) - antes
+        if agregadas > antes:
+            for i in range(len(heap) // 2 - 1, -1, -1):
+                self._bajar(i)
+        else:
+            for i in range(antes, len(heap)):
+                self._subir(i)
+        self.tamaño += agregadas
+        self.version += 1
+        return agregadas
+
+    @benchmark
+    @registrada
     def desencolar(self):
         if self.esta_vacia():
             return None
-        self.tamaño -= 1
-        return heapq.heappop(self.heap)[1]  # Retorna solo el valor
+        entrada = self.heap[0]
+        self._quitar(entrada)
+        return entrada.valor  # Retorna solo el valor
 
     @benchmark
+    @lectura
     def peek(self):
         if self.esta_vacia():
             return None
-        return self.heap[0][1]  # Retorna solo el valor
+        return self.heap[0].valor  # Retorna solo el valor
+
+    @benchmark
+    @registrada
+    def cambiar_prioridad(self, valor, prioridad):
+        # Con valores repetidos se cambia la entrada más antigua
+        entrada = primera_aparicion(self.entradas, valor)
+        if entrada is None:
+            return False
+        self.contados.restar(entrada.prioridad)
+        self.contados.sumar(prioridad)
+        entrada.prioridad = prioridad
+        self.version += 1
+        self._subir(entrada.posicion)
+        self._bajar(entrada.posicion)
+        return True
+
+    @benchmark
+    @registrada
+    def eliminar(self, valor):
+        entrada = primera_aparicion(self.entradas, valor)
+        if entrada is None:
+            return False
+        self._quitar(entrada)
+        return True
 
     def esta_vacia(self):
         return self.tamaño == 0
 
+    @lectura
+    def exportar_estado(self):
+        ordenadas = sorted(self.heap, key=lambda e: (e.prioridad, e.secuencia))
+        return {'entradas': [(e.prioridad, e.secuencia, e.valor) for e in ordenadas], 'secuencia': self.secuencia}
+
+    @escritura
+    def restaurar_estado(self, estado):
+        # Una lista ordenada ya cumple la propiedad de montículo
+        self.heap = [EntradaPrioridad(prioridad, secuencia, valor) for prioridad, secuencia, valor in estado['entradas']]
+        self.entradas = {}
+        self.bytes_repetidos = 0
+        self.contados = contador_valores()
+        for i, entrada in enumerate(self.heap):
+            entrada.posicion = i
+            self._sumar_entrada(entrada)
+        for entrada in sorted(self.heap, key=lambda e: e.secuencia):
+            self.bytes_repetidos += agregar_aparicion(self.entradas, entrada.valor, entrada)
+        self.secuencia = estado['secuencia']
+        self.tamaño = len(self.heap)
+        self.version += 1
+
+    def _bytes_contenedor(self):
+        # El montículo, una EntradaPrioridad con su secuencia y su posición por elemento y el mapa valor ->
+        # entradas. El orden cacheado para las páginas no cuenta: es temporal y lo crea una lectura
+        return (sys.getsizeof(self.heap) + self.tamaño * (bytes_instancia(EntradaPrioridad) + 2 * BYTES_ENTERO)
+                + sys.getsizeof(self.entradas) + self.bytes_repetidos + self.contados.memoria_bytes())
+
+    @lectura
     def obtener_cola(self):
-        # Retorna una lista de tuplas (prioridad, valor)
-        return sorted(self.heap)
+        # Retorna una lista de tuplas (prioridad, valor) en el orden en que se desencolarían
+        return list(self._ordenada())
+
+    def _ordenada(self):
+        # El orden completo se calcula una vez por versión y se comparte entre páginas
+        if self.orden_cache is None or self.orden_cache[0] != self.version:
+            ordenadas = sorted(self.heap, key=lambda e: (e.prioridad, e.secuencia))
+            self.orden_cache = (self.version, [(e.prioridad, e.valor) for e in ordenadas])
+        return self.orden_cache[1]
+
+    @lectura
+    def pagina(self, inicio, cantidad, desde=None):
+        fin = min(inicio + cantidad, self.tamaño)
+        if inicio >= fin:
+            return [], None
+        return self._ordenada()[inicio:fin], (fin if fin < self.tamaño else None)
 
 cola_prioridad = ColaPrioridad()  # Instancia global
 
 @app.route('/cola-prioridad') # Define la ruta para la cola de prioridad
 def mostrar_cola_prioridad():
-    datos = cola_prioridad.obtener_cola() # Obtiene los datos de la cola de prioridad
-    # Creamos DataFrame con dos columnas
-    df = pd.DataFrame(datos, columns=['Prioridad', 'Valor']) if datos else pd.DataFrame(columns=['Prioridad', 'Valor'])
+    cola_prioridad = obtener_estructura('cola-prioridad') # La instancia de la sesión o la global
     return render_template('cola_prioridad.html', # Renderiza la plantilla cola_prioridad.html
-                         datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+                         datos=tabla_paginada(cola_prioridad, ('Prioridad', 'Valor')), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
                          lista=cola_prioridad) # Pasa la lista como contexto a la plantilla
 
 @app.route('/cola-prioridad/encolar', methods=['POST']) # Define la ruta para insertar un elemento en la cola de prioridad
 def encolar_cola_prioridad():
-    valores = request.form['valor'].split(',') # Obtiene los valores a insertar del formulario
+    cola_prioridad = obtener_estructura('cola-prioridad') # La instancia de la sesión o la global
+    valores = [valor.strip() for valor in request.form['valor'].split(',')] # Separa los valores por comas
     prioridad = int(request.form['prioridad']) # Obtiene la prioridad del formulario
-    tiempos = [] # Inicializa una lista para almacenar los tiempos
-    memorias = [] # Inicializa una lista para almacenar las memorias
+    _, tiempo, memoria = cola_prioridad.encolar_varios([valor for valor in valores if valor], prioridad) # Encola todo el lote en una sola operación medida
 
-    for valor in valores: # Recorre los valores separados por comas
-        valor = valor.strip() # Elimina espacios en blanco alrededor del valor
-        if valor: # Verifica que el valor no esté vacío
-            _, tiempo, memoria = cola_prioridad.encolar(valor, prioridad) # Llama a la función encolar y obtiene el tiempo y memoria
-            tiempos.append(tiempo) # Agrega el tiempo a la lista de tiempos
-            memorias.append(memoria) # Agrega la memoria a la lista de memorias
-
-    tiempo = sum(tiempos) # Suma todos los tiempos
-    memoria = sum(memorias) # Suma todas las memorias
-
-    datos = cola_prioridad.obtener_cola() # Obtiene los datos de la cola de prioridad
-    # Creamos DataFrame con dos columnas
-    df = pd.DataFrame(datos, columns=['Prioridad', 'Valor']) if datos else pd.DataFrame(columns=['Prioridad', 'Valor'])
     return render_template('cola_prioridad.html', # Renderiza la plantilla cola_prioridad.html
-                           datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+                           datos=tabla_paginada(cola_prioridad, ('Prioridad', 'Valor')), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
                            lista=cola_prioridad, # Pasa la lista como contexto a la plantilla
                            tiempos=f"{tiempo:.7f} s", # Tiempo total de ejecución
                            memorias=f"{memoria:.6f} MB") # Memoria total utilizada
 
+@app.route('/cola-prioridad/encolar/stream', methods=['POST']) # Encola un lote enorme enviado como texto plano, con progreso SSE
+def encolar_cola_prioridad_stream():
+    cola_prioridad = obtener_estructura('cola-prioridad') # La instancia de la sesión o la global
+    prioridad = request.args.get('prioridad', type=int) # El cuerpo son solo los valores; la prioridad va en la URL
+    if prioridad is None:
+        return jsonify(error="'prioridad' debe ser un entero"), 400
+    return stream_lote(cola_prioridad, lambda bloque: cola_prioridad.encolar_varios(bloque, prioridad))
+
 @app.route('/cola-prioridad/desencolar', methods=['POST']) # Define la ruta para eliminar un elemento de la cola de prioridad
 def desencolar_cola_prioridad():
+    cola_prioridad = obtener_estructura('cola-prioridad') # La instancia de la sesión o la global
     dato, tiempo, memoria = cola_prioridad.desencolar() # Llama a la función desencolar y obtiene el dato, tiempo y memoria
     mensaje = f'Elemento desencolado: {dato}' if dato else 'Cola vacía' # Mensaje de extracción
 
-    datos = cola_prioridad.obtener_cola() # Obtiene los datos de la cola de prioridad
-    # Creamos DataFrame con dos columnas
-    df = pd.DataFrame(datos, columns=['Prioridad', 'Valor']) if datos else pd.DataFrame(columns=['Prioridad', 'Valor'])
     return render_template('cola_prioridad.html', # Renderiza la plantilla cola_prioridad.html
-                           datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+                           datos=tabla_paginada(cola_prioridad, ('Prioridad', 'Valor')), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
                            lista=cola_prioridad, # Pasa la lista como contexto a la plantilla
                            mensaje_busqueda=mensaje, # Mensaje de extracción
                            tiempos=f"{tiempo:.7f} s", # Tiempo de ejecución
@@ -969,18 +4804,597 @@ def desencolar_cola_prioridad():
 
 @app.route('/cola-prioridad/peek', methods=['POST']) # Define la ruta para ver el elemento con mayor prioridad en la cola de prioridad
 def peek_cola_prioridad():
+    cola_prioridad = obtener_estructura('cola-prioridad') # La instancia de la sesión o la global
     dato, tiempo, memoria = cola_prioridad.peek() # Llama a la función peek y obtiene el dato, tiempo y memoria
     mensaje = f'Elemento con mayor prioridad: {dato}' if dato else 'Cola vacía' # Mensaje de vista
 
-    datos = cola_prioridad.obtener_cola() # Obtiene los datos de la cola de prioridad
-    # Creamos DataFrame con dos columnas
-    df = pd.DataFrame(datos, columns=['Prioridad', 'Valor']) if datos else pd.DataFrame(columns=['Prioridad', 'Valor'])
     return render_template('cola_prioridad.html', # Renderiza la plantilla cola_prioridad.html
-                           datos=df.to_html(index=False), # Convierte el DataFrame a HTML
+                           datos=tabla_paginada(cola_prioridad, ('Prioridad', 'Valor')), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
                            lista=cola_prioridad, # Pasa la lista como contexto a la plantilla
                            mensaje_busqueda=mensaje, # Mensaje de vista
                            tiempos=f"{tiempo:.7f} s", # Tiempo de ejecución
                            memorias=f"{memoria:.6f} MB") # Memoria utilizada
 
+@app.route('/cola-prioridad/cambiar-prioridad', methods=['POST']) # Define la ruta para cambiar la prioridad de un elemento
+def cambiar_prioridad_cola_prioridad():
+    cola_prioridad = obtener_estructura('cola-prioridad') # La instancia de la sesión o la global
+    valor = request.form['valor'].strip() # Obtiene el valor del formulario
+    prioridad = int(request.form['prioridad']) # Obtiene la nueva prioridad del formulario
+    exito, tiempo, memoria = cola_prioridad.cambiar_prioridad(valor, prioridad) # Cambia la prioridad y obtiene el tiempo y memoria
+    mensaje = f'Prioridad de {valor} cambiada a {prioridad}' if exito else f'Elemento {valor} no encontrado' # Mensaje del cambio
+
+    return render_template('cola_prioridad.html', # Renderiza la plantilla cola_prioridad.html
+                           datos=tabla_paginada(cola_prioridad, ('Prioridad', 'Valor')), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
+                           lista=cola_prioridad, # Pasa la lista como contexto a la plantilla
+                           mensaje_busqueda=mensaje, # Mensaje del cambio
+                           tiempos=f"{tiempo:.7f} s", # Tiempo de ejecución
+                           memorias=f"{memoria:.6f} MB") # Memoria utilizada
+
+@app.route('/cola-prioridad/eliminar', methods=['POST']) # Define la ruta para eliminar un elemento sin desencolarlo
+def eliminar_cola_prioridad():
+    cola_prioridad = obtener_estructura('cola-prioridad') # La instancia de la sesión o la global
+    valor = request.form['valor'].strip() # Obtiene el valor a eliminar del formulario
+    exito, tiempo, memoria = cola_prioridad.eliminar(valor) # Elimina el elemento y obtiene el tiempo y memoria
+    mensaje = f'Elemento eliminado: {valor}' if exito else f'Elemento {valor} no encontrado' # Mensaje de eliminación
+
+    return render_template('cola_prioridad.html', # Renderiza la plantilla cola_prioridad.html
+                           datos=tabla_paginada(cola_prioridad, ('Prioridad', 'Valor')), # Tabla HTML de la página pedida, reutilizada mientras la estructura no cambie
+                           lista=cola_prioridad, # Pasa la lista como contexto a la plantilla
+                           mensaje_busqueda=mensaje, # Mensaje de eliminación
+                           tiempos=f"{tiempo:.7f} s", # Tiempo de ejecución
+                           memorias=f"{memoria:.6f} MB") # Memoria utilizada
+
+#-------------------------------API JSON-------------------------------------
+
+# Operaciones disponibles en la API por tipo de estructura: nombre -> argumentos que recibe
+OPERACIONES_LISTA = {
+    'insertar': ('valor',),
+    'insertar_varios': ('valores',),
+    'eliminar': ('valor',),
+    'eliminar_varios': ('valores', 'modo'),
+    'buscar': ('valor',),
+}
+OPERACIONES_LISTA_POSICIONAL = dict(OPERACIONES_LISTA, insertar_en=('posicion', 'valor'), eliminar_en=('posicion',))
+OPERACIONES_LISTA_CIRCULAR = dict(OPERACIONES_LISTA, avanzar=('k',), rotar=(), insertar_despues=('valor',),
+                                  eliminar_en_cursor=(), eliminar_cada_k=('k',))
+OPERACIONES_LISTA_ORDENADA = {
+    'insertar': ('valor',),
+    'insertar_varios': ('valores',),
+    'eliminar': ('valor',),
+    'buscar': ('valor',),
+    'rango': ('minimo', 'maximo'),
+}
+OPERACIONES_PILA = {
+    'push': ('valor',),
+    'pop': (),
+    'peek': (),
+}
+OPERACIONES_BUSQUEDA = {
+    'buscar_todos': ('valores',),
+    'contar': ('valores',),
+    'buscar_prefijo': ('prefijo',),
+}
+OPERACIONES_PILA_ARREGLO = dict(OPERACIONES_PILA, push_varios=('valores',), pop_varios=('k',), **OPERACIONES_BUSQUEDA)
+OPERACIONES_COLA_SIMPLE = {
+    'encolar': ('valor',),
+    'encolar_varios': ('valores',),
+    'desencolar': (),
+    'desencolar_varios': ('k',),
+    'peek': (),
+    **OPERACIONES_BUSQUEDA,
+}
+OPERACIONES_COLA_CIRCULAR = {
+    'encolar': ('valor',),
+    'desencolar': (),
+    'redimensionar': ('capacidad',),
+}
+if isinstance(cola_circular, ColaCircular): # La cola en memoria compartida no tiene espejo columnar
+    OPERACIONES_COLA_CIRCULAR.update(OPERACIONES_BUSQUEDA)
+OPERACIONES_COLA_PRIORIDAD = {
+    'encolar': ('valor', 'prioridad'),
+    'encolar_varios': ('valores', 'prioridad'),
+    'desencolar': (),
+    'peek': (),
+    'cambiar_prioridad': ('valor', 'prioridad'),
+    'eliminar': ('valor',),
+}
+
+# Nombre en la URL -> (instancia, operaciones, método que devuelve el contenido completo)
+ESTRUCTURAS = {
+    'lista-simple': (lista, OPERACIONES_LISTA, 'obtener_lista'),
+    'lista-doble': (lista_doble, OPERACIONES_LISTA_POSICIONAL if ALMACENAMIENTO == 'bloques' else OPERACIONES_LISTA, 'obtener_lista'),
+    'lista-circular': (lista_circular, OPERACIONES_LISTA_CIRCULAR, 'obtener_lista'),
+    'lista-ordenada': (lista_ordenada, OPERACIONES_LISTA_ORDENADA, 'obtener_lista'),
+    'pila-lista': (pila_lista, OPERACIONES_PILA, 'obtener_pila'),
+    'pila-arreglo': (pila_arreglo, OPERACIONES_PILA_ARREGLO, 'copiar_pila'), # obtener_pila es una vista perezosa
+    'cola-simple': (cola_simple, OPERACIONES_COLA_SIMPLE, 'obtener_cola'),
+    'cola-circular': (cola_circular, OPERACIONES_COLA_CIRCULAR, 'obtener_cola'),
+    'cola-prioridad': (cola_prioridad, OPERACIONES_COLA_PRIORIDAD, 'obtener_cola'),
+}
+
+def _validar_argumento(nombre, valor):
+    # Retorna un mensaje de error o None. Se valida todo el lote antes de ejecutar nada para no dejarlo a medias.
+    if nombre in ('valor', 'minimo', 'maximo'):
+        if not isinstance(valor, (str, int, float, bool)) and valor is not None:
+            return f"'{nombre}' debe ser un texto o un número"
+    elif nombre == 'valores':
+        if not isinstance(valor, list) or any(_validar_argumento('valor', v) for v in valor):
+            return "'valores' debe ser una lista de textos o números"
+    elif nombre == 'prefijo':
+        if not isinstance(valor, str):
+            return "'prefijo' debe ser un texto"
+    elif nombre == 'modo':
+        if valor not in ('primera', 'todas'): # El predicado solo se puede usar desde Python
+            return "'modo' debe ser 'primera' o 'todas'"
+    elif not isinstance(valor, int) or isinstance(valor, bool):
+        return f"'{nombre}' debe ser un entero"
+    elif nombre in ('k', 'posicion') and valor < 0:
+        return f"'{nombre}' no puede ser negativo"
+    elif nombre == 'capacidad' and valor < 1:
+        return "'capacidad' debe ser al menos 1"
+    return None
+
+def _leer_operaciones(operacion, operaciones_validas):
+    # Acepta {"operaciones": [{...}, ...]} o, para operaciones de un argumento, {"valores": [...]}.
+    # En /api/<estructura>/lote cada operación indica su nombre en "op".
+    cuerpo = request.get_json(silent=True)
+    if cuerpo is None:
+        cuerpo = {}
+    if not isinstance(cuerpo, dict):
+        return None, 'El cuerpo debe ser un objeto JSON'
+    if 'operaciones' in cuerpo:
+        pedidas = cuerpo['operaciones']
+        if not isinstance(pedidas, list) or not all(isinstance(p, dict) for p in pedidas):
+            return None, "'operaciones' debe ser una lista de objetos"
+    elif 'valores' in cuerpo and operaciones_validas.get(operacion) == ('valor',):
+        if not isinstance(cuerpo['valores'], list):
+            return None, "'valores' debe ser una lista"
+        pedidas = [{'valor': v} for v in cuerpo['valores']]
+    else:
+        pedidas = [cuerpo] # Una sola operación con sus argumentos en el cuerpo
+
+    lote = []
+    for i, pedida in enumerate(pedidas):
+        nombre = pedida.get('op', operacion) if operacion == 'lote' else operacion
+        if nombre not in operaciones_validas:
+            return None, f"Operación {i}: '{nombre}' no existe para esta estructura"
+        argumentos = []
+        for argumento in operaciones_validas[nombre]:
+            if argumento not in pedida:
+                return None, f"Operación {i}: falta el argumento '{argumento}'"
+            error = _validar_argumento(argumento, pedida[argumento])
+            if error:
+                return None, f"Operación {i}: {error}"
+            argumentos.append(pedida[argumento])
+        lote.append((nombre, argumentos))
+    return lote, None
+
+def _resultado_json(resultado):
+    # Los conteos por valor de eliminar_varios van como pares [valor, cantidad]: en JSON las claves
+    # solo pueden ser texto y 1 y '1' son valores distintos
+    return [list(par) for par in resultado.items()] if isinstance(resultado, dict) else resultado
+
+def _ejecutar_lote(estructura, lote):
+    # Llama a las funciones sin medir para que todo el lote sea una sola medición
+    resultados = []
+    for nombre, argumentos in lote:
+        metodo = getattr(type(estructura), nombre)
+        metodo = getattr(metodo, 'sin_medir', metodo)
+        resultados.append(metodo(estructura, *argumentos))
+    return resultados
+
+@app.route('/api/<nombre>', methods=['GET']) # Estado de una estructura; el contenido solo si se pide con ?datos=1
+def api_estado(nombre):
+    if nombre not in ESTRUCTURAS:
+        return jsonify(error=f"Estructura '{nombre}' no existe"), 404
+    _, _, obtener = ESTRUCTURAS[nombre]
+    estructura = obtener_estructura(nombre)
+    respuesta = {'estructura': nombre, 'tamaño': estructura.tamaño, 'version': estructura.version,
+                 **_resumen_memoria(estructura)}
+    if request.args.get('datos') == '1':
+        respuesta['datos'] = list(getattr(estructura, obtener)())
+    return jsonify(respuesta)
+
+def _resumen_memoria(estructura):
+    memoria = estructura.memoria_bytes()
+    tamaño = estructura.tamaño
+    return {'memoria_bytes': memoria, 'bytes_por_elemento': memoria / tamaño if tamaño else None,
+            'incluye_valores': MEMORIA_VALORES}
+
+@app.route('/memoria', methods=['GET']) # memoria_bytes() de cada estructura, para comparar los bytes por elemento
+def memoria_estructuras():
+    estructuras = []
+    for nombre in ESTRUCTURAS:
+        estructura = obtener_estructura(nombre)
+        estructuras.append({'estructura': nombre, 'clase': type(estructura).__name__,
+                            'tamaño': estructura.tamaño, **_resumen_memoria(estructura)})
+    return jsonify(estructuras=estructuras, total_bytes=sum(e['memoria_bytes'] for e in estructuras))
+
+@app.route('/api/<nombre>/<operacion>', methods=['POST']) # Ejecuta un lote de operaciones en orden bajo una sola medición
+def api_operar(nombre, operacion):
+    if nombre not in ESTRUCTURAS:
+        return jsonify(error=f"Estructura '{nombre}' no existe"), 404
+    _, operaciones_validas, obtener = ESTRUCTURAS[nombre]
+    estructura = obtener_estructura(nombre)
+    lote, error = _leer_operaciones(operacion, operaciones_validas)
+    if error:
+        return jsonify(error=error), 400
+
+    modo = getattr(estructura, 'modo_medicion', None) or MODO_MEDICION
+    if modo == 'muestreo':
+        modo = 'tiempo' # Un lote es una sola medición; no tiene sentido muestrearla
+    resultados, tiempo, memoria = MEDIDORES[modo](_ejecutar_lote, (estructura, lote), {})
+    if METRICAS:
+        registrar_metrica(type(estructura), f'api_{operacion}', tiempo) # Todo el lote es una medición
+
+    respuesta = {
+        'estructura': nombre,
+        'resultados': [{'op': op, 'resultado': _resultado_json(resultado)} for (op, _), resultado in zip(lote, resultados)],
+        'tiempo_total': tiempo,
+        'memoria_total': memoria,
+        'tamaño': estructura.tamaño,
+        'version': estructura.version,
+        **_resumen_memoria(estructura),
+    }
+    if request.args.get('datos') == '1':
+        respuesta['datos'] = list(getattr(estructura, obtener)())
+    return jsonify(respuesta)
+
+#-------------------------------Sesiones-------------------------------------
+
+# Con EDL_SESIONES=1 cada visitante (cookie edl_sesion) trabaja con sus propias instancias de las
+# estructuras, creadas la primera vez que las usa. El registro es un LRU: si la memoria (memoria_bytes) de
+# todas las instancias pasa de EDL_PRESUPUESTO_MB, o una instancia lleva más de EDL_SESIONES_TTL
+# segundos sin usarse, se desaloja la usada hace más tiempo. Con EDL_SESIONES_DIRECTORIO el estado
+# desalojado se guarda comprimido en disco y se recupera en la siguiente visita de esa sesión.
+SESIONES = os.environ.get('EDL_SESIONES', '0') == '1'
+COOKIE_SESION = 'edl_sesion'
+
+FABRICAS = {
+    'lista-simple': lambda: ListaEnlazadaPool() if ALMACENAMIENTO == 'pool' else ListaEnlazada(indexada=INDICE_LISTAS),
+    'lista-doble': lambda: (ListaEnlazadaDoblePool() if ALMACENAMIENTO == 'pool' else
+                            ListaDobleDesenrollada() if ALMACENAMIENTO == 'bloques' else ListaEnlazadaDoble(indexada=INDICE_LISTAS)),
+    'lista-circular': lambda: ListaCircularPool() if ALMACENAMIENTO == 'pool' else ListaCircular(indexada=INDICE_LISTAS),
+    'lista-ordenada': ListaOrdenada,
+    'pila-lista': lambda: PilaListaPool() if ALMACENAMIENTO == 'pool' else PilaLista(),
+    'pila-arreglo': lambda: PilaArreglo() if PILA_TIPO == 'objetos' else PilaArregloTipada(PILA_TIPO),
+    'cola-simple': ColaSimple,
+    'cola-circular': ColaCircular,
+    'cola-prioridad': ColaPrioridad,
+}
+
+class RegistroSesiones:
+    def __init__(self, presupuesto, ttl, directorio=None):
+        self.presupuesto = presupuesto # Bytes que pueden estar en memoria entre todas las sesiones
+        self.ttl = ttl # Segundos sin uso tras los que se desaloja una instancia
+        self.directorio = directorio # Dónde volcar las instancias desalojadas (None: se descartan)
+        self.entradas = OrderedDict() # (sesión, estructura) -> [instancia, bytes, último uso, peticiones usándola]
+        self.cerrojo = threading.Lock() # Solo protege los diccionarios; el disco se toca sin él
+        self.cerrojos_claves = {} # clave -> [cerrojo de la clave, hilos que lo usan]
+        self.volcando = {} # clave -> instancia ya desalojada que aún no se escribe en disco
+        self.bytes_residentes = 0
+        self.estadisticas = {
+            'creadas': 0,
+            'restauradas': 0, # Recuperadas desde el disco
+            'desalojos_presupuesto': 0,
+            'desalojos_inactividad': 0,
+            'volcadas': 0,
+            'bytes_volcados': 0,
+        }
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+
+    def _ruta(self, clave):
+        return os.path.join(self.directorio, f'{clave[0]}-{clave[1]}.bin')
+
+    def _tomar_cerrojo_clave(self, clave):
+        # Requiere self.cerrojo. El cerrojo de una clave ordena su volcado y su recuperación del disco
+        par = self.cerrojos_claves.get(clave)
+        if par is None:
+            par = self.cerrojos_claves[clave] = [threading.Lock(), 0]
+        par[1] += 1
+        return par[0]
+
+    def _dejar_cerrojo_clave(self, clave):
+        # Requiere self.cerrojo
+        par = self.cerrojos_claves[clave]
+        par[1] -= 1
+        if not par[1]:
+            del self.cerrojos_claves[clave]
+
+    def obtener(self, sesion, nombre):
+        clave = (sesion, nombre)
+        with self.cerrojo:
+            entrada = self.entradas.get(clave)
+            if entrada is not None:
+                self.entradas.move_to_end(clave)
+                entrada[3] += 1
+                return entrada[0]
+            cerrojo_clave = self._tomar_cerrojo_clave(clave)
+        # No está en memoria: se crea o se recupera con el cerrojo de la clave, así las demás sesiones
+        # siguen atendiéndose mientras se lee el disco
+        try:
+            with cerrojo_clave:
+                with self.cerrojo:
+                    entrada = self.entradas.get(clave) # Otro hilo pudo cargarla mientras se esperaba
+                    if entrada is None:
+                        estructura = self.volcando.pop(clave, None) # Desalojada pero aún sin escribir: se retoma
+                        if estructura is not None:
+                            entrada = self.entradas[clave] = [estructura, 0, time.monotonic(), 0]
+                    else:
+                        self.entradas.move_to_end(clave)
+                    if entrada is not None:
+                        entrada[3] += 1
+                        return entrada[0]
+                estructura = FABRICAS[nombre]()
+                ruta = self._ruta(clave) if self.directorio else None
+                restaurada = bool(ruta) and os.path.exists(ruta)
+                if restaurada:
+                    with open(ruta, 'rb') as archivo:
+                        estructura.restaurar_estado(marshal.loads(zlib.decompress(archivo.read())))
+                    os.remove(ruta)
+                with self.cerrojo:
+                    self.estadisticas['restauradas' if restaurada else 'creadas'] += 1
+                    self.entradas[clave] = [estructura, 0, time.monotonic(), 1]
+                return estructura
+        finally:
+            with self.cerrojo:
+                self._dejar_cerrojo_clave(clave)
+
+    def soltar(self, claves):
+        # Al terminar la petición: actualiza la memoria de lo que usó y desaloja si hace falta
+        with self.cerrojo:
+            ahora = time.monotonic()
+            for clave in claves:
+                entrada = self.entradas.get(clave)
+                if entrada is None:
+                    continue
+                entrada[3] -= 1
+                bytes_nuevos = entrada[0].memoria_bytes()
+                self.bytes_residentes += bytes_nuevos - entrada[1]
+                entrada[1] = bytes_nuevos
+                entrada[2] = ahora
+            desalojadas = self._desalojar(ahora)
+        for clave, estructura in desalojadas:
+            self._volcar(clave, estructura)
+
+    def _desalojar(self, ahora):
+        # Requiere self.cerrojo. Recorre de la usada hace más tiempo a la más reciente y se salta las que
+        # otra petición está usando. Retorna las que hay que volcar al disco, ya fuera del registro
+        desalojadas = []
+        for clave, entrada in list(self.entradas.items()):
+            excedido = self.bytes_residentes > self.presupuesto
+            inactiva = ahora - entrada[2] > self.ttl
+            if not excedido and not inactiva:
+                break
+            if entrada[3]:
+                continue
+            del self.entradas[clave]
+            self.bytes_residentes -= entrada[1]
+            self.estadisticas['desalojos_inactividad' if inactiva else 'desalojos_presupuesto'] += 1
+            if self.directorio:
+                self.volcando[clave] = entrada[0]
+                self._tomar_cerrojo_clave(clave)
+                desalojadas.append((clave, entrada[0]))
+        return desalojadas
+
+    def _volcar(self, clave, estructura):
+        # Serializa y escribe sin el cerrojo del registro; el de la clave hace esperar a quien la pida
+        try:
+            with self.cerrojos_claves[clave][0]:
+                with self.cerrojo:
+                    if self.volcando.get(clave) is not estructura:
+                        return # Se pidió de nuevo antes de escribirla y volvió a memoria
+                datos = zlib.compress(marshal.dumps(estructura.exportar_estado()))
+                ruta = self._ruta(clave)
+                with open(ruta + '.tmp', 'wb') as archivo:
+                    archivo.write(datos)
+                os.replace(ruta + '.tmp', ruta)
+                with self.cerrojo:
+                    del self.volcando[clave]
+                    self.estadisticas['volcadas'] += 1
+                    self.estadisticas['bytes_volcados'] += len(datos)
+        finally:
+            with self.cerrojo:
+                self._dejar_cerrojo_clave(clave)
+
+    def resumen(self, sesion=None):
+        with self.cerrojo:
+            resultado = {
+                'sesiones': len({s for s, _ in self.entradas}),
+                'instancias': len(self.entradas),
+                'bytes_residentes': self.bytes_residentes,
+                'presupuesto': self.presupuesto,
+                'ttl': self.ttl,
+                **self.estadisticas,
+            }
+            if sesion is not None:
+                resultado['sesion'] = {nombre: {'tamaño': entrada[0].tamaño, 'bytes': entrada[1]}
+                                       for (s, nombre), entrada in self.entradas.items() if s == sesion}
+            return resultado
+
+sesiones = RegistroSesiones(
+    presupuesto=float(os.environ.get('EDL_PRESUPUESTO_MB', '256')) * 1024 * 1024,
+    ttl=float(os.environ.get('EDL_SESIONES_TTL', '1800')),
+    directorio=os.environ.get('EDL_SESIONES_DIRECTORIO') or None,
+) if SESIONES else None
+
+def obtener_estructura(nombre):
+    # Instancia que usa la petición actual: la de su sesión con EDL_SESIONES=1, si no la global.
+    # La cola circular en memoria compartida es la misma para todos por diseño.
+    if sesiones is None or (nombre == 'cola-circular' and COLA_COMPARTIDA):
+        return ESTRUCTURAS[nombre][0]
+    g.estructuras_sesion.append((g.sesion, nombre))
+    return sesiones.obtener(g.sesion, nombre)
+
+@app.before_request
+def abrir_sesion():
+    if sesiones is None:
+        return
+    sesion = request.cookies.get(COOKIE_SESION, '')
+    # Solo se aceptan identificadores con la forma de los que genera el servidor (también nombran archivos)
+    g.sesion_nueva = len(sesion) != 32 or not all(c in '0123456789abcdef' for c in sesion)
+    g.sesion = uuid.uuid4().hex if g.sesion_nueva else sesion
+    g.estructuras_sesion = []
+
+@app.after_request
+def guardar_cookie_sesion(respuesta):
+    if sesiones is not None and g.get('sesion_nueva'):
+        respuesta.set_cookie(COOKIE_SESION, g.sesion, httponly=True, samesite='Lax')
+    return respuesta
+
+@app.teardown_request
+def soltar_estructuras_sesion(error=None):
+    if sesiones is not None:
+        sesiones.soltar(g.get('estructuras_sesion', ())) # También revisa la inactividad aunque no se usara nada
+
+@app.route('/sesiones') # Instancias residentes, su memoria y desalojos del registro de sesiones
+def estado_sesiones():
+    if sesiones is None:
+        return jsonify(activo=False)
+    return jsonify(activo=True, **sesiones.resumen(g.sesion))
+
+#-------------------------------Métricas Prometheus-------------------------------------
+
+def _etiquetas(**etiquetas):
+    valores = ','.join(f'{nombre}="{str(valor).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+                       for nombre, valor in etiquetas.items())
+    return '{' + valores + '}'
+
+@app.route('/metrics') # Histogramas de latencia, tamaño y memoria en formato de texto de Prometheus
+def metricas():
+    lineas = [
+        '# HELP edl_operacion_segundos Latencia de cada operación medida por benchmark (api_* es un lote completo de la API).',
+        '# TYPE edl_operacion_segundos histogram',
+    ]
+    for (clase, operacion), cuentas in sorted(histogramas_totales().items(), key=lambda par: (par[0][0].__name__, par[0][1])):
+        clase = clase.__name__
+        acumulado = 0
+        for limite, cuenta in zip(LIMITES_LATENCIA + ('+Inf',), cuentas):
+            acumulado += cuenta
+            lineas.append(f'edl_operacion_segundos_bucket{_etiquetas(estructura=clase, operacion=operacion, le=limite)} {acumulado}')
+        etiquetas = _etiquetas(estructura=clase, operacion=operacion)
+        lineas.append(f'edl_operacion_segundos_sum{etiquetas} {cuentas[-1]}')
+        lineas.append(f'edl_operacion_segundos_count{etiquetas} {acumulado}')
+
+    # Las instancias globales; las de sesión se resumen aparte
+    tamaños = ['# HELP edl_estructura_elementos Elementos de cada estructura global.',
+               '# TYPE edl_estructura_elementos gauge']
+    memorias = ['# HELP edl_estructura_bytes Memoria de cada estructura global según memoria_bytes().',
+                '# TYPE edl_estructura_bytes gauge']
+    for nombre, (estructura, _, _) in ESTRUCTURAS.items():
+        etiquetas = _etiquetas(nombre=nombre, estructura=type(estructura).__name__)
+        tamaños.append(f'edl_estructura_elementos{etiquetas} {estructura.tamaño}')
+        memorias.append(f'edl_estructura_bytes{etiquetas} {estructura.memoria_bytes()}')
+    lineas += tamaños + memorias
+
+    lineas += ['# HELP edl_cola_circular_rechazos_total Encolados rechazados por una cola circular llena o un valor que no cabe en la ranura.',
+               '# TYPE edl_cola_circular_rechazos_total counter']
+    with cerrojo_metricas:
+        contados = sorted(rechazos.items())
+    lineas += [f'edl_cola_circular_rechazos_total{_etiquetas(estructura=clase, motivo=motivo)} {total}'
+               for (clase, motivo), total in contados]
+
+    if sesiones is not None:
+        resumen = sesiones.resumen()
+        lineas += ['# HELP edl_sesiones_instancias Instancias de sesión residentes en memoria.',
+                   '# TYPE edl_sesiones_instancias gauge',
+                   f"edl_sesiones_instancias {resumen['instancias']}",
+                   '# HELP edl_sesiones_bytes Memoria de las instancias de sesión residentes al terminar su última petición.',
+                   '# TYPE edl_sesiones_bytes gauge',
+                   f"edl_sesiones_bytes {resumen['bytes_residentes']}"]
+    return Response('\n'.join(lineas) + '\n', mimetype='text/plain; version=0.0.4')
+
+#-------------------------------Persistencia-------------------------------------
+
+def _aplicar_registrada(estructura, operacion, argumentos):
+    # Reproduce una operación del registro sin medirla ni volver a anotarla
+    inspect.unwrap(getattr(type(estructura), operacion))(estructura, *argumentos)
+
+@lectura
+def _copiar_registrada(estructura):
+    # El estado y el lsn de su última operación se leen con el mismo cerrojo de lectura; las demás
+    # estructuras siguen atendiendo escrituras mientras tanto
+    return getattr(estructura, 'lsn_registro', 0), estructura.exportar_estado()
+
+def iniciar_persistencia(directorio):
+    global registro
+    nuevo = RegistroOperaciones(
+        directorio,
+        intervalo=float(os.environ.get('EDL_WAL_INTERVALO', '0.005')),
+        sincrono=os.environ.get('EDL_WAL_SINCRONO', '0') == '1',
+        instantanea_cada=int(os.environ.get('EDL_INSTANTANEA_CADA', '10000')),
+        en_fondo=os.environ.get('EDL_INSTANTANEA_FONDO', '0') == '1',
+    )
+    # La cola compartida guarda su estado solo en el segmento: ni se anota ni se reproduce
+    estructuras = {nombre: estructura for nombre, (estructura, _, _) in ESTRUCTURAS.items()
+                   if not isinstance(estructura, ColaCircularCompartida)}
+    nuevo.recuperar(estructuras, _aplicar_registrada, _copiar_registrada)
+    for nombre, estructura in estructuras.items():
+        estructura.nombre_registro = nombre
+    registro = nuevo
+    atexit.register(nuevo.cerrar)
+    app.logger.info('Recuperación: %d operaciones reproducidas en %.3f s',
+                    nuevo.estadisticas['registros_reproducidos'], nuevo.estadisticas['tiempo_recuperacion'])
+
+@app.route('/persistencia') # Estadísticas del registro de operaciones: recuperación, escrituras y fsyncs
+def estado_persistencia():
+    if registro is None:
+        return jsonify(activo=False)
+    return jsonify(activo=True, lsn=registro.lsn, lsn_durable=registro.lsn_durable,
+                   lsn_instantanea=registro.lsn_instantanea, **registro.estadisticas)
+
+@app.route('/persistencia/instantanea', methods=['POST']) # Fuerza una instantánea de todas las estructuras
+def forzar_instantanea():
+    if registro is None:
+        return jsonify(error='La persistencia no está activa (EDL_DURABLE)'), 400
+    registro.instantanea()
+    return jsonify(lsn_instantanea=registro.lsn_instantanea)
+
+# Con debug=True el proceso que vigila los cambios también importa app.py; solo el que atiende peticiones
+# (WERKZEUG_RUN_MAIN) abre el registro
+if os.environ.get('EDL_DURABLE') and (__name__ != '__main__' or os.environ.get('WERKZEUG_RUN_MAIN') == 'true'):
+    iniciar_persistencia(os.environ['EDL_DURABLE'])
+
+#-------------------------------Arranque-------------------------------------
+
+PRECOMPILAR_PLANTILLAS = os.environ.get('EDL_PRECOMPILAR', '1') == '1'
+
+def _rss_mb():
+    # Memoria residente del proceso sin psutil: /proc en Linux, el pico de getrusage en otros sistemas
+    try:
+        with open('/proc/self/statm') as archivo:
+            return int(archivo.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except OSError:
+        import resource
+        pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return pico / (1024 * 1024) if sys.platform == 'darwin' else pico / 1024 # bytes en macOS, KB en Linux
+
+def precompilar_plantillas():
+    # Compila todas las plantillas al arrancar para que la primera petición de cada vista no lo haga;
+    # quedan en la caché del entorno de Jinja
+    inicio = time.perf_counter()
+    nombres = app.jinja_env.list_templates(extensions=['html'])
+    for nombre in nombres:
+        app.jinja_env.get_template(nombre)
+    return len(nombres), time.perf_counter() - inicio
+
+plantillas, tiempo_plantillas = precompilar_plantillas() if PRECOMPILAR_PLANTILLAS else (0, 0.0)
+ARRANQUE = {
+    'importacion_s': time.perf_counter() - INICIO_IMPORTACION, # Incluye Flask, la recuperación y las plantillas
+    'plantillas': plantillas,
+    'plantillas_s': tiempo_plantillas,
+    'rss_base_mb': _rss_mb(),
+    'modulos': len(sys.modules),
+}
+app.logger.info('Arranque: %.3f s de importación (%d plantillas en %.3f s), %.1f MB de RSS base',
+                ARRANQUE['importacion_s'], plantillas, tiempo_plantillas, ARRANQUE['rss_base_mb'])
+
+@app.route('/arranque') # Tiempo de importación y memoria base del proceso, para vigilar el arranque de workers
+def estado_arranque():
+    return jsonify(rss_actual_mb=_rss_mb(),
+                   memory_profiler_cargado='memory_profiler' in sys.modules, # Solo tras una medición rss
+                   **ARRANQUE)
+
 if __name__ == '__main__': # Si este archivo se ejecuta directamente
     app.run(debug=True, host='0.0.0.0') # Inicia la aplicación Flask en modo de depuración
\ No newline at end of file
@@ -0,0 +1,95 @@
+import os
+import sys
+import time
+import argparse
+import multiprocessing
+
+# Rendimiento de la cola circular en memoria compartida con varios procesos productores y consumidores.
+# Para cada combinación (productores, consumidores) crea un segmento nuevo, cada productor encola
+# --operaciones pares (productor, i) y los consumidores desencolan hasta recibir un None de fin.
+# Al final comprueba que no se perdió ni se repitió ningún elemento.
+#
+#   python benchmark_cola_compartida.py --maximo-procesos 4 --operaciones 20000
+
+os.environ.setdefault('EDL_MEDICION', 'tiempo')
+
+from app import ColaCircularCompartida
+
+def _productor(nombre, productor, operaciones, listo):
+    cola = ColaCircularCompartida(nombre) # Cada proceso abre su propio descriptor para el flock
+    encolar = type(cola).encolar.sin_medir
+    listo.wait()
+    for i in range(operaciones):
+        while not encolar(cola, (productor, i)):
+            time.sleep(0) # Cola llena: cede el procesador a los consumidores
+    cola.cerrar()
+
+def _consumidor(nombre, listo, resultados):
+    cola = ColaCircularCompartida(nombre)
+    desencolar = type(cola).desencolar.sin_medir
+    recibidos = 0
+    suma = 0
+    listo.wait()
+    while True:
+        dato = desencolar(cola)
+        if dato is None:
+            time.sleep(0) # Cola vacía: cede el procesador a los productores
+            continue
+        if dato == 'fin':
+            break
+        recibidos += 1
+        suma += dato[1]
+    cola.cerrar()
+    resultados.put((recibidos, suma))
+
+def medir(nombre, productores, consumidores, operaciones, capacidad):
+    contexto = multiprocessing.get_context('fork')
+    cola = ColaCircularCompartida(nombre, capacidad=capacidad, maximo=capacidad)
+    listo = contexto.Barrier(productores + consumidores + 1)
+    resultados = contexto.Queue()
+    procesos_p = [contexto.Process(target=_productor, args=(nombre, p, operaciones, listo)) for p in range(productores)]
+    procesos_c = [contexto.Process(target=_consumidor, args=(nombre, listo, resultados)) for _ in range(consumidores)]
+    for proceso in procesos_p + procesos_c:
+        proceso.start()
+    try:
+        listo.wait()
+        inicio = time.perf_counter()
+        for proceso in procesos_p:
+            proceso.join()
+        encolar = type(cola).encolar.sin_medir
+        for _ in range(consumidores):
+            while not encolar(cola, 'fin'):
+                time.sleep(0)
+        totales = [resultados.get() for _ in range(consumidores)]
+        duracion = time.perf_counter() - inicio
+        for proceso in procesos_c:
+            proceso.join()
+    finally:
+        cola.destruir()
+
+    esperados = productores * operaciones
+    recibidos = sum(t[0] for t in totales)
+    suma = sum(t[1] for t in totales)
+    correcto = recibidos == esperados and suma == productores * operaciones * (operaciones - 1) // 2
+    return duracion, esperados / duracion, correcto
+
+def main():
+    parser = argparse.ArgumentParser(description='Rendimiento de ColaCircularCompartida con varios procesos')
+    parser.add_argument('--maximo-procesos', type=int, default=4, help='N: se prueban de 1 a N productores y consumidores')
+    parser.add_argument('--operaciones', type=int, default=20000, help='elementos que encola cada productor')
+    parser.add_argument('--capacidad', type=int, default=1024)
+    args = parser.parse_args()
+
+    nombre = f'edl_benchmark_{os.getpid()}'
+    print(f"{'productores':>11} {'consumidores':>12} {'segundos':>9} {'ops/s':>10}  correcto")
+    fallos = 0
+    for productores in range(1, args.maximo_procesos + 1):
+        for consumidores in range(1, args.maximo_procesos + 1):
+            duracion, por_segundo, correcto = medir(nombre, productores, consumidores, args.operaciones, args.capacidad)
+            fallos += not correcto
+            print(f'{productores:>11} {consumidores:>12} {duracion:>9.3f} {por_segundo:>10.0f}  {"sí" if correcto else "NO"}')
+    if fallos:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
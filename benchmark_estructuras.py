@@ -0,0 +1,468 @@
+import os
+import gc
+import sys
+import csv
+import json
+import math
+import time
+import random
+import argparse
+import platform
+import tracemalloc
+
+# Banco de pruebas fuera de línea: importa las clases de app.py (sin levantar Flask) y mide cargas de
+# trabajo fijas para cada estructura en varios tamaños, con calentamiento, repeticiones y percentiles.
+# Los métodos se llaman por su versión sin_medir para no sumar el costo del decorador benchmark.
+#
+#   python benchmark_estructuras.py --tamaños 10,100,1000,10000 --json resultados.json --csv resultados.csv
+#   python benchmark_estructuras.py --linea-base resultados.json --umbral 0.25   # falla si algo empeora
+#
+# Para cada (estructura, carga) se ajusta la curva de complejidad que mejor explica la mediana por
+# operación en función del tamaño: O(1), O(log n), O(n) u O(n log n).
+
+os.environ.setdefault('EDL_MEDICION', 'tiempo')
+
+import app
+
+TAMAÑOS = (10, 100, 1000, 10 ** 4, 10 ** 5, 10 ** 6)
+
+# Nombre -> (fábrica, tipo). El tipo decide qué cargas de trabajo aplican.
+ESTRUCTURAS = {
+    'lista-simple': (lambda: app.ListaEnlazada(), 'lista'),
+    'lista-simple-indexada': (lambda: app.ListaEnlazada(indexada=True), 'lista'),
+    'lista-simple-pool': (lambda: app.ListaEnlazadaPool(), 'lista'),
+    'lista-doble': (lambda: app.ListaEnlazadaDoble(), 'lista'),
+    'lista-doble-indexada': (lambda: app.ListaEnlazadaDoble(indexada=True), 'lista'),
+    'lista-doble-pool': (lambda: app.ListaEnlazadaDoblePool(), 'lista'),
+    'lista-doble-desenrollada': (lambda: app.ListaDobleDesenrollada(), 'lista'),
+    'lista-circular': (lambda: app.ListaCircular(), 'lista'),
+    'lista-circular-indexada': (lambda: app.ListaCircular(indexada=True), 'lista'),
+    'lista-circular-pool': (lambda: app.ListaCircularPool(), 'lista'),
+    'lista-ordenada': (lambda: app.ListaOrdenada(), 'lista'),
+    'pila-lista': (lambda: app.PilaLista(), 'pila'),
+    'pila-lista-pool': (lambda: app.PilaListaPool(), 'pila'),
+    'pila-arreglo': (lambda: app.PilaArreglo(), 'pila'),
+    'pila-arreglo-entero': (lambda: app.PilaArregloTipada('entero'), 'pila'),
+    'pila-arreglo-real': (lambda: app.PilaArregloTipada('real'), 'pila'),
+    'cola-simple': (lambda: app.ColaSimple(), 'cola'),
+    'cola-circular': (lambda: app.ColaCircular(elastica=True), 'cola'),
+    'cola-prioridad': (lambda: app.ColaPrioridad(), 'prioridad'),
+}
+
+def _metodo(estructura, nombre):
+    metodo = getattr(type(estructura), nombre)
+    return getattr(metodo, 'sin_medir', metodo)
+
+def llenar(estructura, tipo, n, azar, valores=None):
+    if valores is None:
+        valores = [str(i) for i in range(n)]
+    if tipo == 'lista':
+        _metodo(estructura, 'insertar_varios')(estructura, valores)
+    elif tipo == 'pila':
+        push = _metodo(estructura, 'push')
+        for valor in valores:
+            push(estructura, valor)
+    elif tipo == 'cola':
+        if hasattr(estructura, 'encolar_varios'):
+            _metodo(estructura, 'encolar_varios')(estructura, valores)
+        else:
+            encolar = _metodo(estructura, 'encolar')
+            for valor in valores:
+                encolar(estructura, valor)
+    else:
+        encolar = _metodo(estructura, 'encolar')
+        for valor in valores:
+            encolar(estructura, valor, azar.randrange(100))
+    return valores
+
+#-------------------------------Cargas de trabajo---------------------------------
+# Cada carga prepara la estructura (sin medir) y retorna la lista de operaciones (método, argumentos)
+# que se miden una por una. `ops` es el máximo de operaciones; las que consumen la estructura se
+# limitan a su tamaño.
+
+def carga_insercion(estructura, tipo, n, ops, azar):
+    llenar(estructura, tipo, n, azar)
+    if tipo == 'lista':
+        metodo = _metodo(estructura, 'insertar')
+    elif tipo == 'pila':
+        metodo = _metodo(estructura, 'push')
+    else:
+        metodo = _metodo(estructura, 'encolar')
+    if tipo == 'prioridad':
+        return [(metodo, (f'n{i}', azar.randrange(100))) for i in range(ops)]
+    return [(metodo, (f'n{i}',)) for i in range(ops)]
+
+def carga_eliminacion(estructura, tipo, n, ops, azar):
+    valores = llenar(estructura, tipo, n, azar)
+    if tipo == 'pila':
+        return [(_metodo(estructura, 'pop'), ())] * min(ops, n)
+    ops = min(ops, max(1, n // 10)) # Como mucho un 10 %: la búsqueda del valor recorre casi el mismo largo siempre
+    eliminar = _metodo(estructura, 'eliminar')
+    return [(eliminar, (valor,)) for valor in azar.sample(valores, ops)]
+
+def carga_eliminacion_lote(estructura, tipo, n, ops, azar):
+    # Los mismos valores que 'eliminacion', pero en una sola llamada a eliminar_varios: comparar su
+    # mediana con la de 'eliminacion' multiplicada por la cantidad de valores
+    valores = llenar(estructura, tipo, n, azar)
+    ops = min(ops, max(1, n // 10))
+    return [(_metodo(estructura, 'eliminar_varios'), (azar.sample(valores, ops),))]
+
+def carga_busqueda_acierto(estructura, tipo, n, ops, azar):
+    valores = llenar(estructura, tipo, n, azar)
+    buscar = _metodo(estructura, 'buscar')
+    return [(buscar, (azar.choice(valores),)) for _ in range(ops)]
+
+def carga_busqueda_fallo(estructura, tipo, n, ops, azar):
+    llenar(estructura, tipo, n, azar)
+    buscar = _metodo(estructura, 'buscar')
+    return [(buscar, (f'ausente{i}',)) for i in range(ops)]
+
+def carga_recorrido(estructura, tipo, n, ops, azar):
+    llenar(estructura, tipo, n, azar)
+    return [(_metodo(estructura, 'obtener_lista'), ())] * ops
+
+def carga_insercion_posicional(estructura, tipo, n, ops, azar):
+    llenar(estructura, tipo, n, azar)
+    insertar_en = _metodo(estructura, 'insertar_en')
+    return [(insertar_en, (azar.randrange(n + i + 1), f'n{i}')) for i in range(ops)]
+
+def carga_eliminacion_posicional(estructura, tipo, n, ops, azar):
+    llenar(estructura, tipo, n, azar)
+    eliminar_en = _metodo(estructura, 'eliminar_en')
+    return [(eliminar_en, (azar.randrange(n - i),)) for i in range(min(ops, n))]
+
+def carga_busqueda_vectorizada(estructura, tipo, n, ops, azar):
+    # Diez valores por consulta, todas sus posiciones. La primera búsqueda (que crea el espejo
+    # columnar) queda fuera de la medición
+    valores = llenar(estructura, tipo, n, azar)
+    buscar_todos = _metodo(estructura, 'buscar_todos')
+    buscar_todos(estructura, valores[:1])
+    return [(buscar_todos, (azar.sample(valores, min(10, n)),)) for _ in range(ops)]
+
+def carga_rotacion(estructura, tipo, n, ops, azar):
+    # Avanzar el cursor pocos pasos y rotar: ninguna de las dos depende del tamaño
+    llenar(estructura, tipo, n, azar)
+    avanzar, rotar = _metodo(estructura, 'avanzar'), _metodo(estructura, 'rotar')
+    operaciones = []
+    for _ in range(ops // 2):
+        operaciones.append((avanzar, (azar.randrange(1, 8),)))
+        operaciones.append((rotar, ()))
+    return operaciones
+
+def carga_josephus(estructura, tipo, n, ops, azar):
+    # Una vuelta completa quitando cada segundo nodo (n // 2 eliminaciones) en una sola llamada
+    llenar(estructura, tipo, n, azar)
+    return [(_metodo(estructura, 'eliminar_cada_k'), (2,))]
+
+def carga_vaciado_fifo(estructura, tipo, n, ops, azar):
+    llenar(estructura, tipo, n, azar)
+    return [(_metodo(estructura, 'desencolar'), ())] * min(ops, n)
+
+def carga_alternancia_lifo(estructura, tipo, n, ops, azar):
+    llenar(estructura, tipo, n, azar)
+    push, pop = _metodo(estructura, 'push'), _metodo(estructura, 'pop')
+    operaciones = []
+    for i in range(ops // 2):
+        operaciones.append((push, (f'n{i}',)))
+        operaciones.append((pop, ()))
+    return operaciones
+
+def carga_lote_lifo(estructura, tipo, n, ops, azar):
+    # Apilar y sacar bloques de 100 valores con una sola llamada cada uno
+    llenar(estructura, tipo, n, azar)
+    push_varios, pop_varios = _metodo(estructura, 'push_varios'), _metodo(estructura, 'pop_varios')
+    bloque = [str(i) for i in range(100)]
+    operaciones = []
+    for _ in range(ops // 2):
+        operaciones.append((push_varios, (bloque,)))
+        operaciones.append((pop_varios, (100,)))
+    return operaciones
+
+def carga_mezcla_prioridad(estructura, tipo, n, ops, azar):
+    valores = llenar(estructura, tipo, n, azar)
+    encolar = _metodo(estructura, 'encolar')
+    desencolar = _metodo(estructura, 'desencolar')
+    cambiar = _metodo(estructura, 'cambiar_prioridad')
+    operaciones = []
+    for i in range(ops):
+        r = azar.random()
+        if r < 0.5:
+            operaciones.append((encolar, (f'n{i}', azar.randrange(100))))
+        elif r < 0.8:
+            operaciones.append((desencolar, ()))
+        else:
+            operaciones.append((cambiar, (azar.choice(valores), azar.randrange(100))))
+    return operaciones
+
+# Tipo -> cargas que aplican. Las marcadas como lineales recorren la estructura en cada operación en el
+# peor caso, así que en tamaños grandes se limita cuántas se hacen (ver --presupuesto).
+CARGAS = {
+    'lista': ('insercion', 'eliminacion', 'eliminacion_lote', 'busqueda_acierto', 'busqueda_fallo', 'recorrido',
+              'insercion_posicional', 'eliminacion_posicional', 'rotacion', 'josephus'),
+    'pila': ('insercion', 'eliminacion', 'alternancia_lifo', 'lote_lifo', 'busqueda_vectorizada'),
+    'cola': ('insercion', 'vaciado_fifo', 'busqueda_vectorizada'),
+    'prioridad': ('insercion', 'eliminacion', 'vaciado_fifo', 'mezcla_prioridad'),
+}
+FUNCIONES_CARGA = {
+    'insercion': carga_insercion,
+    'eliminacion': carga_eliminacion,
+    'eliminacion_lote': carga_eliminacion_lote,
+    'busqueda_acierto': carga_busqueda_acierto,
+    'busqueda_fallo': carga_busqueda_fallo,
+    'recorrido': carga_recorrido,
+    'busqueda_vectorizada': carga_busqueda_vectorizada,
+    'insercion_posicional': carga_insercion_posicional,
+    'eliminacion_posicional': carga_eliminacion_posicional,
+    'rotacion': carga_rotacion,
+    'josephus': carga_josephus,
+    'vaciado_fifo': carga_vaciado_fifo,
+    'alternancia_lifo': carga_alternancia_lifo,
+    'lote_lifo': carga_lote_lifo,
+    'mezcla_prioridad': carga_mezcla_prioridad,
+}
+CARGAS_LINEALES = {'eliminacion', 'eliminacion_lote', 'busqueda_vectorizada', 'busqueda_acierto', 'busqueda_fallo', 'recorrido',
+                   'insercion_posicional', 'eliminacion_posicional', 'josephus'}
+METODO_REQUERIDO = { # Cargas que solo corren si la estructura tiene ese método
+    'eliminacion_lote': 'eliminar_varios',
+    'insercion_posicional': 'insertar_en',
+    'eliminacion_posicional': 'eliminar_en',
+    'busqueda_vectorizada': 'buscar_todos',
+    'rotacion': 'rotar',
+    'josephus': 'eliminar_cada_k',
+    'lote_lifo': 'push_varios',
+}
+
+#-------------------------------Medición---------------------------------
+
+def percentil(ordenados, p):
+    if not ordenados:
+        return 0.0
+    k = (len(ordenados) - 1) * p
+    i = int(k)
+    j = min(i + 1, len(ordenados) - 1)
+    return ordenados[i] + (ordenados[j] - ordenados[i]) * (k - i)
+
+def ejecutar(operaciones):
+    # Tiempo de cada operación en ns; el recolector se apaga para que sus pausas no caigan al azar
+    tiempos = []
+    reloj = time.perf_counter_ns
+    gc.collect()
+    gc.disable()
+    try:
+        for metodo, argumentos in operaciones:
+            inicio = reloj()
+            metodo(*argumentos)
+            tiempos.append(reloj() - inicio)
+    finally:
+        gc.enable()
+    return tiempos
+
+def medir(nombre, carga, n, repeticiones, ops, semilla):
+    fabrica, tipo = ESTRUCTURAS[nombre]
+    funcion = FUNCIONES_CARGA[carga]
+    muestras = []
+    medias = []
+    for repeticion in range(repeticiones + 1):
+        estructura = fabrica()
+        azar = random.Random(semilla + repeticion)
+        operaciones = [(metodo, (estructura,) + args) for metodo, args in funcion(estructura, tipo, n, ops, azar)]
+        tiempos = ejecutar(operaciones)
+        if repeticion == 0:
+            continue # Calentamiento: caches, asignador y rutas de código ya usadas
+        muestras.extend(tiempos)
+        medias.append(sum(tiempos) / len(tiempos) if tiempos else 0.0)
+    muestras.sort()
+    return {
+        'estructura': nombre,
+        'carga': carga,
+        'n': n,
+        'repeticiones': repeticiones,
+        'operaciones': len(muestras) // max(1, repeticiones),
+        'media_ns': sum(muestras) / len(muestras) if muestras else 0.0,
+        'min_ns': muestras[0] if muestras else 0,
+        'p50_ns': percentil(muestras, 0.50),
+        'p90_ns': percentil(muestras, 0.90),
+        'p99_ns': percentil(muestras, 0.99),
+        'desviacion_medias_ns': _desviacion(medias),
+    }
+
+def medir_memoria(nombre, n):
+    # Bytes que la estructura reserva por elemento. Sin valores: se crean antes de empezar a medir, así
+    # solo cuentan los nodos, bloques, arreglos y enlaces. Con valores: se crean dentro de la medición y
+    # solo siguen contando los objetos que la estructura se queda (una pila tipada no guarda ninguno).
+    # memoria_bytes() debe dar lo mismo que la primera medición o, con EDL_MEMORIA_VALORES=1, que la segunda.
+    fabrica, tipo = ESTRUCTURAS[nombre]
+    valores = [str(i) for i in range(n)]
+    gc.collect()
+    tracemalloc.start()
+    try:
+        antes = tracemalloc.get_traced_memory()[0]
+        estructura = fabrica()
+        llenar(estructura, tipo, n, random.Random(0), valores)
+        despues = tracemalloc.get_traced_memory()[0]
+        del estructura, valores
+        gc.collect()
+        antes_con_valores = tracemalloc.get_traced_memory()[0]
+        estructura = fabrica()
+        llenar(estructura, tipo, n, random.Random(0), [str(i) for i in range(n)])
+        despues_con_valores = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return {'estructura': nombre, 'n': n, 'bytes_por_elemento': (despues - antes) / n,
+            'bytes_por_elemento_con_valores': (despues_con_valores - antes_con_valores) / n,
+            'memoria_bytes_por_elemento': estructura.bytes_por_elemento()}
+
+def _desviacion(valores):
+    if len(valores) < 2:
+        return 0.0
+    media = sum(valores) / len(valores)
+    return math.sqrt(sum((v - media) ** 2 for v in valores) / (len(valores) - 1))
+
+#-------------------------------Complejidad---------------------------------
+
+MODELOS = {
+    'O(1)': lambda n: 1.0,
+    'O(log n)': lambda n: math.log2(n),
+    'O(n)': lambda n: float(n),
+    'O(n log n)': lambda n: n * math.log2(n),
+}
+CRECIMIENTO_CONSTANTE = 1.5
+
+def ajustar_complejidad(puntos):
+    # Ajusta t = a + b·f(n) para cada modelo minimizando el error relativo (mínimos cuadrados con peso
+    # 1/t², así los tamaños chicos cuentan igual que los grandes) y elige el de menor error. Si el tiempo
+    # crece menos de CRECIMIENTO_CONSTANTE veces entre el menor y el mayor tamaño se considera O(1).
+    # Con menos de tres tamaños no hay forma de distinguir los modelos.
+    puntos = [(n, t) for n, t in puntos if t > 0]
+    if len(puntos) < 3:
+        return None
+    ts = [t for _, t in puntos]
+    if max(ts) < CRECIMIENTO_CONSTANTE * min(ts):
+        media = sum(ts) / len(ts)
+        return {'modelo': 'O(1)', 'error_relativo': sum(((media - t) / t) ** 2 for t in ts), 'a_ns': media, 'b_ns': 0.0}
+    mejor = None
+    for nombre, f in MODELOS.items():
+        if nombre == 'O(1)':
+            continue
+        pesos = [1 / (t * t) for t in ts]
+        xs = [f(n) for n, _ in puntos]
+        sw = sum(pesos)
+        mx = sum(w * x for w, x in zip(pesos, xs)) / sw
+        mt = sum(w * t for w, t in zip(pesos, ts)) / sw
+        varianza = sum(w * (x - mx) ** 2 for w, x in zip(pesos, xs))
+        b = max(0.0, sum(w * (x - mx) * (t - mt) for w, x, t in zip(pesos, xs, ts)) / varianza) if varianza else 0.0
+        a = max(0.0, mt - b * mx)
+        error = sum(((a + b * x - t) / t) ** 2 for x, t in zip(xs, ts))
+        if mejor is None or error < 0.75 * mejor[1]: # El modelo que crece más rápido debe ajustar claramente mejor
+            mejor = (nombre, error, a, b)
+    return {'modelo': mejor[0], 'error_relativo': mejor[1], 'a_ns': mejor[2], 'b_ns': mejor[3]}
+
+#-------------------------------Línea base---------------------------------
+
+def comparar(resultados, linea_base, umbral, piso_ns):
+    # Retorna las filas cuya mediana empeoró más que `umbral` respecto a la línea base. Las medianas por
+    # debajo de `piso_ns` se ignoran: a esa escala el ruido del reloj domina.
+    anteriores = {(r['estructura'], r['carga'], r['n']): r for r in linea_base['resultados']}
+    regresiones = []
+    for r in resultados:
+        anterior = anteriores.get((r['estructura'], r['carga'], r['n']))
+        if anterior is None or max(anterior['p50_ns'], r['p50_ns']) < piso_ns:
+            continue
+        cambio = r['p50_ns'] / anterior['p50_ns'] - 1 if anterior['p50_ns'] else 0.0
+        if cambio > umbral:
+            regresiones.append((r, anterior, cambio))
+    return regresiones
+
+def escribir_csv(ruta, resultados):
+    columnas = list(resultados[0].keys()) if resultados else []
+    with open(ruta, 'w', newline='', encoding='utf-8') as archivo:
+        escritor = csv.DictWriter(archivo, fieldnames=columnas)
+        escritor.writeheader()
+        escritor.writerows(resultados)
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark fuera de línea de todas las estructuras')
+    parser.add_argument('--estructuras', default=','.join(ESTRUCTURAS), help='nombres separados por comas')
+    parser.add_argument('--cargas', default=None, help='cargas separadas por comas (por defecto todas las que aplican)')
+    parser.add_argument('--tamaños', default=','.join(map(str, TAMAÑOS)))
+    parser.add_argument('--repeticiones', type=int, default=5)
+    parser.add_argument('--operaciones', type=int, default=1000, help='operaciones medidas por repetición')
+    parser.add_argument('--presupuesto', type=int, default=2 * 10 ** 6,
+                        help='en cargas lineales se hacen a lo sumo presupuesto/n operaciones (mínimo 20)')
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--json', help='archivo donde guardar los resultados en JSON')
+    parser.add_argument('--csv', help='archivo donde guardar los resultados en CSV')
+    parser.add_argument('--linea-base', help='JSON de una ejecución anterior con la que comparar')
+    parser.add_argument('--umbral', type=float, default=0.25, help='empeoramiento relativo de la mediana que se considera regresión')
+    parser.add_argument('--piso-ns', type=float, default=200, help='medianas menores no se comparan con la línea base')
+    parser.add_argument('--memoria', action='store_true', help='mide también los bytes por elemento de cada estructura (tracemalloc)')
+    args = parser.parse_args()
+
+    tamaños = [int(t) for t in args.tamaños.split(',')]
+    cargas_pedidas = set(args.cargas.split(',')) if args.cargas else None
+    resultados = []
+    for nombre in args.estructuras.split(','):
+        if nombre not in ESTRUCTURAS:
+            parser.error(f"Estructura desconocida '{nombre}'")
+        for carga in CARGAS[ESTRUCTURAS[nombre][1]]:
+            if cargas_pedidas and carga not in cargas_pedidas:
+                continue
+            if carga in METODO_REQUERIDO and not hasattr(ESTRUCTURAS[nombre][0](), METODO_REQUERIDO[carga]):
+                continue
+            for n in tamaños:
+                ops = args.operaciones
+                if carga in CARGAS_LINEALES and not nombre.endswith('-indexada'):
+                    ops = min(ops, max(20, args.presupuesto // n))
+                fila = medir(nombre, carga, n, args.repeticiones, ops, args.semilla)
+                resultados.append(fila)
+                print(f"{nombre:<24} {carga:<17} n={n:<8} p50={fila['p50_ns']:>11.0f} ns  "
+                      f"p90={fila['p90_ns']:>11.0f} ns  p99={fila['p99_ns']:>11.0f} ns", flush=True)
+
+    memoria = []
+    if args.memoria:
+        for nombre in args.estructuras.split(','):
+            for n in tamaños:
+                fila = medir_memoria(nombre, n)
+                memoria.append(fila)
+                print(f"{nombre:<24} memoria           n={n:<8} {fila['bytes_por_elemento']:>8.1f} bytes/elemento"
+                      f" ({fila['bytes_por_elemento_con_valores']:.1f} con los valores,"
+                      f" {fila['memoria_bytes_por_elemento']:.1f} según memoria_bytes)", flush=True)
+
+    complejidad = {}
+    for nombre in dict.fromkeys(r['estructura'] for r in resultados):
+        for carga in dict.fromkeys(r['carga'] for r in resultados if r['estructura'] == nombre):
+            puntos = [(r['n'], r['p50_ns']) for r in resultados if r['estructura'] == nombre and r['carga'] == carga]
+            ajuste = ajustar_complejidad(puntos)
+            if ajuste:
+                complejidad[f'{nombre}/{carga}'] = ajuste
+                print(f"{nombre:<24} {carga:<17} {ajuste['modelo']}")
+
+    salida = {
+        'entorno': {
+            'python': sys.version.split()[0],
+            'plataforma': platform.platform(),
+            'fecha': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'repeticiones': args.repeticiones,
+            'operaciones': args.operaciones,
+        },
+        'resultados': resultados,
+        'complejidad': complejidad,
+        'memoria': memoria,
+    }
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as archivo:
+            json.dump(salida, archivo, indent=2, ensure_ascii=False)
+    if args.csv:
+        escribir_csv(args.csv, resultados)
+
+    if args.linea_base:
+        with open(args.linea_base, encoding='utf-8') as archivo:
+            regresiones = comparar(resultados, json.load(archivo), args.umbral, args.piso_ns)
+        for actual, anterior, cambio in regresiones:
+            print(f"REGRESIÓN {actual['estructura']} {actual['carga']} n={actual['n']}: "
+                  f"p50 {anterior['p50_ns']:.0f} -> {actual['p50_ns']:.0f} ns (+{cambio:.0%})")
+        if regresiones:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
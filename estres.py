@@ -0,0 +1,334 @@
+import os
+import sys
+import json
+import random
+import argparse
+import threading
+import time
+import logging
+from urllib import request as peticiones
+from urllib.parse import urlencode
+from urllib.error import HTTPError
+
+# Prueba de estrés de la aplicación con un servidor WSGI con hilos: muchos hilos atacan todas las
+# rutas a la vez y al final se comprueba que cada estructura sigue siendo consistente (el tamaño
+# coincide con el recorrido, los enlaces dobles y circulares cierran, el montículo está ordenado...).
+#
+#   python estres.py --hilos 16 --peticiones 300
+#
+# Termina con código 1 si alguna petición falla o alguna estructura queda inconsistente.
+
+os.environ.setdefault('EDL_MEDICION', 'tiempo') # Solo el tiempo: la prueba no usa la memoria de cada operación
+os.environ.setdefault('EDL_MEMORIA_VALORES', '1') # Cuenta los valores para revisar también esa contabilidad
+
+import app as aplicacion
+from app import VACIO
+from werkzeug.serving import make_server
+
+VALORES = [str(i) for i in range(40)] # Pocos valores para que se repitan y se choquen las eliminaciones
+
+def _valores(n):
+    return ','.join(random.choice(VALORES) for _ in range(n))
+
+def _rutas_lista(base):
+    return [
+        ('GET', base, None),
+        ('GET', base + '?page=2&size=5', None),
+        ('POST', base + '/insertar', lambda: {'valor': _valores(random.randint(1, 60))}),
+        ('POST', base + '/eliminar', lambda: {'valor': _valores(random.randint(1, 30)),
+                                              'modo': random.choice(['primera', 'todas'])}),
+        ('POST', base + '/buscar', lambda: {'valor': random.choice(VALORES)}),
+    ]
+
+def _rutas_pila(base):
+    return [
+        ('GET', base, None),
+        ('POST', base + '/push', lambda: {'valor': _valores(random.randint(1, 30))}),
+        ('POST', base + '/pop', lambda: {}),
+        ('POST', base + '/peek', lambda: {}),
+    ]
+
+def _busqueda():
+    modo = random.choice(['posiciones', 'contar', 'prefijo'])
+    return {'valor': random.choice(VALORES)[:2] if modo == 'prefijo' else _valores(random.randint(1, 10)), 'modo': modo}
+
+def _lote_api():
+    operaciones = []
+    for _ in range(20):
+        operaciones.append({'op': random.choice(['insertar', 'insertar', 'eliminar', 'buscar']),
+                            'valor': random.choice(VALORES)})
+    return {'operaciones': operaciones}
+
+RUTAS = (
+    [('GET', '/', None)]
+    + _rutas_lista('/lista-simple')
+    + _rutas_lista('/lista-doble')
+    + [('POST', '/lista-doble/insertar-en', lambda: {'posicion': random.randint(0, 200), 'valor': random.choice(VALORES)}),
+       ('POST', '/lista-doble/eliminar-en', lambda: {'posicion': random.randint(0, 200)})]
+    + _rutas_lista('/lista-circular')
+    + [('POST', '/lista-circular/avanzar', lambda: {'k': random.randint(0, 50)}),
+       ('POST', '/lista-circular/rotar', lambda: {}),
+       ('POST', '/lista-circular/insertar-despues', lambda: {'valor': random.choice(VALORES)}),
+       ('POST', '/lista-circular/eliminar-cursor', lambda: {}),
+       ('POST', '/lista-circular/eliminar-cada-k', lambda: {'k': random.randint(1, 7), 'cantidad': random.choice(['', random.randint(0, 10)])})]
+    + _rutas_lista('/lista-ordenada')
+    + [('POST', '/lista-ordenada/rango', lambda: dict(zip(('minimo', 'maximo'), sorted(random.sample(range(40), 2)))))]
+    + _rutas_pila('/pila-lista')
+    + _rutas_pila('/pila-arreglo')
+    + [('POST', '/pila-arreglo/pop', lambda: {'cantidad': random.randint(1, 20)}),
+       ('JSON', '/api/pila-arreglo/pop_varios', lambda: {'k': random.randint(1, 40)})]
+    + [
+        ('POST', '/pila-arreglo/buscar', _busqueda),
+        ('POST', '/cola-simple/buscar', _busqueda),
+        ('POST', '/cola-circular/buscar', _busqueda),
+        ('GET', '/cola-simple', None),
+        ('POST', '/cola-simple/encolar', lambda: {'valor': _valores(random.randint(1, 30))}),
+        ('POST', '/cola-simple/desencolar', lambda: {}),
+        ('POST', '/cola-simple/peek', lambda: {}),
+        ('GET', '/cola-circular', None),
+        ('POST', '/cola-circular/encolar', lambda: {'valor': _valores(random.randint(1, 30))}),
+        ('POST', '/cola-circular/desencolar', lambda: {}),
+        ('POST', '/cola-circular/configuracion', lambda: {'capacidad': random.randint(5, 40),
+                                                          'modo': random.choice(['fija', 'elastica']),
+                                                          'factor': '2'}),
+        ('GET', '/cola-prioridad', None),
+        ('POST', '/cola-prioridad/encolar', lambda: {'valor': _valores(random.randint(1, 3)),
+                                                     'prioridad': random.randint(0, 9)}),
+        ('POST', '/cola-prioridad/desencolar', lambda: {}),
+        ('POST', '/cola-prioridad/peek', lambda: {}),
+        ('POST', '/cola-prioridad/cambiar-prioridad', lambda: {'valor': random.choice(VALORES),
+                                                               'prioridad': random.randint(0, 9)}),
+        ('POST', '/cola-prioridad/eliminar', lambda: {'valor': random.choice(VALORES)}),
+        ('GET', '/api/lista-simple?datos=1', None),
+        ('GET', '/memoria', None),
+        ('JSON', '/api/lista-doble/lote', _lote_api),
+        ('JSON', '/api/cola-simple/encolar_varios', lambda: {'valores': VALORES[:random.randint(1, 40)]}),
+        ('JSON', '/api/cola-simple/desencolar_varios', lambda: {'k': random.randint(1, 40)}),
+    ]
+)
+
+#-------------------------------Invariantes---------------------------------
+
+def _recorrer(inicio, siguiente, fin, limite):
+    # Nodos desde `inicio` hasta `fin` (exclusivo); se corta en `limite` para no colgarse con un ciclo roto
+    nodos = []
+    actual = inicio
+    while actual != fin and len(nodos) <= limite:
+        nodos.append(actual)
+        actual = siguiente(actual)
+    return nodos
+
+def _revisar_enlazada(nombre, e, errores):
+    pool = getattr(e, 'pool', None)
+    nulo = VACIO if pool is not None else None
+    if pool is not None:
+        siguiente = lambda i: pool.siguiente[i]
+        anterior = (lambda i: pool.anterior[i]) if pool.anterior is not None else None
+    else:
+        siguiente = lambda nodo: nodo.siguiente
+        anterior = lambda nodo: nodo.anterior
+    cabeza = e.tope if hasattr(e, 'tope') else e.cabeza
+    circular = isinstance(e, (aplicacion.ListaCircular, aplicacion.ListaCircularPool))
+
+    if circular:
+        if e.tamaño == 0:
+            if cabeza is not nulo and cabeza != nulo:
+                errores.append(f'{nombre}: vacía pero con cabeza')
+            return
+        nodos = [cabeza] + _recorrer(siguiente(cabeza), siguiente, cabeza, e.tamaño)
+        if len(nodos) != e.tamaño:
+            errores.append(f'{nombre}: tamaño {e.tamaño} pero el ciclo tiene {len(nodos)} nodos')
+        if nodos[-1] is not e.ultimo and nodos[-1] != e.ultimo:
+            errores.append(f'{nombre}: ultimo no es el nodo anterior a la cabeza')
+        if e.cursor not in nodos:
+            errores.append(f'{nombre}: el cursor no está en el ciclo')
+        elif siguiente(e.previo_cursor) is not e.cursor and siguiente(e.previo_cursor) != e.cursor:
+            errores.append(f'{nombre}: previo_cursor no es el predecesor del cursor')
+    else:
+        nodos = _recorrer(cabeza, siguiente, nulo, e.tamaño)
+        if len(nodos) != e.tamaño:
+            errores.append(f'{nombre}: tamaño {e.tamaño} pero el recorrido tiene {len(nodos)} nodos')
+        if hasattr(e, 'ultimo') and nodos and nodos[-1] is not e.ultimo and nodos[-1] != e.ultimo:
+            errores.append(f'{nombre}: ultimo no apunta al último nodo')
+        if isinstance(e, (aplicacion.ListaEnlazadaDoble, aplicacion.ListaEnlazadaDoblePool)):
+            atras = _recorrer(e.ultimo, anterior, nulo, e.tamaño)
+            if atras != nodos[::-1]:
+                errores.append(f'{nombre}: los enlaces anteriores no coinciden con los siguientes')
+
+    indice = getattr(e, 'indice', None)
+    if indice is not None:
+        indexados = sum(len(indice.apariciones(dato)) for dato in indice.nodos)
+        if indexados != e.tamaño:
+            errores.append(f'{nombre}: el índice tiene {indexados} nodos y la lista {e.tamaño}')
+
+def _revisar_desenrollada(e, errores):
+    bloques = _recorrer(e.cabeza, lambda b: b.siguiente, None, e.tamaño)
+    if any(not b.datos or len(b.datos) > e.capacidad for b in bloques):
+        errores.append('lista-doble: un bloque está vacío o pasa de la capacidad')
+    if sum(len(b.datos) for b in bloques) != e.tamaño:
+        errores.append(f'lista-doble: tamaño {e.tamaño} pero los bloques suman otra cantidad')
+    if _recorrer(e.ultimo, lambda b: b.anterior, None, e.tamaño) != bloques[::-1]:
+        errores.append('lista-doble: los enlaces anteriores no coinciden con los siguientes')
+
+def _revisar_ordenada(e, errores):
+    # El nivel 0 recorre todo en orden y los anchos de cada nivel coinciden con las posiciones reales
+    posiciones = {}
+    claves = []
+    for posicion, nodo in enumerate(_recorrer(e.cabeza.siguientes[0], lambda n: n.siguientes[0], None, e.tamaño), 1):
+        posiciones[id(nodo)] = posicion
+        claves.append(nodo.clave)
+    if len(claves) != e.tamaño:
+        errores.append(f'lista-ordenada: tamaño {e.tamaño} pero el recorrido tiene {len(claves)} nodos')
+        return
+    if claves != sorted(claves):
+        errores.append('lista-ordenada: los elementos no están ordenados')
+    for nivel in range(e.niveles):
+        nodo, posicion = e.cabeza, 0
+        while True:
+            siguiente = nodo.siguientes[nivel]
+            destino = posiciones.get(id(siguiente), 0) if siguiente is not None else e.tamaño + 1
+            if nodo.anchos[nivel] != destino - posicion:
+                errores.append(f'lista-ordenada: ancho incorrecto en el nivel {nivel}')
+                return
+            if siguiente is None:
+                break
+            nodo, posicion = siguiente, destino
+
+def _revisar_cola_circular(e, errores):
+    items = getattr(e, 'items', None) # La cola en memoria compartida no tiene lista de Python
+    if not 0 <= e.tamaño <= e.capacidad or (items is not None and len(items) != e.capacidad):
+        errores.append(f'cola-circular: tamaño {e.tamaño} fuera de la capacidad {e.capacidad}')
+    elif (e.frente + e.tamaño) % e.capacidad != e.final:
+        errores.append('cola-circular: frente + tamaño no coincide con final')
+    elif len(e.obtener_cola()) != e.tamaño:
+        errores.append('cola-circular: el recorrido no coincide con el tamaño')
+
+def _revisar_cola_prioridad(e, errores):
+    heap = e.heap
+    if len(heap) != e.tamaño:
+        errores.append(f'cola-prioridad: tamaño {e.tamaño} pero el montículo tiene {len(heap)}')
+    for i, entrada in enumerate(heap):
+        if entrada.posicion != i:
+            errores.append(f'cola-prioridad: la entrada en {i} cree estar en {entrada.posicion}')
+            break
+        if i and e._menor(entrada, heap[(i - 1) // 2]):
+            errores.append(f'cola-prioridad: el montículo no está ordenado en la posición {i}')
+            break
+    if sum(len(aplicacion.todas_las_apariciones(e.entradas, valor)) for valor in e.entradas) != e.tamaño:
+        errores.append('cola-prioridad: el mapa de entradas no coincide con el tamaño')
+
+def _revisar_espejo(nombre, e, errores):
+    # Si hubo búsquedas, la columna de códigos debe coincidir con items en todas las ranuras ocupadas
+    espejo = getattr(e, 'espejo', None)
+    if espejo is None:
+        return
+    for inicio, fin in e._tramos():
+        if [espejo.valores[c] for c in espejo.columna[inicio:fin].tolist()] != e.items[inicio:fin]:
+            errores.append(f'{nombre}: el espejo columnar no coincide con los elementos')
+            return
+
+def _revisar_memoria(nombre, e, errores):
+    # Con EDL_MEMORIA_VALORES=1, los bytes de los valores llevados al día en cada operación coinciden
+    # con contarlos de nuevo
+    contados = getattr(getattr(e, 'pool', e), 'contados', None)
+    if not isinstance(contados, aplicacion.ContadorValores):
+        return # Sin contar valores, o la pila tipada y la cola en memoria compartida, que no guardan objetos
+    estado = e.exportar_estado()
+    if 'datos' in estado:
+        valores = estado['datos']
+    else: # Cola de prioridad: (prioridad, secuencia, valor); la secuencia es parte de la estructura
+        valores = [dato for prioridad, _, valor in estado['entradas'] for dato in (prioridad, valor)]
+    distintos = {id(valor): valor for valor in valores}
+    if contados.bytes != sum(sys.getsizeof(valor) for valor in distintos.values()):
+        errores.append(f'{nombre}: la memoria contada de los valores no coincide con los valores guardados')
+
+def revisar():
+    errores = []
+    _revisar_enlazada('lista-simple', aplicacion.lista, errores)
+    if isinstance(aplicacion.lista_doble, aplicacion.ListaDobleDesenrollada):
+        _revisar_desenrollada(aplicacion.lista_doble, errores)
+    else:
+        _revisar_enlazada('lista-doble', aplicacion.lista_doble, errores)
+    _revisar_enlazada('lista-circular', aplicacion.lista_circular, errores)
+    _revisar_ordenada(aplicacion.lista_ordenada, errores)
+    _revisar_enlazada('pila-lista', aplicacion.pila_lista, errores)
+    pila = aplicacion.pila_arreglo
+    if isinstance(pila, aplicacion.PilaArregloTipada):
+        if not pila.tamaño <= len(pila.items) or len(pila.items) < aplicacion.CAPACIDAD_MINIMA_PILA:
+            errores.append('pila-arreglo: la capacidad del array no alcanza para el tamaño')
+    elif len(pila.items) != pila.tamaño:
+        errores.append('pila-arreglo: tamaño distinto del arreglo')
+    cola = aplicacion.cola_simple
+    if len(cola.items) - cola.frente != cola.tamaño:
+        errores.append('cola-simple: tamaño distinto de los elementos tras el frente')
+    _revisar_cola_circular(aplicacion.cola_circular, errores)
+    for nombre, estructura in (('pila-arreglo', pila), ('cola-simple', cola), ('cola-circular', aplicacion.cola_circular)):
+        _revisar_espejo(nombre, estructura, errores)
+    _revisar_cola_prioridad(aplicacion.cola_prioridad, errores)
+    for nombre, (estructura, _, _) in aplicacion.ESTRUCTURAS.items():
+        _revisar_memoria(nombre, estructura, errores)
+    return errores
+
+#-------------------------------Carga---------------------------------
+
+def _trabajador(url, peticiones_por_hilo, semilla, fallos, contador):
+    azar = random.Random(semilla)
+    for _ in range(peticiones_por_hilo):
+        metodo, ruta, cuerpo = azar.choice(RUTAS)
+        if metodo == 'GET':
+            req = peticiones.Request(url + ruta)
+        elif metodo == 'JSON':
+            req = peticiones.Request(url + ruta, data=json.dumps(cuerpo()).encode(),
+                                     headers={'Content-Type': 'application/json'})
+        else:
+            req = peticiones.Request(url + ruta, data=urlencode(cuerpo()).encode())
+        try:
+            with peticiones.urlopen(req, timeout=60) as respuesta:
+                respuesta.read()
+        except HTTPError as error:
+            fallos.append(f'{metodo} {ruta}: {error.code}')
+        except OSError as error:
+            fallos.append(f'{metodo} {ruta}: {error}')
+        contador[0] += 1
+
+def main():
+    parser = argparse.ArgumentParser(description='Prueba de estrés concurrente de las rutas de la aplicación')
+    parser.add_argument('--hilos', type=int, default=16)
+    parser.add_argument('--peticiones', type=int, default=300, help='peticiones por hilo')
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--intervalo', type=float, default=1e-6,
+                        help='intervalo de cambio de hilo del intérprete; muy corto provoca más intercalados')
+    args = parser.parse_args()
+
+    sys.setswitchinterval(args.intervalo)
+    logging.getLogger('werkzeug').setLevel(logging.ERROR) # Sin una línea de log por petición
+
+    servidor = make_server('127.0.0.1', 0, aplicacion.app, threaded=True)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{servidor.server_port}'
+
+    fallos = []
+    contador = [0]
+    inicio = time.perf_counter()
+    hilos = [threading.Thread(target=_trabajador, args=(url, args.peticiones, args.semilla + i, fallos, contador))
+             for i in range(args.hilos)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    duracion = time.perf_counter() - inicio
+    servidor.shutdown()
+
+    errores = revisar()
+    print(f'{contador[0]} peticiones en {duracion:.2f} s ({contador[0] / duracion:.0f}/s) con {args.hilos} hilos')
+    for fallo in fallos[:20]:
+        print('  fallo:', fallo)
+    for error in errores:
+        print('  inconsistencia:', error)
+    if fallos or errores:
+        print(f'{len(fallos)} peticiones fallidas, {len(errores)} inconsistencias')
+        sys.exit(1)
+    print('Todas las estructuras son consistentes')
+
+if __name__ == '__main__':
+    main()
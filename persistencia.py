@@ -0,0 +1,299 @@
+import os
+import time
+import zlib
+import fcntl
+import struct
+import marshal
+import threading
+
+# Registro de operaciones (write-ahead log) e instantáneas para las estructuras globales de app.py.
+#
+# Cada operación que modifica una estructura se anota como un registro binario:
+#     <longitud:uint32> <crc32:uint32> <lsn:uint64> <marshal((estructura, operacion, argumentos))>
+# Los registros se acumulan en memoria y un hilo escritor los escribe y hace un solo fsync por grupo
+# (group commit). Cada cierto número de registros se guarda una instantánea compacta de todas las
+# estructuras; al arrancar se carga la última instantánea y solo se reproduce la cola del registro.
+#
+# La instantánea no detiene las operaciones: corta el registro en un lsn y copia cada estructura con su
+# propio cerrojo de lectura, anotando el lsn de la última operación que contiene esa copia. Al recuperar,
+# cada registro se reproduce solo en la estructura cuya copia todavía no lo incluye.
+
+CABECERA = struct.Struct('<IIQ')
+ARCHIVO_INSTANTANEA = 'instantanea.bin'
+TROZO_INSTANTANEA = 20000 # Elementos por trozo: marshal no suelta el GIL y un trozo lo retiene ~1 ms
+
+
+def _segmento(directorio, primer_lsn):
+    # Cada segmento del registro se nombra con el primer lsn que puede contener
+    return os.path.join(directorio, f'wal-{primer_lsn:020d}.log')
+
+
+def _segmentos(directorio):
+    nombres = sorted(n for n in os.listdir(directorio) if n.startswith('wal-') and n.endswith('.log'))
+    return [(int(n[4:-4]), os.path.join(directorio, n)) for n in nombres]
+
+
+def _fsync_directorio(directorio):
+    fd = os.open(directorio, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def escribir_instantanea(archivo, lsn, lsns, estados):
+    # La instantánea es una secuencia de objetos marshal: la cabecera y, por estructura, su estado sin
+    # las listas largas seguido de esas listas en trozos. Codificarla de una vez detendría todos los
+    # hilos del proceso mientras dura.
+    marshal.dump({'lsn': lsn, 'lsns': lsns, 'estructuras': len(estados)}, archivo)
+    for nombre, estado in estados.items():
+        largas = {clave: valor for clave, valor in estado.items()
+                  if isinstance(valor, list) and len(valor) > TROZO_INSTANTANEA}
+        resto = {clave: valor for clave, valor in estado.items() if clave not in largas}
+        marshal.dump((nombre, resto, {clave: len(valor) for clave, valor in largas.items()}), archivo)
+        for valor in largas.values():
+            for inicio in range(0, len(valor), TROZO_INSTANTANEA):
+                marshal.dump(valor[inicio:inicio + TROZO_INSTANTANEA], archivo)
+
+
+def leer_instantanea(archivo):
+    # Devuelve (lsn, lsns, estados)
+    cabecera = marshal.load(archivo)
+    if 'estados' in cabecera:
+        return cabecera['lsn'], {}, cabecera['estados'] # Formato antiguo: un solo objeto y sin lsn por estructura
+    estados = {}
+    for _ in range(cabecera['estructuras']):
+        nombre, estado, largas = marshal.load(archivo)
+        for clave, longitud in largas.items():
+            valor = []
+            while len(valor) < longitud:
+                valor.extend(marshal.load(archivo))
+            estado[clave] = valor
+        estados[nombre] = estado
+    return cabecera['lsn'], cabecera['lsns'], estados
+
+
+def leer_registros(ruta):
+    # Generador de (lsn, estructura, operacion, argumentos). Se detiene en el primer registro
+    # incompleto o corrupto (una escritura cortada por una caída) y devuelve cuántos bytes son válidos.
+    with open(ruta, 'rb') as archivo:
+        datos = archivo.read()
+    posicion = 0
+    while posicion + CABECERA.size <= len(datos):
+        longitud, crc, lsn = CABECERA.unpack_from(datos, posicion)
+        inicio = posicion + CABECERA.size
+        carga = datos[inicio:inicio + longitud]
+        if len(carga) < longitud or zlib.crc32(carga) != crc:
+            break
+        estructura, operacion, argumentos = marshal.loads(carga)
+        yield lsn, estructura, operacion, argumentos
+        posicion = inicio + longitud
+    return posicion
+
+
+class RegistroOperaciones:
+    def __init__(self, directorio, intervalo=0.005, sincrono=False, instantanea_cada=10000, en_fondo=False):
+        self.directorio = directorio
+        self.intervalo = intervalo # Tiempo máximo que un registro espera en memoria antes del fsync
+        self.sincrono = sincrono # Si es True, cada operación espera a que su registro esté en disco
+        self.instantanea_cada = instantanea_cada # Registros entre instantáneas (0 las desactiva)
+        self.en_fondo = en_fondo # Si es True, la instantánea se codifica y escribe en un hilo aparte
+        self.estructuras = {}
+        self.copiar = None # copiar(estructura) -> (lsn, estado), con el cerrojo de lectura de la estructura
+
+        self.cerrojo_buffer = threading.Lock()
+        self.cerrojo_archivo = threading.Lock() # Solo lo toman el hilo escritor y la instantánea
+        self.cerrojo_instantanea = threading.Lock() # Una instantánea a la vez
+        self.escrito = threading.Condition(self.cerrojo_buffer)
+        self.pendientes = []
+        self.lsn = 0
+        self.lsn_durable = 0
+        self.lsn_instantanea = 0
+        self.archivo = None
+        self.activo = False
+        self.despertar_instantanea = threading.Event()
+
+        self.estadisticas = {
+            'registros': 0,
+            'bytes': 0,
+            'fsyncs': 0,
+            'tiempo_anotar': 0.0, # Tiempo dentro de las peticiones (codificar y encolar el registro)
+            'tiempo_escritura': 0.0, # Tiempo del hilo escritor en write + fsync
+            'instantaneas': 0,
+            'tiempo_copia_instantanea': 0.0, # Tiempo copiando las estructuras, cada una con su cerrojo de lectura
+            'tiempo_instantanea': 0.0, # Tiempo total de codificar y escribir instantáneas
+            'tiempo_recuperacion': 0.0,
+            'registros_reproducidos': 0,
+        }
+
+        os.makedirs(directorio, exist_ok=True)
+        # Un solo proceso puede escribir en el directorio a la vez
+        self.bloqueo = open(os.path.join(directorio, 'bloqueo'), 'w')
+        try:
+            fcntl.flock(self.bloqueo, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            raise RuntimeError(f"Otro proceso ya usa el registro de operaciones en '{directorio}'")
+
+    # ------------------------------- Recuperación -------------------------------
+
+    def recuperar(self, estructuras, aplicar, copiar):
+        # Carga la última instantánea y reproduce los registros posteriores. `aplicar(estructura, operacion,
+        # argumentos)` ejecuta la operación sin volver a anotarla; `copiar(estructura)` devuelve el estado
+        # de la estructura junto con el lsn de la última operación que incluye.
+        inicio = time.perf_counter()
+        self.estructuras = estructuras
+        self.copiar = copiar
+        lsns = {}
+        ruta = os.path.join(self.directorio, ARCHIVO_INSTANTANEA)
+        if os.path.exists(ruta):
+            with open(ruta, 'rb') as archivo:
+                self.lsn_instantanea, lsns, estados = leer_instantanea(archivo)
+            for nombre, estado in estados.items():
+                if nombre in estructuras:
+                    estructuras[nombre].restaurar_estado(estado)
+        self.lsn = self.lsn_instantanea
+
+        reproducidos = 0
+        for _, ruta_segmento in _segmentos(self.directorio):
+            registros = leer_registros(ruta_segmento)
+            while True:
+                try:
+                    lsn, nombre, operacion, argumentos = next(registros)
+                except StopIteration as fin:
+                    validos = fin.value
+                    break
+                self.lsn = max(self.lsn, lsn)
+                if lsn <= self.lsn_instantanea or lsn <= lsns.get(nombre, 0):
+                    continue # Ya incluido en la copia de esa estructura
+                aplicar(estructuras[nombre], operacion, argumentos)
+                reproducidos += 1
+            if validos < os.path.getsize(ruta_segmento):
+                os.truncate(ruta_segmento, validos) # Descarta la cola cortada por una caída
+
+        self.lsn_durable = self.lsn
+        self.estadisticas['registros_reproducidos'] = reproducidos
+        self.estadisticas['tiempo_recuperacion'] = time.perf_counter() - inicio
+        self._abrir_segmento(self.lsn + 1)
+        self.activo = True
+        threading.Thread(target=self._escritor, name='wal-escritor', daemon=True).start()
+        if self.en_fondo:
+            threading.Thread(target=self._hilo_instantaneas, name='wal-instantaneas', daemon=True).start()
+
+    def _abrir_segmento(self, primer_lsn):
+        self.archivo = open(_segmento(self.directorio, primer_lsn), 'ab')
+        _fsync_directorio(self.directorio)
+
+    # ------------------------------- Escritura -------------------------------
+
+    def anotar(self, estructura, operacion, argumentos):
+        # Se llama con el cerrojo de escritura de la estructura tomado, justo después de aplicar la operación
+        inicio = time.perf_counter()
+        carga = marshal.dumps((estructura, operacion, argumentos))
+        with self.cerrojo_buffer:
+            self.lsn += 1
+            lsn = self.lsn
+            self.pendientes.append(CABECERA.pack(len(carga), zlib.crc32(carga), lsn) + carga)
+        self.estadisticas['tiempo_anotar'] += time.perf_counter() - inicio
+        return lsn
+
+    def revisar(self, lsn):
+        # Se llama ya sin el cerrojo de la estructura: la instantánea tiene que poder leerlas todas
+        if self.instantanea_cada and lsn - self.lsn_instantanea >= self.instantanea_cada:
+            if self.en_fondo:
+                self.despertar_instantanea.set()
+            elif self.cerrojo_instantanea.acquire(blocking=False): # Si ya hay una en curso, basta con esa
+                try:
+                    self._instantanea()
+                finally:
+                    self.cerrojo_instantanea.release()
+
+    def esperar(self, lsn):
+        # Bloquea hasta que el registro `lsn` esté en disco (modo síncrono)
+        with self.escrito:
+            while self.lsn_durable < lsn:
+                self.escrito.wait()
+
+    def _vaciar(self):
+        # Escribe lo pendiente y hace un único fsync para todo el grupo. Requiere cerrojo_archivo.
+        # Devuelve el último lsn escrito.
+        with self.cerrojo_buffer:
+            pendientes, self.pendientes = self.pendientes, []
+            lsn = self.lsn
+        if not pendientes:
+            return lsn
+        inicio = time.perf_counter()
+        datos = b''.join(pendientes)
+        self.archivo.write(datos)
+        self.archivo.flush()
+        os.fsync(self.archivo.fileno())
+        self.estadisticas['tiempo_escritura'] += time.perf_counter() - inicio
+        self.estadisticas['registros'] += len(pendientes)
+        self.estadisticas['bytes'] += len(datos)
+        self.estadisticas['fsyncs'] += 1
+        with self.escrito:
+            self.lsn_durable = max(self.lsn_durable, lsn)
+            self.escrito.notify_all()
+        return lsn
+
+    def _escritor(self):
+        while self.activo:
+            time.sleep(self.intervalo)
+            with self.cerrojo_archivo:
+                self._vaciar()
+
+    def cerrar(self):
+        self.activo = False
+        with self.cerrojo_archivo:
+            self._vaciar()
+            self.archivo.close()
+
+    # ------------------------------- Instantáneas -------------------------------
+
+    def instantanea(self):
+        with self.cerrojo_instantanea:
+            self._instantanea()
+
+    def _instantanea(self):
+        # Ninguna operación espera a la instantánea entera. El corte solo toma cerrojo_archivo, que las
+        # peticiones no usan; cada estructura se copia con su cerrojo de lectura, así que solo las
+        # escrituras sobre la estructura que se está copiando esperan a esa copia. En modo en_fondo
+        # esto corre en su propio hilo.
+        inicio = time.perf_counter()
+        if self.lsn == self.lsn_instantanea:
+            return
+        with self.cerrojo_archivo:
+            # Todo registro hasta `corte` queda en los segmentos viejos y los siguientes van a uno nuevo,
+            # para poder borrar los anteriores. El fsync de lo pendiente va aquí para que el hilo escritor
+            # no marque como durable un lsn posterior antes que estos.
+            corte = self._vaciar()
+            self.archivo.close()
+            self._abrir_segmento(corte + 1)
+        self.lsn_instantanea = corte
+
+        # Cada operación hasta `corte` ya está aplicada en su estructura (se anota antes de soltar su
+        # cerrojo), así que cada copia incluye al menos hasta `corte` y quizá alguna posterior
+        copia = time.perf_counter()
+        estados, lsns = {}, {}
+        for nombre, estructura in self.estructuras.items():
+            lsns[nombre], estados[nombre] = self.copiar(estructura)
+        self.estadisticas['tiempo_copia_instantanea'] += time.perf_counter() - copia
+
+        ruta = os.path.join(self.directorio, ARCHIVO_INSTANTANEA)
+        temporal = ruta + '.tmp'
+        with open(temporal, 'wb') as archivo:
+            escribir_instantanea(archivo, corte, lsns, estados)
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(temporal, ruta) # Reemplazo atómico: una caída deja la instantánea anterior o la nueva
+        _fsync_directorio(self.directorio)
+        for primer_lsn, ruta_segmento in _segmentos(self.directorio):
+            if primer_lsn <= corte:
+                os.remove(ruta_segmento) # Todo su contenido ya está en la instantánea
+        self.estadisticas['instantaneas'] += 1
+        self.estadisticas['tiempo_instantanea'] += time.perf_counter() - inicio
+
+    def _hilo_instantaneas(self):
+        while self.activo:
+            self.despertar_instantanea.wait()
+            self.despertar_instantanea.clear()
+            self.instantanea()
@@ -0,0 +1,103 @@
+// ================================
+// MÓDULO: LoteStream
+// ================================
+// Envía un lote grande (texto pegado o archivo) a una ruta /stream y muestra los eventos SSE de progreso.
+// Se usa fetch en lugar de EventSource porque EventSource solo hace peticiones GET sin cuerpo.
+class LoteStream {
+    constructor(form) {
+        this.form = form;
+        this.salida = form.querySelector('.stream-progreso');
+        this.botonCancelar = form.querySelector('.stream-cancelar');
+        this.id = null;
+        this.abortar = null;
+        form.addEventListener('submit', (e) => {
+            e.preventDefault();
+            this.enviar();
+        });
+        this.botonCancelar.addEventListener('click', () => this.cancelar());
+    }
+
+    url() {
+        // Los campos con data-param (por ejemplo la prioridad) viajan en la URL; el cuerpo son solo los valores
+        const params = new URLSearchParams();
+        this.form.querySelectorAll('[data-param]').forEach((campo) => params.set(campo.name, campo.value));
+        const consulta = params.toString();
+        return this.form.dataset.url + (consulta ? '?' + consulta : '');
+    }
+
+    async enviar() {
+        const archivo = this.form.querySelector('input[type="file"]');
+        const cuerpo = archivo && archivo.files.length ? archivo.files[0] : this.form.querySelector('textarea').value;
+        this.abortar = new AbortController();
+        this.botonCancelar.disabled = false;
+        this.salida.textContent = 'Enviando…';
+        try {
+            const respuesta = await fetch(this.url(), {
+                method: 'POST',
+                headers: {'Content-Type': 'text/plain; charset=utf-8'},
+                body: cuerpo,
+                signal: this.abortar.signal,
+            });
+            if (!respuesta.ok) {
+                const error = await respuesta.json().catch(() => ({}));
+                this.salida.textContent = error.error || `Error ${respuesta.status}`;
+                return;
+            }
+            await this.leer(respuesta.body.getReader());
+        } catch (e) {
+            if (e.name !== 'AbortError') this.salida.textContent = `Error: ${e.message}`;
+        } finally {
+            this.botonCancelar.disabled = true;
+            this.id = null;
+        }
+    }
+
+    async leer(lector) {
+        const decodificador = new TextDecoder();
+        let pendiente = '';
+        while (true) {
+            const {value, done} = await lector.read();
+            if (done) break;
+            pendiente += decodificador.decode(value, {stream: true});
+            const eventos = pendiente.split('\n\n');
+            pendiente = eventos.pop(); // El último puede estar incompleto
+            eventos.forEach((texto) => this.evento(texto));
+        }
+    }
+
+    evento(texto) {
+        let nombre = 'message';
+        let datos = '';
+        texto.split('\n').forEach((linea) => {
+            if (linea.startsWith('event: ')) nombre = linea.slice(7);
+            else if (linea.startsWith('data: ')) datos += linea.slice(6);
+        });
+        const d = JSON.parse(datos);
+        if (nombre === 'inicio') {
+            this.id = d.id;
+        } else if (nombre === 'progreso') {
+            const porcentaje = d.bytes_totales ? ` (${Math.round(100 * d.bytes_leidos / d.bytes_totales)}%)` : '';
+            this.salida.textContent = `${d.procesados.toLocaleString()} valores en ${d.bloques} bloques${porcentaje}` +
+                ` · ${Math.round(d.por_segundo).toLocaleString()} valores/s · tamaño ${d.tamaño.toLocaleString()}`;
+        } else if (nombre === 'resumen') {
+            this.salida.textContent = `${d.cancelado ? 'Cancelado' : 'Completo'}: ${d.procesados.toLocaleString()} valores` +
+                ` en ${d.segundos.toFixed(3)} s (operaciones ${d.tiempo_operaciones.toFixed(7)} s,` +
+                ` ${d.memoria.toFixed(6)} MB) · tamaño ${d.tamaño.toLocaleString()}`;
+            setTimeout(() => window.location.assign(this.form.dataset.vista), 1500); // Recarga la tabla
+        }
+    }
+
+    async cancelar() {
+        this.botonCancelar.disabled = true;
+        if (this.id) {
+            // El servidor termina el bloque en curso y envía el resumen con lo que quedó aplicado
+            await fetch(`/stream/${this.id}/cancelar`, {method: 'POST'}).catch(() => this.abortar.abort());
+        } else if (this.abortar) {
+            this.abortar.abort();
+        }
+    }
+}
+
+document.addEventListener('DOMContentLoaded', () => {
+    document.querySelectorAll('form.stream-form').forEach((form) => new LoteStream(form));
+});